@@ -52,6 +52,7 @@ import {
 import {
   BackMsg,
   CustomThemeConfig,
+  DataSet,
   Delta,
   ForwardMsg,
   ForwardMsgMetadata,
@@ -74,6 +75,7 @@ import { MetricsManager } from "src/lib/MetricsManager"
 import { FileUploadClient } from "src/lib/FileUploadClient"
 import { logError, logMessage } from "src/lib/log"
 import { ReportRoot } from "src/lib/ReportNode"
+import { DataSetCache } from "src/lib/DataSetCache"
 
 import { UserSettings } from "src/components/core/StreamlitDialog/UserSettings"
 import { ComponentRegistry } from "src/components/widgets/CustomComponent"
@@ -167,6 +169,8 @@ export class App extends PureComponent<Props, State> {
 
   private readonly componentRegistry: ComponentRegistry
 
+  private readonly dataSetCache: DataSetCache
+
   static contextType = PageLayoutContext
 
   constructor(props: Props) {
@@ -228,6 +232,8 @@ export class App extends PureComponent<Props, State> {
         : undefined
     })
 
+    this.dataSetCache = new DataSetCache()
+
     this.pendingElementsTimerRunning = false
     this.pendingElementsBuffer = this.state.elements
 
@@ -378,6 +384,7 @@ export class App extends PureComponent<Props, State> {
           this.handleSessionStateChanged(msg),
         sessionEvent: (evtMsg: SessionEvent) =>
           this.handleSessionEvent(evtMsg),
+        dataSet: (dataSet: DataSet) => this.dataSetCache.add(dataSet),
         delta: (deltaMsg: Delta) =>
           this.handleDeltaMsg(
             deltaMsg,
@@ -731,6 +738,10 @@ export class App extends PureComponent<Props, State> {
           SessionInfo.current.maxCachedMessageAge
         )
       }
+
+      // Drop the DataSets of earlier runs. The server sends them again in
+      // the runs that use them.
+      this.dataSetCache.incrementRunCount()
     }
   }
 
@@ -796,6 +807,7 @@ export class App extends PureComponent<Props, State> {
     deltaMsg: Delta,
     metadataMsg: ForwardMsgMetadata
   ): void => {
+    this.dataSetCache.resolveDataSets(deltaMsg)
     this.pendingElementsBuffer = this.pendingElementsBuffer.applyDelta(
       this.state.reportId,
       deltaMsg,
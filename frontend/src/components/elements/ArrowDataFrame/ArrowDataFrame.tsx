@@ -19,6 +19,7 @@ import React, { ReactElement, useEffect, useState } from "react"
 import { MultiGrid } from "react-virtualized"
 
 import withFullScreenWrapper from "src/hocs/withFullScreenWrapper"
+import { logError } from "src/lib/log"
 import { DataType, Quiver } from "src/lib/Quiver"
 import { SortDirection } from "./SortDirection"
 import DataFrameCell from "./DataFrameCell"
@@ -26,6 +27,7 @@ import {
   CellContentsGetter,
   CellRenderer,
   CellRendererInput,
+  fetchDataFramePage,
   getCellContentsGetter,
   getDimensions,
 } from "./DataFrameUtil"
@@ -66,6 +68,12 @@ export function ArrowDataFrame({
   /** Sort direction for table sorting. */
   const [sortDirection, setSortDirection] = useState(SortDirection.ASCENDING)
 
+  /**
+   * Pages of a paged DataFrame that are being fetched, as
+   * `${tableId}:${page}` strings.
+   */
+  const pendingPagesRef = React.useRef(new Set<string>())
+
   // Calculate the dimensions of this array.
   const nCols = element.data.length > 0 ? element.data[0].length : 0
   const {
@@ -112,8 +120,10 @@ export function ArrowDataFrame({
         rowIndex
       )
 
+      // Paged DataFrames can't be sorted, since most of their rows
+      // haven't been fetched.
       const headerClickedCallback =
-        rowIndex === 0 ? toggleSortOrder : undefined
+        rowIndex === 0 && !element.isPaged() ? toggleSortOrder : undefined
 
       const columnSortDirection =
         columnIndex === sortColumn ? sortDirection : undefined
@@ -241,6 +251,41 @@ export function ArrowDataFrame({
     }, 0)
   }
 
+  /**
+   * Fetch the pages of a paged DataFrame that are scrolled into view, and
+   * haven't been loaded yet.
+   */
+  const onSectionRendered = ({
+    rowStartIndex,
+    rowStopIndex,
+  }: {
+    rowStartIndex: number
+    rowStopIndex: number
+  }): void => {
+    const pages = element.getMissingPages(
+      rowStartIndex - headerRows,
+      rowStopIndex - headerRows
+    )
+
+    pages.forEach(page => {
+      const key = `${element.tableId}:${page}`
+      if (pendingPagesRef.current.has(key)) {
+        return
+      }
+
+      pendingPagesRef.current.add(key)
+      fetchDataFramePage(element, page)
+        .then(rows => {
+          element.setPage(page, rows)
+          if (multiGridRef.current != null) {
+            multiGridRef.current.forceUpdateGrids()
+          }
+        })
+        .catch(e => logError(e))
+        .finally(() => pendingPagesRef.current.delete(key))
+    })
+  }
+
   const sortedDataRowIndices = getDataRowIndices(nCols)
 
   // Get the cell renderer.
@@ -303,6 +348,7 @@ export function ArrowDataFrame({
         hideBottomLeftGridScrollbar
         hideTopRightGridScrollbar
         ref={multiGridRef}
+        onSectionRendered={element.isPaged() ? onSectionRendered : undefined}
       />
       <StyledFixup
         verticalLocator="top"
@@ -16,6 +16,7 @@
  */
 
 import { logWarning } from "src/lib/log"
+import { buildHttpUri, getWindowBaseUriParts } from "src/lib/UriUtil"
 import { scrollbarSize } from "src/vendor/dom-helpers"
 import React, { ReactElement, ComponentType } from "react"
 import { Quiver, DataFrameCellType } from "src/lib/Quiver"
@@ -230,6 +231,34 @@ export function getCellContentsGetter({
   }
 }
 
+/**
+ * Fetch a page of rows of a paged DataFrame from the server.
+ */
+export async function fetchDataFramePage(
+  element: Quiver,
+  page: number
+): Promise<Quiver> {
+  const { tableId, pageSize } = element
+  const start = page * pageSize
+  const end = start + pageSize
+  const url = buildHttpUri(
+    getWindowBaseUriParts(),
+    `dataframe/${tableId}?start=${start}&end=${end}`
+  )
+
+  const rsp = await fetch(url)
+  if (!rsp.ok) {
+    // `fetch` doesn't reject for bad HTTP statuses, so
+    // we explicitly check for that.
+    throw new Error(
+      `Failed to retrieve rows ${start}-${end} of DataFrame: ${rsp.statusText}`
+    )
+  }
+
+  const data = await rsp.arrayBuffer()
+  return new Quiver({ data: new Uint8Array(data) })
+}
+
 /**
  * Computes various dimensions for the table.
  *
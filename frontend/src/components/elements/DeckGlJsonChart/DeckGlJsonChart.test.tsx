@@ -75,6 +75,33 @@ describe("DeckGlJsonChart element", () => {
     })
   })
 
+  it("passes binary layer data to deck.gl", () => {
+    const positions = new Float64Array([-1.5, 52.25, -1.25, 52.5])
+    const props = getProps({
+      binaryData: [
+        {
+          layerId: "0533490f-fcf9-4dc0-8c94-ae4fbd42eb6f",
+          length: 2,
+          attributes: [
+            {
+              accessor: "getPosition",
+              size: 2,
+              float64Values: new Uint8Array(positions.buffer),
+            },
+          ],
+        },
+      ],
+    })
+    const wrapper = shallow(<DeckGlJsonChart {...props} />)
+    const layers = wrapper.find("DeckGL").prop("layers") as any[]
+
+    expect(layers.length).toBe(1)
+    const { data } = layers[0].props
+    expect(data.length).toBe(2)
+    expect(data.attributes.getPosition.size).toBe(2)
+    expect(data.attributes.getPosition.value).toEqual(positions)
+  })
+
   it("should render tooltip", () => {
     const props = getProps({
       tooltip: `{"html": "<b>Elevation Value:</b> {elevationValue}", "style": {"color": "white"}}`,
@@ -33,7 +33,10 @@ import { registerLoaders } from "@loaders.gl/core"
 import withFullScreenWrapper from "src/hocs/withFullScreenWrapper"
 import withMapboxToken from "src/hocs/withMapboxToken"
 
-import { DeckGlJsonChart as DeckGlJsonChartProto } from "src/autogen/proto"
+import {
+  DeckGlJsonChart as DeckGlJsonChartProto,
+  IDeckGlBinaryData,
+} from "src/autogen/proto"
 import { StyledDeckGlChart } from "./styled-components"
 
 import "mapbox-gl/dist/mapbox-gl.css"
@@ -44,15 +47,26 @@ interface PickingInfo {
   }
 }
 
+interface DeckLayer {
+  id: string
+  clone: (props: Record<string, unknown>) => DeckLayer
+}
+
 interface DeckObject {
   initialViewState: {
     height: number
     width: number
   }
-  layers: Record<string, unknown>[]
+  layers: DeckLayer[]
   mapStyle?: string | Array<string>
 }
 
+/** The data of a layer, in deck.gl's binary data format. */
+interface BinaryLayerData {
+  length: number
+  attributes: Record<string, { value: Float64Array; size: number }>
+}
+
 const configuration = {
   classes: { ...layers, ...aggregationLayers, ...geoLayers },
 }
@@ -61,6 +75,44 @@ registerLoaders([CSVLoader])
 
 const jsonConverter = new JSONConverter({ configuration })
 
+// The binary layer data of each element, by layer id. Decoding it copies the
+// values, so it's only done once per element.
+const binaryDataCache = new WeakMap<
+  DeckGlJsonChartProto,
+  Map<string, BinaryLayerData>
+>()
+
+function getBinaryData(
+  element: DeckGlJsonChartProto
+): Map<string, BinaryLayerData> {
+  const cached = binaryDataCache.get(element)
+  if (cached !== undefined) {
+    return cached
+  }
+
+  const binaryData = new Map<string, BinaryLayerData>()
+  element.binaryData.forEach((layerData: IDeckGlBinaryData) => {
+    const attributes: BinaryLayerData["attributes"] = {}
+    const layerAttributes = layerData.attributes || []
+    layerAttributes.forEach(attribute => {
+      // Copy the bytes, since a Float64Array must start at a multiple of 8
+      // bytes into its buffer.
+      const values = (attribute.float64Values as Uint8Array).slice()
+      attributes[attribute.accessor as string] = {
+        value: new Float64Array(values.buffer),
+        size: attribute.size as number,
+      }
+    })
+    binaryData.set(layerData.layerId as string, {
+      length: layerData.length as number,
+      attributes,
+    })
+  })
+
+  binaryDataCache.set(element, binaryData)
+  return binaryData
+}
+
 interface Props {
   width: number
   mapboxToken: string
@@ -153,7 +205,15 @@ export class DeckGlJsonChart extends PureComponent<PropsWithHeight, State> {
 
     delete json.views // We are not using views. This avoids a console warning.
 
-    return jsonConverter.convert(json)
+    const deck: DeckObject = jsonConverter.convert(json)
+    if (element.binaryData.length > 0) {
+      const binaryData = getBinaryData(element)
+      deck.layers = deck.layers.map(layer => {
+        const data = binaryData.get(layer.id)
+        return data ? layer.clone({ data }) : layer
+      })
+    }
+    return deck
   }
 
   createTooltip = (info: PickingInfo): Record<string, unknown> | boolean => {
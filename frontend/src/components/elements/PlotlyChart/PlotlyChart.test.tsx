@@ -23,7 +23,11 @@ import ThemeProvider from "src/components/core/ThemeProvider"
 import { darkTheme } from "src/theme"
 import { PlotlyChart as PlotlyChartProto } from "src/autogen/proto"
 import mock from "./mock"
-import { DEFAULT_HEIGHT, PlotlyChartProps } from "./PlotlyChart"
+import {
+  DEFAULT_HEIGHT,
+  PlotlyChartProps,
+  decodeTypedArrays,
+} from "./PlotlyChart"
 
 jest.mock("react-plotly.js", () => jest.fn(() => null))
 
@@ -152,4 +156,47 @@ describe("PlotlyChart Element", () => {
       expect(layout.font.color).toBe(darkTheme.emotion.colors.bodyText)
     })
   })
+
+  describe("Typed arrays", () => {
+    it("decodes 1D typed arrays", () => {
+      const data = decodeTypedArrays([
+        {
+          // [1, 2.5] as little-endian float64s.
+          x: { dtype: "f8", bdata: "AAAAAAAA8D8AAAAAAAAEQA==" },
+          y: [1, 2],
+          name: "trace",
+        },
+      ])
+
+      expect(data[0].x).toBeInstanceOf(Float64Array)
+      expect(Array.from(data[0].x)).toEqual([1, 2.5])
+      expect(data[0].y).toEqual([1, 2])
+      expect(data[0].name).toBe("trace")
+    })
+
+    it("decodes 2D typed arrays into rows", () => {
+      const data = decodeTypedArrays([
+        // [[1, 2], [3, 4]] as uint8s.
+        { z: { dtype: "u1", bdata: "AQIDBA==", shape: "2, 2" } },
+      ])
+
+      expect(data[0].z).toEqual([
+        [1, 2],
+        [3, 4],
+      ])
+    })
+
+    it("passes decoded arrays to Plot", () => {
+      const props = getProps()
+      const spec = JSON.parse(props.element.figure.spec)
+      spec.data = [{ x: { dtype: "i1", bdata: "AQI=" } }]
+      props.element.figure.spec = JSON.stringify(spec)
+
+      const wrapper = mount(<PlotlyChart {...props} />)
+
+      const { data } = wrapper.find(Plot).props()
+      expect(data[0].x).toBeInstanceOf(Int8Array)
+      expect(Array.from(data[0].x)).toEqual([1, 2])
+    })
+  })
 })
@@ -53,6 +53,12 @@ export function PlotlyChart({
 
   const generateSpec = (figure: FigureProto): any => {
     const spec = JSON.parse(figure.spec)
+    spec.data = decodeTypedArrays(spec.data)
+    if (spec.frames) {
+      spec.frames = spec.frames.map((frame: any) =>
+        frame.data ? { ...frame, data: decodeTypedArrays(frame.data) } : frame
+      )
+    }
 
     if (isFullScreen()) {
       spec.layout.width = propWidth
@@ -93,6 +99,75 @@ export function PlotlyChart({
   }
 }
 
+type TypedArray =
+  | Int8Array
+  | Uint8Array
+  | Int16Array
+  | Uint16Array
+  | Int32Array
+  | Uint32Array
+  | Float32Array
+  | Float64Array
+
+const TYPED_ARRAYS: Record<string, (buffer: ArrayBuffer) => TypedArray> = {
+  i1: buffer => new Int8Array(buffer),
+  u1: buffer => new Uint8Array(buffer),
+  i2: buffer => new Int16Array(buffer),
+  u2: buffer => new Uint16Array(buffer),
+  i4: buffer => new Int32Array(buffer),
+  u4: buffer => new Uint32Array(buffer),
+  f4: buffer => new Float32Array(buffer),
+  f8: buffer => new Float64Array(buffer),
+}
+
+/**
+ * Replace the base64-encoded typed arrays of a spec's traces, which look like
+ * {dtype: "f8", bdata: "...", shape?: "rows, columns"}, with the arrays they
+ * hold. Our version of plotly.js predates its own support for them.
+ */
+export function decodeTypedArrays(value: any): any {
+  if (Array.isArray(value)) {
+    return value.map(decodeTypedArrays)
+  }
+  if (value == null || typeof value !== "object") {
+    return value
+  }
+  if (typeof value.bdata === "string" && value.dtype in TYPED_ARRAYS) {
+    return decodeTypedArray(value.bdata, value.dtype, value.shape)
+  }
+
+  const decoded: any = {}
+  Object.keys(value).forEach(key => {
+    decoded[key] = decodeTypedArrays(value[key])
+  })
+  return decoded
+}
+
+function decodeTypedArray(
+  bdata: string,
+  dtype: string,
+  shape: string | undefined
+): TypedArray | number[][] {
+  const binary = atob(bdata)
+  const bytes = new Uint8Array(binary.length)
+  for (let i = 0; i < binary.length; i++) {
+    bytes[i] = binary.charCodeAt(i)
+  }
+  const values = TYPED_ARRAYS[dtype](bytes.buffer)
+  if (shape == null) {
+    return values
+  }
+
+  // plotly.js 1.x only takes plain arrays as the rows of 2D data.
+  const [numRows, numColumns] = shape.split(",").map(Number)
+  const rows: number[][] = []
+  for (let row = 0; row < numRows; row++) {
+    const start = row * numColumns
+    rows.push(Array.from(values.subarray(start, start + numColumns)))
+  }
+  return rows
+}
+
 function layoutWithThemeDefaults(layout: any, theme: Theme): any {
   const { colors, genericFonts } = theme
 
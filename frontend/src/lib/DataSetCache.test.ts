@@ -0,0 +1,98 @@
+/**
+ * @license
+ * Copyright 2018-2021 Streamlit Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *    http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+import { DataSet, Delta } from "src/autogen/proto"
+import { DataSetCache } from "src/lib/DataSetCache"
+import { UNICODE } from "src/lib/mocks/arrow"
+
+function createArrowDataSet(id: string): DataSet {
+  return DataSet.fromObject({ id, arrow: { data: UNICODE } })
+}
+
+function createArrowChartDelta(dataSetId: string): Delta {
+  return Delta.fromObject({
+    newElement: {
+      arrowVegaLiteChart: {
+        spec: "{}",
+        datasets: [{ name: "source", hasName: true, dataSetId }],
+      },
+    },
+  })
+}
+
+describe("DataSetCache", () => {
+  it("fills in the data of arrow chart datasets", () => {
+    const cache = new DataSetCache()
+    const dataSet = createArrowDataSet("abc")
+    cache.add(dataSet)
+
+    const delta = createArrowChartDelta("abc")
+    cache.resolveDataSets(delta)
+
+    const datasets = delta.newElement?.arrowVegaLiteChart?.datasets
+    expect(datasets?.[0].data).toBe(dataSet.arrow)
+    expect(datasets?.[0].name).toBe("source")
+  })
+
+  it("fills in the data of legacy chart datasets", () => {
+    const cache = new DataSetCache()
+    const dataSet = DataSet.fromObject({ id: "abc", dataFrame: {} })
+    cache.add(dataSet)
+
+    const delta = Delta.fromObject({
+      newElement: {
+        vegaLiteChart: {
+          spec: "{}",
+          datasets: [{ name: "source", hasName: true, dataSetId: "abc" }],
+        },
+      },
+    })
+    cache.resolveDataSets(delta)
+
+    const datasets = delta.newElement?.vegaLiteChart?.datasets
+    expect(datasets?.[0].data).toBe(dataSet.dataFrame)
+  })
+
+  it("leaves datasets without a DataSet ID alone", () => {
+    const cache = new DataSetCache()
+    const delta = createArrowChartDelta("")
+    cache.resolveDataSets(delta)
+
+    const datasets = delta.newElement?.arrowVegaLiteChart?.datasets
+    expect(datasets?.[0].data).toBeNull()
+  })
+
+  it("throws for unknown DataSets", () => {
+    const cache = new DataSetCache()
+    expect(() => cache.resolveDataSets(createArrowChartDelta("abc"))).toThrow(
+      "Chart refers to an unknown DataSet [id=abc]"
+    )
+  })
+
+  it("keeps DataSets for one more run", () => {
+    const cache = new DataSetCache()
+    cache.add(createArrowDataSet("abc"))
+
+    cache.incrementRunCount()
+    expect(() =>
+      cache.resolveDataSets(createArrowChartDelta("abc"))
+    ).not.toThrow()
+
+    cache.incrementRunCount()
+    expect(() => cache.resolveDataSets(createArrowChartDelta("abc"))).toThrow()
+  })
+})
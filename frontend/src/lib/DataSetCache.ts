@@ -0,0 +1,106 @@
+/**
+ * @license
+ * Copyright 2018-2021 Streamlit Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *    http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+import {
+  DataSet,
+  Delta,
+  IArrowNamedDataSet,
+  INamedDataSet,
+} from "src/autogen/proto"
+
+/**
+ * Max number of report runs that a DataSet is kept for. The server sends a
+ * DataSet in every run that uses it, but it may arrive before the previous
+ * run's reportFinished message, so it's kept for one more run.
+ */
+const MAX_DATA_SET_AGE = 1
+
+interface CacheEntry {
+  dataSet: DataSet
+  reportRunCount: number
+}
+
+/**
+ * Holds the DataSets that chart datasets refer to by ID.
+ *
+ * Large chart datasets are sent in DataSet messages, ahead of the deltas
+ * that refer to them, so that charts of the same data share a single copy.
+ */
+export class DataSetCache {
+  private readonly dataSets = new Map<string, CacheEntry>()
+
+  private reportRunCount = 0
+
+  public add(dataSet: DataSet): void {
+    this.dataSets.set(dataSet.id, {
+      dataSet,
+      reportRunCount: this.reportRunCount,
+    })
+  }
+
+  /**
+   * Fill in the data of the chart datasets of a delta that refer to a
+   * DataSet. The delta is modified in place.
+   */
+  public resolveDataSets(delta: Delta): void {
+    const element = delta.newElement
+    if (delta.type !== "newElement" || element == null) {
+      return
+    }
+
+    if (element.type === "vegaLiteChart" && element.vegaLiteChart) {
+      element.vegaLiteChart.datasets.forEach((dataset: INamedDataSet) => {
+        if (dataset.dataSetId) {
+          dataset.data = this.getDataSet(dataset.dataSetId).dataFrame
+        }
+      })
+    } else if (
+      element.type === "arrowVegaLiteChart" &&
+      element.arrowVegaLiteChart
+    ) {
+      element.arrowVegaLiteChart.datasets.forEach(
+        (dataset: IArrowNamedDataSet) => {
+          if (dataset.dataSetId) {
+            dataset.data = this.getDataSet(dataset.dataSetId).arrow
+          }
+        }
+      )
+    }
+  }
+
+  /**
+   * Increment our reportRunCount, and remove the DataSets that have expired.
+   * This should be called after the report has finished running.
+   */
+  public incrementRunCount(): void {
+    this.reportRunCount += 1
+
+    this.dataSets.forEach((entry, id) => {
+      if (this.reportRunCount - entry.reportRunCount > MAX_DATA_SET_AGE) {
+        this.dataSets.delete(id)
+      }
+    })
+  }
+
+  private getDataSet(id: string): DataSet {
+    const entry = this.dataSets.get(id)
+    if (entry === undefined) {
+      throw new Error(`Chart refers to an unknown DataSet [id=${id}]`)
+    }
+    return entry.dataSet
+  }
+}
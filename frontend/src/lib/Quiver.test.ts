@@ -33,6 +33,7 @@ import {
   MULTI,
   STYLER,
   DISPLAY_VALUES,
+  CELL_CLASSES,
   FEWER_COLUMNS,
   DIFFERENT_COLUMN_TYPES,
 } from "src/lib/mocks/arrow"
@@ -103,6 +104,33 @@ describe("Quiver", () => {
       })
     })
 
+    describe("With Styler cell classes", () => {
+      const mockElement = {
+        data: STYLER,
+        styler: {
+          uuid: "FAKE_UUID",
+          styles: ".T_FAKE_UUIDstyle0 { background-color: yellow }",
+          displayValues: DISPLAY_VALUES,
+          cellClasses: CELL_CLASSES,
+        },
+      }
+      const q = new Quiver(mockElement)
+
+      test("styled data cell", () => {
+        expect(q.getCell(2, 1)).toMatchObject({
+          cssId: "T_FAKE_UUIDrow1_col0",
+          cssClass: "data row1 col0 T_FAKE_UUIDstyle0",
+        })
+      })
+
+      test("unstyled data cell", () => {
+        expect(q.getCell(1, 1)).toMatchObject({
+          cssId: "T_FAKE_UUIDrow0_col0",
+          cssClass: "data row0 col0",
+        })
+      })
+    })
+
     describe("getCell", () => {
       const mockElement = { data: UNICODE }
       const q = new Quiver(mockElement)
@@ -762,6 +790,21 @@ describe("Quiver", () => {
         expect(q.getCell(2, 1).displayContent).toEqual("3")
         expect(q.getCell(2, 2).displayContent).toEqual("4")
       })
+
+      test("styler without display values", () => {
+        const mockElement = {
+          data: STYLER,
+          styler: {
+            uuid: "FAKE_UUID",
+            styles: "FAKE_CSS",
+            displayValues: new Uint8Array(),
+          },
+        }
+        const q = new Quiver(mockElement)
+
+        expect(q.getCell(1, 1).displayContent).toBeUndefined()
+        expect(q.getCell(2, 2).displayContent).toBeUndefined()
+      })
     })
   })
 
@@ -1283,4 +1326,109 @@ describe("Quiver", () => {
       })
     })
   })
+
+  describe("Truncate", () => {
+    it("drops the oldest rows", () => {
+      const mockElement = { data: RANGE }
+      const q = new Quiver(mockElement)
+
+      q.addRows(q)
+      q.truncate(3)
+
+      expect(q.index).toEqual([[1], [2], [3]])
+      expect(q.data).toEqual([
+        ["bar", "2"],
+        ["foo", "1"],
+        ["bar", "2"],
+      ])
+      expect(q.types.index[0].meta).toEqual({
+        start: 1,
+        step: 1,
+        stop: 4,
+        kind: "range",
+        name: null,
+      })
+    })
+
+    it("does nothing if there are at most maxRows rows", () => {
+      const mockElement = { data: RANGE }
+      const q = new Quiver(mockElement)
+
+      q.truncate(2)
+
+      expect(q.index).toEqual([[0], [1]])
+      expect(q.data).toEqual([
+        ["foo", "1"],
+        ["bar", "2"],
+      ])
+    })
+
+    it("throws an error for paged DataFrames", () => {
+      const q = new Quiver({
+        data: RANGE,
+        tableId: "1",
+        numRows: 5,
+        pageSize: 2,
+      })
+
+      expect(() => q.truncate(2)).toThrow()
+    })
+  })
+
+  describe("Paging", () => {
+    const mockElement = { data: RANGE, tableId: "1", numRows: 5, pageSize: 2 }
+
+    it("leaves room for the rows that haven't been loaded", () => {
+      const q = new Quiver(mockElement)
+
+      expect(q.isPaged()).toBe(true)
+      expect(q.tableId).toEqual("1")
+      expect(q.pageSize).toEqual(2)
+      expect(q.dimensions.dataRows).toEqual(5)
+      expect(q.index).toEqual([[0], [1], [2], [3], [4]])
+      expect(q.data).toEqual([
+        ["foo", "1"],
+        ["bar", "2"],
+        [null, null],
+        [null, null],
+        [null, null],
+      ])
+      expect(q.isRowLoaded(1)).toBe(true)
+      expect(q.isRowLoaded(2)).toBe(false)
+      expect(q.getCell(3, 1).displayContent).toEqual("…")
+    })
+
+    it("returns the pages that haven't been loaded", () => {
+      const q = new Quiver(mockElement)
+
+      expect(q.getMissingPages(0, 1)).toEqual([])
+      expect(q.getMissingPages(1, 4)).toEqual([1, 2])
+      expect(q.getMissingPages(4, 10)).toEqual([2])
+    })
+
+    it("fills in a page", () => {
+      const q = new Quiver(mockElement)
+
+      q.setPage(1, new Quiver({ data: RANGE }))
+
+      expect(q.getMissingPages(0, 4)).toEqual([2])
+      expect(q.data[2]).toEqual(["foo", "1"])
+      expect(q.data[3]).toEqual(["bar", "2"])
+      expect(q.getCell(3, 1).displayContent).toBeUndefined()
+    })
+
+    it("throws an error when adding rows", () => {
+      const q = new Quiver(mockElement)
+
+      expect(() => q.addRows(new Quiver({ data: RANGE }))).toThrow()
+    })
+
+    it("isn't paged without a table ID", () => {
+      const q = new Quiver({ data: RANGE })
+
+      expect(q.isPaged()).toBe(false)
+      expect(q.getMissingPages(0, 10)).toEqual([])
+      expect(() => q.setPage(1, q)).toThrow()
+    })
+  })
 })
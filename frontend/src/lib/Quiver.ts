@@ -196,10 +196,17 @@ interface Styler {
   styles: string | null
 
   /**
-   * Stringified versions of each cell in the DataFrame, in the
-   * user-specified format.
+   * Stringified versions of the cells in the DataFrame that have a
+   * user-specified format. The other cells are null, and this is null if no
+   * cell has a user-specified format.
    */
-  displayValues: Quiver
+  displayValues: Quiver | null
+
+  /**
+   * The CSS class index of each styled cell, if any cells are styled.
+   * Cells with the same styles share a class, whose rule is in `styles`.
+   */
+  cellClasses: Table | null
 }
 
 /** Dimensions of the DataFrame. */
@@ -245,9 +252,10 @@ interface DataFrameCell {
   contentType?: Type
 
   /**
-   * The cell's formatted content string, if the DataFrame was created with a Styler.
-   * If the DataFrame is unstyled, displayContent will be undefined, and display
-   * code should apply a default formatting to the `content` value instead.
+   * The cell's formatted content string, if the DataFrame was created with a Styler
+   * that has a user-specified format for the cell. Otherwise, displayContent will
+   * be undefined, and display code should apply a default formatting to the
+   * `content` value instead.
    */
   displayContent?: string
 }
@@ -272,18 +280,38 @@ export class Quiver {
   /** [optional] DataFrame's Styler data. This will be defined if the user styled the dataframe. */
   private readonly _styler?: Styler
 
+  /**
+   * [optional] ID of the server-side table that the rows of a paged
+   * DataFrame are fetched from. Only the first page is sent with the element.
+   */
+  private readonly _tableId?: string
+
+  /** Number of rows in each page of a paged DataFrame. */
+  private readonly _pageSize: number
+
+  /** Pages of a paged DataFrame that have been loaded. */
+  private readonly _loadedPages: Set<number>
+
   constructor(element: IArrow) {
     const table = Table.from(element.data)
     const schema = Quiver.parseSchema(table)
 
-    const index = Quiver.parseIndex(table, schema)
+    let index = Quiver.parseIndex(table, schema)
     const columns = Quiver.parseColumns(schema)
-    const data = Quiver.parseData(table, columns)
+    let data = Quiver.parseData(table, columns)
     const types = Quiver.parseTypes(table, schema)
     const styler = element.styler
       ? Quiver.parseStyler(element.styler as StylerProto)
       : undefined
 
+    const isPaged = Boolean(element.tableId)
+    if (isPaged) {
+      // Leave room for the rows that haven't been fetched yet.
+      const numRows = element.numRows as number
+      index = Quiver.padRows(index, numRows, types.index)
+      data = Quiver.padRows(data, numRows, types.data)
+    }
+
     // The assignment is done below to avoid partially populating the instance
     // if an error is thrown.
     this._index = index
@@ -291,6 +319,30 @@ export class Quiver {
     this._data = data
     this._types = types
     this._styler = styler
+    this._tableId = isPaged ? (element.tableId as string) : undefined
+    this._pageSize = isPaged ? (element.pageSize as number) : 0
+    this._loadedPages = new Set(isPaged ? [0] : [])
+  }
+
+  /**
+   * Pad a row-major grid with empty rows, up to numRows rows.
+   * Range index values are filled in, since they don't need to be fetched.
+   */
+  private static padRows(
+    rows: DataType[][],
+    numRows: number,
+    rowTypes: Type[]
+  ): DataType[][] {
+    const emptyRows = range(rows.length, numRows).map(rowIndex =>
+      rowTypes.map(type => {
+        if (type.pandas_type === IndexTypeName.RangeIndex) {
+          const { start, step } = type.meta as RangeIndex
+          return start + rowIndex * step
+        }
+        return null
+      })
+    )
+    return rows.concat(emptyRows)
   }
 
   /** Parse Arrow table's schema from a JSON string to an object. */
@@ -428,7 +480,15 @@ export class Quiver {
       // Recursively create a new Quiver instance for Styler's display values.
       // This values will be used for rendering the DataFrame, while the original values
       // will be used for sorting, etc.
-      displayValues: new Quiver({ data: styler.displayValues }),
+      displayValues:
+        styler.displayValues && styler.displayValues.length > 0
+          ? new Quiver({ data: styler.displayValues })
+          : null,
+
+      cellClasses:
+        styler.cellClasses && styler.cellClasses.length > 0
+          ? Table.from(styler.cellClasses)
+          : null,
     }
   }
 
@@ -707,6 +767,65 @@ but was expecting \`${JSON.stringify(expectedIndexTypes)}\`.
     return this._styler?.caption || undefined
   }
 
+  /** ID of the server-side table of a paged DataFrame, if it's paged. */
+  public get tableId(): string | undefined {
+    return this._tableId
+  }
+
+  /** Number of rows in each page of a paged DataFrame. */
+  public get pageSize(): number {
+    return this._pageSize
+  }
+
+  /** True if the DataFrame's rows are fetched one page at a time. */
+  public isPaged(): boolean {
+    return this._tableId !== undefined
+  }
+
+  /** True if the given data row has been loaded. */
+  public isRowLoaded(dataRowIndex: number): boolean {
+    return (
+      !this.isPaged() ||
+      this._loadedPages.has(Math.floor(dataRowIndex / this._pageSize))
+    )
+  }
+
+  /**
+   * Return the pages that hold data rows [startRow, stopRow] and haven't
+   * been loaded yet.
+   */
+  public getMissingPages(startRow: number, stopRow: number): number[] {
+    if (!this.isPaged()) {
+      return []
+    }
+
+    return range(
+      Math.floor(Math.max(startRow, 0) / this._pageSize),
+      Math.floor(Math.max(stopRow, 0) / this._pageSize) + 1
+    ).filter(
+      page =>
+        !this._loadedPages.has(page) &&
+        page * this._pageSize < this._data.length
+    )
+  }
+
+  /**
+   * Fill in a page of a paged DataFrame with the rows that were fetched
+   * for it. This is a mutating function.
+   */
+  public setPage(page: number, rows: Quiver): void {
+    if (!this.isPaged()) {
+      throw new Error("Unsupported operation. The DataFrame isn't paged.")
+    }
+
+    const start = page * this._pageSize
+    rows._data.forEach((row, i) => {
+      this._index[start + i] = rows._index[i]
+      this._data[start + i] = row
+    })
+    this._loadedPages.add(page)
+  }
+
   /** The DataFrame's dimensions. */
   public get dimensions(): DataFrameDimensions {
     const [headerColumns, dataRowsCheck] = this._index.length
@@ -849,23 +968,28 @@ but was expecting \`${JSON.stringify(expectedIndexTypes)}\`.
       : undefined
 
     // Data cells include `data`.
-    const cssClass = [
-      "data",
-      `row${dataRowIndex}`,
-      `col${dataColumnIndex}`,
-    ].join(" ")
+    const cssClass = ["data", `row${dataRowIndex}`, `col${dataColumnIndex}`]
+    const styleClass = this._styler?.cellClasses
+      ?.getColumnAt(dataColumnIndex)
+      ?.get(dataRowIndex)
+    if (styleClass != null) {
+      cssClass.push(`${this.cssId}style${styleClass}`)
+    }
 
     const contentType = this._types.data[dataColumnIndex]
     const content = this._data[dataRowIndex][dataColumnIndex]
-    const displayContent = this._styler?.displayValues
-      ? (this._styler.displayValues.getCell(rowIndex, columnIndex)
-          .content as string)
+    let displayContent = this._styler?.displayValues
+      ? ((this._styler.displayValues.getCell(rowIndex, columnIndex).content as
+          string | null) ?? undefined)
       : undefined
+    if (!this.isRowLoaded(dataRowIndex)) {
+      displayContent = "…"
+    }
 
     return {
       type: DataFrameCellType.DATA,
       cssId,
-      cssClass,
+      cssClass: cssClass.join(" "),
       content,
       contentType,
       displayContent,
@@ -877,6 +1001,12 @@ but was expecting \`${JSON.stringify(expectedIndexTypes)}\`.
    * Extra columns will not be created. This is a mutating function.
    */
   public addRows(other: Quiver): void {
+    if (this.isPaged() || other.isPaged()) {
+      throw new Error(
+        "Unsupported operation. `add_rows()` does not support paged DataFrames."
+      )
+    }
+
     if (this._styler || other._styler) {
       throw new Error(`
 Unsupported operation. \`add_rows()\` does not support Pandas Styler objects.
@@ -918,4 +1048,42 @@ st.add_rows(my_styler.data)
     this._data = data
     this._types = types
   }
+
+  /**
+   * Drop the oldest rows of the DataFrame, so that it has at most
+   * `maxRows` rows.
+   */
+  public truncate(maxRows: number): void {
+    if (this.isPaged()) {
+      throw new Error(
+        "Unsupported operation. `max_rows` is not supported for paged DataFrames."
+      )
+    }
+
+    const numRowsToDrop = this._data.length - maxRows
+    if (numRowsToDrop <= 0) {
+      return
+    }
+
+    this._index = this._index.slice(numRowsToDrop)
+    this._data = this._data.slice(numRowsToDrop)
+    this._types = {
+      ...this._types,
+      index: this._types.index.map(indexType => {
+        // NOTE: "range" index cannot be a part of a multi-index, i.e.
+        // if the index type is "range", there will only be one element in the index array.
+        if (indexType.pandas_type === IndexTypeName.RangeIndex) {
+          const { start, step } = indexType.meta as RangeIndex
+          return {
+            ...indexType,
+            meta: {
+              ...indexType.meta,
+              start: start + numRowsToDrop * step,
+            },
+          }
+        }
+        return indexType
+      }),
+    }
+  }
 }
@@ -294,6 +294,9 @@ export class ElementNode implements ReportNode {
 
     const newQuiver = new Quiver(namedDataSet.data as IArrow)
     element.addRows(newQuiver)
+    if (namedDataSet.maxRows) {
+      element.truncate(namedDataSet.maxRows)
+    }
 
     // Cloning is needed here to force React component to update.
     return cloneDeep(element)
@@ -316,6 +319,9 @@ export class ElementNode implements ReportNode {
 
     if (dataframeToModify) {
       dataframeToModify.addRows(newDataSetQuiver)
+      if (namedDataSet.maxRows) {
+        dataframeToModify.truncate(namedDataSet.maxRows)
+      }
     } else {
       // If there is nothing to modify, just use new rows as data.
       element.data = newDataSetQuiver
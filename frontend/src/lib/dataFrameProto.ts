@@ -490,6 +490,7 @@ export function addRows(element: any, namedDataSet: any): any {
     dataframeToModify = dataframeToModify.set("style", fromJS({ cols: [] }))
   }
 
+  const maxRows = namedDataSet.get("maxRows")
   let newDataFrame
 
   if (
@@ -518,6 +519,10 @@ export function addRows(element: any, namedDataSet: any): any {
       })
   }
 
+  if (maxRows) {
+    newDataFrame = truncateDataFrame(newDataFrame, maxRows)
+  }
+
   if (existingDataSet) {
     return setDataFrameInNamedDataSet(
       element,
@@ -528,6 +533,41 @@ export function addRows(element: any, namedDataSet: any): any {
   return setDataFrame(element, newDataFrame)
 }
 
+/**
+ * Drops the oldest rows of a DataFrame, so that it has at most maxRows rows.
+ */
+function truncateDataFrame(df: any, maxRows: number): any {
+  const numRowsToDrop = indexLen(df.get("index")) - maxRows
+  if (numRowsToDrop <= 0) {
+    return df
+  }
+
+  const dropRows = (data: any): any => data.slice(numRowsToDrop)
+  const dropAnyArrayRows = (anyArray: any): any =>
+    anyArray.updateIn([anyArray.get("type"), "data"], dropRows)
+
+  return df
+    .update("index", (index: any) =>
+      updateOneOf(index, "type", {
+        plainIndex: (idx: any) => idx.update("data", dropAnyArrayRows),
+        rangeIndex: (idx: any) =>
+          idx.update("start", (start: any) => start + numRowsToDrop),
+        multiIndex: (idx: any) =>
+          idx.update("labels", (labels: any) =>
+            labels.map((label: any) => label.update("data", dropRows))
+          ),
+        int_64Index: (idx: any) => idx.updateIn(["data", "data"], dropRows),
+        float_64Index: (idx: any) => idx.updateIn(["data", "data"], dropRows),
+        datetimeIndex: (idx: any) => idx.updateIn(["data", "data"], dropRows),
+        timedeltaIndex: (idx: any) => idx.updateIn(["data", "data"], dropRows),
+      })
+    )
+    .updateIn(["data", "cols"], (cols: any) => cols.map(dropAnyArrayRows))
+    .updateIn(["style", "cols"], (styleCols: any) =>
+      styleCols.map((styleCol: any) => styleCol.update("styles", dropRows))
+    )
+}
+
 /**
  * Concatenates the indices and returns a new index.
  */
@@ -26,7 +26,7 @@ import { UINT64 } from "./types/uint64"
 import { UNICODE } from "./types/unicode"
 import { EMPTY } from "./empty"
 import { MULTI } from "./multi"
-import { STYLER, DISPLAY_VALUES } from "./styler"
+import { STYLER, DISPLAY_VALUES, CELL_CLASSES } from "./styler"
 import { FEWER_COLUMNS } from "./fewerColumns"
 import { DIFFERENT_COLUMN_TYPES } from "./differentColumnTypes"
 import { VEGA_LITE } from "./vegaLite"
@@ -47,6 +47,7 @@ export {
   MULTI,
   STYLER,
   DISPLAY_VALUES,
+  CELL_CLASSES,
   FEWER_COLUMNS,
   DIFFERENT_COLUMN_TYPES,
   VEGA_LITE,
@@ -1994,3 +1994,414 @@ export const DISPLAY_VALUES = new Uint8Array([
   0,
   0,
 ])
+
+export const CELL_CLASSES = new Uint8Array([
+  255,
+  255,
+  255,
+  255,
+  168,
+  0,
+  0,
+  0,
+  16,
+  0,
+  0,
+  0,
+  0,
+  0,
+  10,
+  0,
+  12,
+  0,
+  6,
+  0,
+  5,
+  0,
+  8,
+  0,
+  10,
+  0,
+  0,
+  0,
+  0,
+  1,
+  4,
+  0,
+  12,
+  0,
+  0,
+  0,
+  8,
+  0,
+  8,
+  0,
+  0,
+  0,
+  4,
+  0,
+  8,
+  0,
+  0,
+  0,
+  4,
+  0,
+  0,
+  0,
+  2,
+  0,
+  0,
+  0,
+  68,
+  0,
+  0,
+  0,
+  4,
+  0,
+  0,
+  0,
+  212,
+  255,
+  255,
+  255,
+  0,
+  0,
+  1,
+  2,
+  16,
+  0,
+  0,
+  0,
+  20,
+  0,
+  0,
+  0,
+  4,
+  0,
+  0,
+  0,
+  0,
+  0,
+  0,
+  0,
+  1,
+  0,
+  0,
+  0,
+  49,
+  0,
+  0,
+  0,
+  196,
+  255,
+  255,
+  255,
+  0,
+  0,
+  0,
+  1,
+  8,
+  0,
+  0,
+  0,
+  16,
+  0,
+  20,
+  0,
+  8,
+  0,
+  6,
+  0,
+  7,
+  0,
+  12,
+  0,
+  0,
+  0,
+  16,
+  0,
+  16,
+  0,
+  0,
+  0,
+  0,
+  0,
+  1,
+  2,
+  16,
+  0,
+  0,
+  0,
+  28,
+  0,
+  0,
+  0,
+  4,
+  0,
+  0,
+  0,
+  0,
+  0,
+  0,
+  0,
+  1,
+  0,
+  0,
+  0,
+  48,
+  0,
+  0,
+  0,
+  8,
+  0,
+  12,
+  0,
+  8,
+  0,
+  7,
+  0,
+  8,
+  0,
+  0,
+  0,
+  0,
+  0,
+  0,
+  1,
+  8,
+  0,
+  0,
+  0,
+  255,
+  255,
+  255,
+  255,
+  184,
+  0,
+  0,
+  0,
+  20,
+  0,
+  0,
+  0,
+  0,
+  0,
+  0,
+  0,
+  12,
+  0,
+  22,
+  0,
+  6,
+  0,
+  5,
+  0,
+  8,
+  0,
+  12,
+  0,
+  12,
+  0,
+  0,
+  0,
+  0,
+  3,
+  4,
+  0,
+  24,
+  0,
+  0,
+  0,
+  32,
+  0,
+  0,
+  0,
+  0,
+  0,
+  0,
+  0,
+  0,
+  0,
+  10,
+  0,
+  24,
+  0,
+  12,
+  0,
+  4,
+  0,
+  8,
+  0,
+  10,
+  0,
+  0,
+  0,
+  92,
+  0,
+  0,
+  0,
+  16,
+  0,
+  0,
+  0,
+  2,
+  0,
+  0,
+  0,
+  0,
+  0,
+  0,
+  0,
+  0,
+  0,
+  0,
+  0,
+  4,
+  0,
+  0,
+  0,
+  0,
+  0,
+  0,
+  0,
+  0,
+  0,
+  0,
+  0,
+  1,
+  0,
+  0,
+  0,
+  0,
+  0,
+  0,
+  0,
+  8,
+  0,
+  0,
+  0,
+  0,
+  0,
+  0,
+  0,
+  2,
+  0,
+  0,
+  0,
+  0,
+  0,
+  0,
+  0,
+  16,
+  0,
+  0,
+  0,
+  0,
+  0,
+  0,
+  0,
+  1,
+  0,
+  0,
+  0,
+  0,
+  0,
+  0,
+  0,
+  24,
+  0,
+  0,
+  0,
+  0,
+  0,
+  0,
+  0,
+  2,
+  0,
+  0,
+  0,
+  0,
+  0,
+  0,
+  0,
+  0,
+  0,
+  0,
+  0,
+  2,
+  0,
+  0,
+  0,
+  2,
+  0,
+  0,
+  0,
+  0,
+  0,
+  0,
+  0,
+  1,
+  0,
+  0,
+  0,
+  0,
+  0,
+  0,
+  0,
+  2,
+  0,
+  0,
+  0,
+  0,
+  0,
+  0,
+  0,
+  1,
+  0,
+  0,
+  0,
+  0,
+  0,
+  0,
+  0,
+  2,
+  0,
+  0,
+  0,
+  0,
+  0,
+  0,
+  0,
+  255,
+  0,
+  0,
+  0,
+  0,
+  0,
+  0,
+  0,
+  2,
+  0,
+  0,
+  0,
+  0,
+  0,
+  0,
+  0,
+  255,
+  0,
+  0,
+  0,
+  0,
+  0,
+  0,
+  0,
+  255,
+  255,
+  255,
+  255,
+  0,
+  0,
+  0,
+  0,
+])
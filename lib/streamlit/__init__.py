@@ -184,6 +184,7 @@ _arrow_vega_lite_chart = _main.arrow_vega_lite_chart
 # Config
 get_option = _config.get_option
 from streamlit.commands.page_config import set_page_config
+from streamlit.fragment import fragment as experimental_fragment
 
 # Session State
 
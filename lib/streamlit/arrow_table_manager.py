@@ -0,0 +1,220 @@
+# Copyright 2018-2021 Streamlit Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Provides global ArrowTableManager object as `arrow_table_manager`."""
+
+import collections
+import threading
+import uuid
+from typing import TYPE_CHECKING, DefaultDict, Dict, NamedTuple, Optional
+
+from blinker import Signal
+
+from streamlit import config
+from streamlit import type_util
+from streamlit import util
+from streamlit.logger import get_logger
+from streamlit.report_thread import get_report_ctx
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+LOGGER = get_logger(__name__)
+
+
+def _get_session_id() -> str:
+    """Semantic wrapper to retrieve current ReportSession ID."""
+    ctx = get_report_ctx()
+    if ctx is None:
+        # This is only None when running "python myscript.py" rather than
+        # "streamlit run myscript.py". In which case the session ID doesn't
+        # matter and can just be a constant, as there's only ever "session".
+        return "dontcare"
+    else:
+        return ctx.session_id
+
+
+class _TableEntry(NamedTuple):
+    session_id: str
+    coordinates: str
+    table: "pa.Table"
+
+
+class ArrowTableManager(object):
+    """In-memory store of the Arrow tables of paged dataframes.
+
+    A dataframe with more rows than server.dataFramePageSize is sent to the
+    browser one page at a time, and this holds the tables that the browser
+    fetches the pages from.
+
+    Like MediaFileManager, this keeps track of the coordinates of the element
+    that uses each table in each session, so that a table is dropped when its
+    element is replaced, or its session ends. On top of that, the least
+    recently used tables are dropped when their total size exceeds
+    server.maxDataFrameCacheSize.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+
+        # Dict of table ID to _TableEntry, least recently used first.
+        self._tables: "collections.OrderedDict[str, _TableEntry]" = (
+            collections.OrderedDict()
+        )
+        self._num_bytes = 0
+
+        # Dict[session ID][coordinates] -> table ID.
+        self._ids_by_session_and_coord: DefaultDict[
+            str, Dict[str, str]
+        ] = collections.defaultdict(dict)
+
+        self.on_table_added = Signal(
+            doc="""Emitted when a table is added to the manager.
+
+            Parameters
+            ----------
+            session_id : str
+                The ID of the session that added the table.
+            table_id : str
+                The ID of the table.
+            table : pyarrow.Table
+                The table that was added.
+            coordinates : str
+                The coordinates of the element that uses the table.
+            """
+        )
+
+    def __repr__(self) -> str:
+        return util.repr_(self)
+
+    def add(
+        self,
+        table: "pa.Table",
+        coordinates: str,
+        session_id: Optional[str] = None,
+        table_id: Optional[str] = None,
+    ) -> str:
+        """Add a table, and return its ID.
+
+        Parameters
+        ----------
+        table : pyarrow.Table
+            The table to serve pages of rows from.
+        coordinates : str
+            Unique string identifying the location of the element that uses
+            the table. The table that this session had at these coordinates,
+            if any, is dropped.
+        session_id : str or None
+            The ID of the session that uses the table, or None to use the
+            current ReportContext's session.
+        table_id : str or None
+            The ID to add the table with, or None to generate a new one.
+
+        """
+        if session_id is None:
+            session_id = _get_session_id()
+        if table_id is None:
+            table_id = uuid.uuid4().hex
+
+        with self._lock:
+            old_table_id = self._ids_by_session_and_coord[session_id].get(coordinates)
+            if old_table_id is not None:
+                self._remove(old_table_id)
+
+            self._tables[table_id] = _TableEntry(session_id, coordinates, table)
+            self._num_bytes += table.nbytes
+            self._ids_by_session_and_coord[session_id][coordinates] = table_id
+            self._evict_tables(keep_table_id=table_id)
+
+            LOGGER.debug(
+                "Added table %s. Tables: %s; Bytes: %s",
+                table_id,
+                len(self._tables),
+                self._num_bytes,
+            )
+
+        self.on_table_added.send(
+            session_id, table_id=table_id, table=table, coordinates=coordinates
+        )
+        return table_id
+
+    def get_rows(self, table_id: str, start: int, end: int) -> Optional[bytes]:
+        """Return rows [start, end) of a table, as an Arrow IPC stream.
+
+        Returns None if there's no table with this ID.
+        """
+        with self._lock:
+            entry = self._tables.get(table_id)
+            if entry is None:
+                return None
+            self._tables.move_to_end(table_id)
+
+        start = max(0, min(start, entry.table.num_rows))
+        end = max(start, min(end, entry.table.num_rows))
+        rows = type_util.slice_pyarrow_table(entry.table, start, end - start)
+        return type_util.pyarrow_table_to_bytes(
+            type_util.dictionary_encode_strings(rows)
+        )
+
+    def remove(self, table_id: str) -> None:
+        """Drop a table, if we have it."""
+        with self._lock:
+            self._remove(table_id)
+
+    def clear_session_tables(self, session_id: Optional[str] = None) -> None:
+        """Drop the tables of a session.
+
+        Should be called when a session ends.
+        """
+        if session_id is None:
+            session_id = _get_session_id()
+
+        with self._lock:
+            ids_by_coord = self._ids_by_session_and_coord.pop(session_id, {})
+            for table_id in ids_by_coord.values():
+                self._remove(table_id)
+
+    def _remove(self, table_id: str) -> None:
+        entry = self._tables.pop(table_id, None)
+        if entry is None:
+            return
+
+        self._num_bytes -= entry.table.nbytes
+        ids_by_coord = self._ids_by_session_and_coord.get(entry.session_id)
+        if ids_by_coord is not None:
+            if ids_by_coord.get(entry.coordinates) == table_id:
+                del ids_by_coord[entry.coordinates]
+            if not ids_by_coord:
+                del self._ids_by_session_and_coord[entry.session_id]
+
+    def _evict_tables(self, keep_table_id: str) -> None:
+        """Drop the least recently used tables, other than keep_table_id,
+        until the tables fit in server.maxDataFrameCacheSize.
+        """
+        max_bytes = config.get_option("server.maxDataFrameCacheSize") * 1024 * 1024
+        for table_id in list(self._tables.keys()):
+            if self._num_bytes <= max_bytes:
+                break
+            if table_id != keep_table_id:
+                LOGGER.debug("Evicting table %s", table_id)
+                self._remove(table_id)
+
+    def __contains__(self, table_id: str) -> bool:
+        return table_id in self._tables
+
+    def __len__(self) -> int:
+        return len(self._tables)
+
+
+arrow_table_manager = ArrowTableManager()
@@ -25,8 +25,9 @@ import shutil
 import threading
 import time
 import types
+import weakref
 from collections import namedtuple
-from typing import Dict, Optional, List, Iterator, Any, Callable
+from typing import Dict, Optional, List, Iterator, Any, Callable, Tuple
 
 from cachetools import TTLCache
 
@@ -113,6 +114,56 @@ class _MemCaches:
 _mem_caches = _MemCaches()
 
 
+class _ValueKeys:
+    """Keeps the keys of the values that st.cache returned, for as long as
+    the values are alive.
+
+    A value's key is its st.cache value key, followed by the hash of its
+    contents, so values with the same key have the same contents, unless
+    they were mutated after st.cache returned them (which st.cache warns
+    about).
+    """
+
+    def __init__(self):
+        # Dict of id(value) -> (weak reference to value, key).
+        self._keys: Dict[int, Tuple["weakref.ref[Any]", str]] = {}
+
+    def __repr__(self) -> str:
+        return util.repr_(self)
+
+    def set_key(self, value: Any, value_key: str, output_hash: bytes) -> None:
+        value_id = id(value)
+        try:
+            ref = weakref.ref(value, lambda _: self._keys.pop(value_id, None))
+        except TypeError:
+            # Only values that can be weakly referenced are tracked, since
+            # the id of a dead value may be reused.
+            return
+        self._keys[value_id] = (ref, "%s-%s" % (value_key, output_hash.hex()))
+
+    def get_key(self, value: Any) -> Optional[str]:
+        entry = self._keys.get(id(value))
+        if entry is None or entry[0]() is not value:
+            return None
+        return entry[1]
+
+    def clear(self) -> None:
+        self._keys = {}
+
+
+_value_keys = _ValueKeys()
+
+
+def get_cached_value_key(value: Any) -> Optional[str]:
+    """Return a key that identifies the contents of a value returned by
+    st.cache, or None if the value wasn't returned by st.cache.
+
+    Values returned by functions with allow_output_mutation=True don't have
+    keys, since their contents may change.
+    """
+    return _value_keys.get_key(value)
+
+
 # A thread-local counter that's incremented when we enter @st.cache
 # and decremented when we exit.
 class ThreadLocalCacheInfo(threading.local):
@@ -204,6 +255,8 @@ def _read_from_mem_cache(
                 _LOGGER.debug("Cached object was mutated: %s", key)
                 raise CachedObjectMutationError(entry.value, func_or_code)
 
+            _value_keys.set_key(entry.value, key, stored_output_hash)
+
         _LOGGER.debug("Memory cache HIT: %s", type(entry.value))
         return entry.value
 
@@ -224,6 +277,7 @@ def _write_to_mem_cache(
         hash = None
     else:
         hash = _get_output_hash(value, func_or_code, hash_funcs)
+        _value_keys.set_key(value, key, hash)
 
     mem_cache[key] = _CacheEntry(value=value, hash=hash)
 
@@ -634,6 +688,7 @@ def _clear_disk_cache() -> bool:
 
 def _clear_mem_cache() -> None:
     _mem_caches.clear()
+    _value_keys.clear()
 
 
 class CacheError(Exception):
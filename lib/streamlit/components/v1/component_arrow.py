@@ -289,7 +289,7 @@ def _dataframe_to_pybytes(df):
         A dataframe to convert.
 
     """
-    table = pa.Table.from_pandas(df)
+    table = type_util.dictionary_encode_strings(pa.Table.from_pandas(df))
     sink = pa.BufferOutputStream()
     writer = pa.RecordBatchStreamWriter(sink, table.schema)
     writer.write_table(table)
@@ -355,6 +355,32 @@ _create_option(
     type_=str,
 )
 
+_create_option(
+    "global.maxArrowCacheSize",
+    description="""
+        Max size, in megabytes, of the serialized dataframes and charts that
+        are kept for reuse. Dataframes and Plotly figures returned by
+        st.cache, and styled dataframes whose data and styles haven't
+        changed, are only serialized once, and then displayed from this cache
+        in every session. Set to 0 to disable the cache.
+        """,
+    default_val=100,
+    type_=int,
+)
+
+_create_option(
+    "global.maxImageCacheSize",
+    description="""
+        Max size, in megabytes, of the encoded images that are kept for
+        reuse. Numpy arrays and PIL images that st.image has already encoded
+        with the same width and options are displayed from this cache in
+        every session, instead of being encoded again. Set to 0 to disable
+        the cache.
+        """,
+    default_val=50,
+    type_=int,
+)
+
 
 # Config Section: Logger #
 _create_section("logger", "Settings to customize Streamlit log messages.")
@@ -428,6 +454,46 @@ _create_option(
     scriptable=True,
 )
 
+_create_option(
+    "client.maxChartPoints",
+    description="""
+        Max number of points of each series in st.line_chart and
+        st.area_chart, unless the chart's max_points argument is set. Longer
+        series are downsampled by keeping the smallest and largest value of
+        each group of consecutive rows, so that their peaks and dips are
+        still drawn. Set to 0 to draw every point.
+        """,
+    default_val=0,
+    type_=int,
+    scriptable=True,
+)
+
+_create_option(
+    "client.imageFormat",
+    description="""
+        Format that st.image sends images in, unless its output_format
+        argument is set, and that st.pyplot sends figures in. One of 'auto',
+        'WEBP', 'JPEG' or 'PNG'. 'auto' uses WebP, if Pillow supports it:
+        lossless for images with transparency or few colors, like charts,
+        and lossy for other images. Without WebP support, it uses PNG for
+        images with transparency, and JPEG for other images.
+        """,
+    default_val="auto",
+    type_=str,
+    scriptable=True,
+)
+
+_create_option(
+    "client.imageQuality",
+    description="""
+        Quality, from 1 to 100, of the JPEG and lossy WebP images sent by
+        st.image and st.pyplot.
+        """,
+    default_val=90,
+    type_=int,
+    scriptable=True,
+)
+
 # Config Section: Runner #
 
 _create_section("runner", "Settings for how Streamlit executes your script")
@@ -453,6 +519,33 @@ _create_option(
     type_=bool,
 )
 
+_create_option(
+    "runner.asyncInterrupt",
+    description="""
+        Interrupt a running script as soon as a stop or rerun is requested,
+        by raising an exception in the script thread. Unlike
+        runner.installTracer, this doesn't slow down your script's execution.
+        If false, scripts only check for stop and rerun requests when they
+        send something to the app.
+        """,
+    default_val=True,
+    type_=bool,
+)
+
+_create_option(
+    "runner.rerunDebounceMs",
+    description="""
+        How long to wait, in milliseconds, for more widget changes before
+        rerunning the script. Widget changes that arrive within this window
+        are merged into a single rerun, which avoids starting script runs
+        that are immediately interrupted (e.g. while typing or dragging a
+        slider). A rerun is never delayed by more than five windows. Set to
+        0 to rerun immediately.
+        """,
+    default_val=0,
+    type_=int,
+)
+
 _create_option(
     "runner.fixMatplotlib",
     description="""
@@ -475,6 +568,45 @@ _create_option(
     type_=bool,
 )
 
+_create_option(
+    "runner.maxScriptThreads",
+    description="""
+        Maximum number of app scripts that can run at the same time. Scripts
+        run on a pool of long-lived threads that is shared by all sessions.
+        When every thread is busy, new script runs wait for a free thread in
+        the order they were requested. Set to 0 for no limit.
+        """,
+    default_val=0,
+    type_=int,
+)
+
+_create_option(
+    "runner.executionMode",
+    description="""
+        Where app scripts are executed.
+
+        Acceptable values:
+        - 'thread': Run scripts on threads inside the Streamlit server
+          process.
+        - 'process': Run scripts in a pool of worker processes, so that
+          CPU-heavy scripts from different sessions don't compete for the
+          server's GIL. Each session is pinned to one worker, and st.cache
+          is local to each worker. This mode is experimental.""",
+    default_val="thread",
+    type_=str,
+)
+
+_create_option(
+    "runner.maxScriptProcesses",
+    description="""
+        Maximum number of worker processes to run scripts in when
+        runner.executionMode is 'process'. Set to 0 to use one worker per
+        CPU.
+        """,
+    default_val=0,
+    type_=int,
+)
+
 # Config Section: Server #
 
 _create_section("server", "Settings for the Streamlit server")
@@ -646,6 +778,49 @@ def _server_enable_websocket_compression() -> bool:
     return True
 
 
+_create_option(
+    "server.preheatedSessions",
+    description="""
+        Number of sessions to keep ready for new browser connections. Each
+        preheated session runs the script as soon as it's created, so a new
+        browser connection can be handed a finished run instead of waiting
+        for the script. Used sessions are replaced in the background, one at
+        a time, and only when no script runs are waiting for a thread.
+        Preheated sessions run the script with no query parameters or widget
+        values. Set to 0 to disable preheating.
+        """,
+    default_val=1,
+    type_=int,
+)
+
+
+_create_option(
+    "server.dataFramePageSize",
+    description="""
+        Number of rows of st.dataframe to send to the browser at a time.
+        Dataframes with more rows are sent one page at a time: the browser
+        gets the first page with the app, and fetches the others as they're
+        scrolled into view. Only applies to unstyled dataframes, when
+        global.dataFrameSerialization is 'arrow'. Set to 0 to always send
+        every row.
+        """,
+    default_val=10000,
+    type_=int,
+)
+
+_create_option(
+    "server.maxDataFrameCacheSize",
+    description="""
+        Max size, in megabytes, of the dataframes that the server keeps for
+        browsers to fetch pages of rows from (see server.dataFramePageSize).
+        When it's exceeded, the least recently used dataframes are dropped,
+        and their pages can't be fetched until the app reruns.
+        """,
+    default_val=500,
+    type_=int,
+)
+
+
 # Config Section: Browser #
 
 _create_section("browser", "Configuration of browser front-end.")
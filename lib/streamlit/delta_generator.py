@@ -13,10 +13,12 @@
 # limitations under the License.
 
 """Allows us to create and absorb changes (aka Deltas) to elements."""
+import hashlib
 from typing import Optional, Iterable
 
 import streamlit as st
 from streamlit import caching
+from streamlit import config
 from streamlit import cursor
 from streamlit import type_util
 from streamlit import util
@@ -81,10 +83,10 @@ _type = type
 
 MAX_DELTA_BYTES = 14 * 1024 * 1024  # 14MB
 
-# List of Streamlit commands that perform a Pandas "melt" operation on
-# input dataframes.
-DELTA_TYPES_THAT_MELT_DATAFRAMES = ("line_chart", "area_chart", "bar_chart")
-ARROW_DELTA_TYPES_THAT_MELT_DATAFRAMES = (
+# List of Streamlit commands that draw their input dataframes in wide format,
+# with one column per series, and have Vega-Lite fold the columns.
+DELTA_TYPES_THAT_FOLD_DATAFRAMES = ("line_chart", "area_chart", "bar_chart")
+ARROW_DELTA_TYPES_THAT_FOLD_DATAFRAMES = (
     "arrow_line_chart",
     "arrow_area_chart",
     "arrow_bar_chart",
@@ -304,7 +306,7 @@ class DeltaGenerator(
     @property
     def _cursor(self) -> Optional[Cursor]:
         """Return our Cursor. This will be None if we're not running in a
-        ReportThread - e.g., if we're running a "bare" script outside of
+        script thread - e.g., if we're running a "bare" script outside of
         Streamlit.
         """
         if self._provided_cursor is None:
@@ -376,11 +378,11 @@ class DeltaGenerator(
         # since add_rows() relies on method.__name__ == delta_type
         # TODO: Fix for all elements (or the cache warning above will be wrong)
         proto_type = delta_type
-        if proto_type in DELTA_TYPES_THAT_MELT_DATAFRAMES:
+        if proto_type in DELTA_TYPES_THAT_FOLD_DATAFRAMES:
             proto_type = "vega_lite_chart"
 
         # Mirror the logic for beta_ elements.
-        if proto_type in ARROW_DELTA_TYPES_THAT_MELT_DATAFRAMES:
+        if proto_type in ARROW_DELTA_TYPES_THAT_FOLD_DATAFRAMES:
             proto_type = "arrow_vega_lite_chart"
 
         # Copy the marshalled proto into the overall msg proto
@@ -398,6 +400,9 @@ class DeltaGenerator(
             if element_height is not None:
                 msg.metadata.element_dimension_spec.height = element_height
 
+            if proto_type in _ELEMENT_TYPES_WITH_DATA_SETS:
+                _enqueue_data_sets(msg_el_proto, proto_type)
+
             _enqueue_message(msg)
             msg_was_enqueued = True
 
@@ -471,7 +476,7 @@ class DeltaGenerator(
 
         return block_dg
 
-    def legacy_add_rows(self, data=None, **kwargs):
+    def legacy_add_rows(self, data=None, max_rows=None, **kwargs):
         """Concatenate a dataframe to the bottom of the current one.
 
         Parameters
@@ -480,6 +485,12 @@ class DeltaGenerator(
         or None
             Table to concat. Optional.
 
+        max_rows : int or None
+            If set, the element keeps only its last max_rows rows, and drops
+            the oldest ones as new rows are added. Use this for charts that
+            are updated for as long as the app runs, so that they don't grow
+            forever. Optional.
+
         **kwargs : pandas.DataFrame, numpy.ndarray, Iterable, dict, or None
             The named dataset to concat. Optional. You can only pass in 1
             dataset (including the one in the data parameter).
@@ -522,6 +533,12 @@ class DeltaGenerator(
         ... }),
         >>> my_chart.add_rows(some_fancy_name=df2)  # <-- name used as keyword
 
+        To keep only the most recent rows of a chart that is updated in a loop:
+
+        >>> my_chart = st.line_chart(df1)
+        >>> while True:
+        ...     my_chart.add_rows(get_new_rows(), max_rows=1000)
+
         """
         if self._root_container is None or self._cursor is None:
             return self
@@ -546,7 +563,7 @@ class DeltaGenerator(
         # (for example, st.line_chart() without any args), call the original
         # st.foo() element with new data instead of doing an add_rows().
         if (
-            self._cursor.props["delta_type"] in DELTA_TYPES_THAT_MELT_DATAFRAMES
+            self._cursor.props["delta_type"] in DELTA_TYPES_THAT_FOLD_DATAFRAMES
             and self._cursor.props["last_index"] is None
         ):
             # IMPORTANT: This assumes delta types and st method names always
@@ -556,9 +573,13 @@ class DeltaGenerator(
             st_method(data, **kwargs)
             return
 
-        data, self._cursor.props["last_index"] = _maybe_melt_data_for_add_rows(
-            data, self._cursor.props["delta_type"], self._cursor.props["last_index"]
+        _check_max_rows(max_rows)
+        delta_type = self._cursor.props["delta_type"]
+        last_index = self._cursor.props["last_index"]
+        data, last_index, max_rows = _maybe_prep_data_for_add_rows(
+            data, delta_type, last_index, max_rows
         )
+        self._cursor.props["last_index"] = last_index
 
         msg = ForwardMsg_pb2.ForwardMsg()
         msg.metadata.delta_path[:] = self._cursor.delta_path
@@ -571,11 +592,14 @@ class DeltaGenerator(
             msg.delta.add_rows.name = name
             msg.delta.add_rows.has_name = True
 
+        if max_rows is not None:
+            msg.delta.add_rows.max_rows = max_rows
+
         _enqueue_message(msg)
 
         return self
 
-    def arrow_add_rows(self, data=None, **kwargs):
+    def arrow_add_rows(self, data=None, max_rows=None, **kwargs):
         if self._root_container is None or self._cursor is None:
             return self
 
@@ -599,7 +623,7 @@ class DeltaGenerator(
         # (for example, st._arrow_line_chart() without any args), call the original
         # st.foo() element with new data instead of doing a arrow_add_rows().
         if (
-            self._cursor.props["delta_type"] in ARROW_DELTA_TYPES_THAT_MELT_DATAFRAMES
+            self._cursor.props["delta_type"] in ARROW_DELTA_TYPES_THAT_FOLD_DATAFRAMES
             and self._cursor.props["last_index"] is None
         ):
             # IMPORTANT: This assumes delta types and st method names always
@@ -609,9 +633,13 @@ class DeltaGenerator(
             st_method(data, **kwargs)
             return
 
-        data, self._cursor.props["last_index"] = _maybe_melt_data_for_add_rows(
-            data, self._cursor.props["delta_type"], self._cursor.props["last_index"]
+        _check_max_rows(max_rows)
+        delta_type = self._cursor.props["delta_type"]
+        last_index = self._cursor.props["last_index"]
+        data, last_index, max_rows = _maybe_prep_data_for_add_rows(
+            data, delta_type, last_index, max_rows
         )
+        self._cursor.props["last_index"] = last_index
 
         msg = ForwardMsg_pb2.ForwardMsg()
         msg.metadata.delta_path[:] = self._cursor.delta_path
@@ -625,20 +653,33 @@ class DeltaGenerator(
             msg.delta.arrow_add_rows.name = name
             msg.delta.arrow_add_rows.has_name = True
 
+        if max_rows is not None:
+            msg.delta.arrow_add_rows.max_rows = max_rows
+
         _enqueue_message(msg)
 
         return self
 
 
-def _maybe_melt_data_for_add_rows(data, delta_type, last_index):
+def _check_max_rows(max_rows):
+    if max_rows is None:
+        return
+
+    if isinstance(max_rows, bool) or not isinstance(max_rows, int) or max_rows < 1:
+        raise StreamlitAPIException(
+            "max_rows must be a positive integer, not %s." % repr(max_rows)
+        )
+
+
+def _maybe_prep_data_for_add_rows(data, delta_type, last_index, max_rows=None):
     import pandas as pd
 
     # For some delta types we have to reshape the data structure
     # otherwise the input data and the actual data used
     # by vega_lite will be different and it will throw an error.
     if (
-        delta_type in DELTA_TYPES_THAT_MELT_DATAFRAMES
-        or delta_type in ARROW_DELTA_TYPES_THAT_MELT_DATAFRAMES
+        delta_type in DELTA_TYPES_THAT_FOLD_DATAFRAMES
+        or delta_type in ARROW_DELTA_TYPES_THAT_FOLD_DATAFRAMES
     ):
         if not isinstance(data, pd.DataFrame):
             data = type_util.convert_anything_to_df(data)
@@ -662,13 +703,16 @@ def _maybe_melt_data_for_add_rows(data, delta_type, last_index):
             data.index = pd.RangeIndex(start=start, stop=stop, step=old_step)
             last_index = stop - 1
 
-        index_name = data.index.name
-        if index_name is None:
-            index_name = "index"
+        # Match the layout of the chart's data: the index as the first column,
+        # and string column names.
+        data = data.reset_index()
+        data.columns = [str(column) for column in data.columns]
 
-        data = pd.melt(data.reset_index(), id_vars=[index_name])
+    # Don't send rows that would be dropped right away.
+    if max_rows is not None and isinstance(data, pd.DataFrame):
+        data = data.iloc[-max_rows:]
 
-    return data, last_index
+    return data, last_index, max_rows
 
 
 def _get_pandas_index_attr(data, attr):
@@ -702,3 +746,35 @@ def _enqueue_message(msg):
         raise NoSessionContext()
 
     ctx.enqueue(msg)
+
+
+# Element types whose named datasets can be sent as DataSet messages, and the
+# DataSet field that holds their data.
+_ELEMENT_TYPES_WITH_DATA_SETS = {
+    "vega_lite_chart": "data_frame",
+    "arrow_vega_lite_chart": "arrow",
+}
+
+
+def _enqueue_data_sets(element_proto, proto_type):
+    """Enqueue the large named datasets of a chart as DataSet messages, and
+    replace their data with the ID of their DataSet.
+
+    A DataSet's ID is a hash of its data, so charts of the same data refer to
+    the same DataSet. Since DataSets are large ForwardMsgs of their own, the
+    server's ForwardMsgCache sends the browser a reference to each one that it
+    already has, rather than its data.
+    """
+    min_size = config.get_option("global.minCachedMessageSize")
+    data_field = _ELEMENT_TYPES_WITH_DATA_SETS[proto_type]
+    for dataset in element_proto.datasets:
+        if dataset.data.ByteSize() < min_size:
+            continue
+
+        msg = ForwardMsg_pb2.ForwardMsg()
+        msg.data_set.id = hashlib.md5(dataset.data.SerializeToString()).hexdigest()
+        getattr(msg.data_set, data_field).CopyFrom(dataset.data)
+        _enqueue_message(msg)
+
+        dataset.ClearField("data")
+        dataset.data_set_id = msg.data_set.id
@@ -12,16 +12,35 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from collections import Iterable
-from typing import Any, Dict, List, Optional, Union, cast
-
+import functools
+import hashlib
+import re
+import types
+from collections import Iterable, defaultdict
+from typing import (
+    Any,
+    Callable,
+    DefaultDict,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
+
+import numpy as np
 from numpy import ndarray
 from pandas import DataFrame
 from pandas.io.formats.style import Styler
 
 import streamlit
+from streamlit import config
 from streamlit import type_util
+from streamlit.arrow_table_manager import arrow_table_manager
 from streamlit.proto.Arrow_pb2 import Arrow as ArrowProto
+from streamlit.proto.Arrow_pb2 import Styler as StylerProto
 
 Data = Optional[Union[DataFrame, Styler, ndarray, Iterable, Dict[str, List[Any]]]]
 
@@ -37,7 +56,7 @@ class ArrowMixin:
 
         Parameters
         ----------
-        data : pandas.DataFrame, pandas.Styler, numpy.ndarray, Iterable, dict, or None
+        data : pandas.DataFrame, pandas.Styler, pyarrow.Table, numpy.ndarray, Iterable, dict, or None
             The data to display.
 
             If 'data' is a pandas.Styler, it will be used to style its
@@ -76,7 +95,11 @@ class ArrowMixin:
         default_uuid = str(hash(delta_path))
 
         proto = ArrowProto()
-        marshall(proto, data, default_uuid)
+        page_size = config.get_option("server.dataFramePageSize")
+        if page_size > 0 and not type_util.is_pandas_styler(data):
+            _marshall_paged(proto, data, page_size, delta_path)
+        else:
+            marshall(proto, data, default_uuid)
         return cast(
             "streamlit.delta_generator.DeltaGenerator",
             self.dg._enqueue(
@@ -94,7 +117,7 @@ class ArrowMixin:
 
         Parameters
         ----------
-        data : pandas.DataFrame, pandas.Styler, numpy.ndarray, Iterable, dict, or None
+        data : pandas.DataFrame, pandas.Styler, pyarrow.Table, numpy.ndarray, Iterable, dict, or None
             The table data.
 
         Example
@@ -133,7 +156,7 @@ def marshall(proto: ArrowProto, data: Data, default_uuid: Optional[str] = None)
     proto : proto.Arrow
         Output. The protobuf for Streamlit Arrow proto.
 
-    data : pandas.DataFrame, pandas.Styler, numpy.ndarray, Iterable, dict, or None
+    data : pandas.DataFrame, pandas.Styler, pyarrow.Table, numpy.ndarray, Iterable, dict, or None
         Something that is or can be converted to a dataframe.
 
     default_uuid : Optional[str]
@@ -150,10 +173,67 @@ def marshall(proto: ArrowProto, data: Data, default_uuid: Optional[str] = None)
         ), "Default UUID must be a string for Styler data."
         _marshall_styler(proto, data, default_uuid)
 
+    if type_util.is_arrow_compatible(data):
+        # Serialize Arrow data as is, rather than through pandas.
+        table = type_util.convert_arrow_compatible_to_table(data)
+        proto.data = type_util.pyarrow_table_to_bytes(
+            type_util.dictionary_encode_strings(table)
+        )
+        return
+
     df = type_util.convert_anything_to_df(data)
     proto.data = type_util.data_frame_to_bytes(df)
 
 
+def _marshall_paged(
+    proto: ArrowProto, data: Data, page_size: int, coordinates: str
+) -> None:
+    """Marshall data into an Arrow proto that holds only its first page of rows,
+    if it has more than one page.
+
+    The whole table is then kept in arrow_table_manager, for the frontend to
+    fetch the other pages from.
+
+    Parameters
+    ----------
+    proto : proto.Arrow
+        Output. The protobuf for Streamlit Arrow proto.
+
+    data : pandas.DataFrame, pyarrow.Table, numpy.ndarray, Iterable, dict, or None
+        Something that is or can be converted to a dataframe.
+
+    page_size : int
+        The number of rows in each page.
+
+    coordinates : str
+        The delta path of the element, so that the table it replaces is
+        dropped.
+
+    """
+    import pyarrow as pa
+
+    if type_util.is_arrow_compatible(data):
+        table = type_util.convert_arrow_compatible_to_table(data)
+    else:
+        table = pa.Table.from_pandas(type_util.convert_anything_to_df(data))
+
+    if table.num_rows <= page_size:
+        proto.data = type_util.pyarrow_table_to_bytes(
+            type_util.dictionary_encode_strings(table)
+        )
+        return
+
+    proto.table_id = arrow_table_manager.add(table, coordinates)
+    proto.num_rows = table.num_rows
+    proto.page_size = page_size
+    # Each page is dictionary-encoded on its own, so that it only holds the
+    # values of its own rows.
+    first_page = type_util.slice_pyarrow_table(table, 0, page_size)
+    proto.data = type_util.pyarrow_table_to_bytes(
+        type_util.dictionary_encode_strings(first_page)
+    )
+
+
 def _marshall_styler(proto: ArrowProto, styler: Styler, default_uuid: str) -> None:
     """Marshall pandas.Styler into an Arrow proto.
 
@@ -171,22 +251,40 @@ def _marshall_styler(proto: ArrowProto, styler: Styler, default_uuid: str) -> No
     """
     # pandas.Styler uuid should be set before _compute is called.
     _marshall_uuid(proto, styler, default_uuid)
+    _marshall_caption(proto, styler)
 
     # We're using protected members of pandas.Styler to get styles,
     # which is not ideal and could break if the interface changes.
-    styler._compute()
-
-    # In Pandas 1.3.0, styler._translate() signature was changed.
-    # 2 arguments were added: sparse_index and sparse_columns.
-    # The functionality that they provide is not yet supported.
     if type_util.is_pandas_version_less_than("1.3.0"):
+        styler._compute()
         pandas_styles = styler._translate()
-    else:
-        pandas_styles = styler._translate(False, False)
+        _marshall_styles(proto, styler, pandas_styles)
+        _marshall_display_values(proto, styler.data, pandas_styles)
+        return
+
+    # In Pandas >= 1.3.0, the computed styles and the cell formatters are
+    # read from the Styler, instead of rendering the whole table with
+    # styler._translate(), which formats the display value of every cell.
+    formatters = _get_custom_formatters(styler)
+
+    key = _get_styler_key(styler, formatters)
+    if key is not None:
+        cached_styler = type_util.arrow_bytes_cache.get(key)
+        if cached_styler is not None:
+            proto.styler.MergeFromString(cached_styler)
+            return
 
-    _marshall_caption(proto, styler)
-    _marshall_styles(proto, styler, pandas_styles)
-    _marshall_display_values(proto, styler.data, pandas_styles)
+    styler._compute()
+    _marshall_computed_styles(proto, styler)
+    _marshall_custom_display_values(proto, styler.data, formatters)
+
+    if key is not None:
+        cached_styler = StylerProto(
+            styles=proto.styler.styles,
+            cell_classes=proto.styler.cell_classes,
+            display_values=proto.styler.display_values,
+        )
+        type_util.arrow_bytes_cache.set(key, cached_styler.SerializeToString())
 
 
 def _marshall_uuid(proto: ArrowProto, styler: Styler, default_uuid: str) -> None:
@@ -241,30 +339,212 @@ def _marshall_styles(proto: ArrowProto, styler: Styler, styles: Dict[str, Any])
         pandas.Styler translated styles.
 
     """
+    table_styles = _trim_pandas_styles(styles.get("table_styles", []))
+    cellstyle = _trim_pandas_styles(styles.get("cellstyle", []))
+    cell_styles = [_parse_cell_style(style) for style in cellstyle]
+    _marshall_css(proto, styler, table_styles, cell_styles)
+
+
+def _marshall_computed_styles(proto: ArrowProto, styler: Styler) -> None:
+    """Marshall the styles of a computed pandas.Styler into an Arrow proto,
+    without translating the Styler.
+
+    Requires Pandas >= 1.3.0, where styler.ctx holds (property, value) pairs.
+
+    Parameters
+    ----------
+    proto : proto.Arrow
+        Output. The protobuf for Streamlit Arrow proto.
+
+    styler : pandas.Styler
+        Helps style a DataFrame or Series according to the data with HTML and CSS.
+
+    """
+    # Like styler._translate(), split table styles with several selectors
+    # into one style per selector.
+    table_styles = [
+        {"selector": selector.strip(), "props": style["props"]}
+        for style in styler.table_styles or []
+        for selector in style["selector"].split(",")
+    ]
+    table_styles = _trim_pandas_styles(table_styles)
+
+    cells_by_props: DefaultDict[Tuple[Any, ...], List[Tuple[int, int]]]
+    cells_by_props = defaultdict(list)
+    for cell, props in styler.ctx.items():
+        if any(any(prop) for prop in props):
+            cells_by_props[tuple(props)].append(cell)
+
+    cell_styles = [
+        _CellStyle(
+            declaration_block=_pandas_props_to_css(props),
+            cells=np.array(cells, dtype=np.int64),
+            other_selectors=[],
+        )
+        for props, cells in cells_by_props.items()
+    ]
+    _marshall_css(proto, styler, table_styles, cell_styles)
+
+
+class _CellStyle(NamedTuple):
+    """The declarations of a pandas.Styler cell style, and what they apply to."""
+
+    declaration_block: str
+
+    # (row, col) pairs of the cells that the style applies to.
+    cells: ndarray
+
+    # Selectors that aren't plain cell selectors.
+    other_selectors: List[str]
+
+
+def _marshall_css(
+    proto: ArrowProto,
+    styler: Styler,
+    table_styles: List[Dict[str, Any]],
+    cell_styles: List[_CellStyle],
+) -> None:
+    """Marshall pandas.Styler table and cell styles into an Arrow proto."""
     css_rules = []
 
-    if "table_styles" in styles:
-        table_styles = styles["table_styles"]
-        table_styles = _trim_pandas_styles(table_styles)
-        for style in table_styles:
-            # styles in "table_styles" have a space
-            # between the uuid and selector.
-            rule = _pandas_style_to_css(
-                "table_styles", style, styler.uuid, separator=" "
-            )
-            css_rules.append(rule)
-
-    if "cellstyle" in styles:
-        cellstyle = styles["cellstyle"]
-        cellstyle = _trim_pandas_styles(cellstyle)
-        for style in cellstyle:
-            rule = _pandas_style_to_css("cell_style", style, styler.uuid)
-            css_rules.append(rule)
+    for style in table_styles:
+        # styles in "table_styles" have a space
+        # between the uuid and selector.
+        rule = _pandas_style_to_css("table_styles", style, styler.uuid, separator=" ")
+        css_rules.append(rule)
+
+    css_rules.extend(
+        _marshall_cell_classes(proto, styler.uuid, cell_styles, styler.data.shape)
+    )
 
     if len(css_rules) > 0:
         proto.styler.styles = "\n".join(css_rules)
 
 
+# Matches a comma-separated list of cell selectors, like "row0_col1,row2_col3".
+_CELL_SELECTORS_RE = re.compile(r"row\d+_col\d+(?:,row\d+_col\d+)*")
+_CELL_SELECTOR_RE = re.compile(r"row(\d+)_col(\d+)")
+
+
+def _parse_cell_style(style: Dict[str, Any]) -> _CellStyle:
+    """Parse a pandas.Styler translated cell style.
+
+    All of the style's cell selectors are checked and parsed at once, rather
+    than one selector at a time.
+    """
+    cell_selectors = _get_cell_selectors("cell_style", style)
+
+    joined_selectors = ",".join(cell_selectors)
+    if _CELL_SELECTORS_RE.fullmatch(joined_selectors):
+        cells = _parse_cell_selectors(joined_selectors)
+        other_selectors = []
+    else:
+        matched = [s for s in cell_selectors if _CELL_SELECTOR_RE.fullmatch(s)]
+        cells = _parse_cell_selectors(",".join(matched))
+        other_selectors = [
+            s for s in cell_selectors if not _CELL_SELECTOR_RE.fullmatch(s)
+        ]
+
+    return _CellStyle(
+        declaration_block=_pandas_props_to_css(style["props"]),
+        cells=cells,
+        other_selectors=other_selectors,
+    )
+
+
+def _marshall_cell_classes(
+    proto: ArrowProto,
+    uuid: str,
+    cell_styles: List[_CellStyle],
+    shape: Tuple[int, int],
+) -> List[str]:
+    """Marshall pandas.Styler cell styles into an Arrow proto, as CSS classes.
+
+    Cells with the same declarations share a single class, and the class of
+    each cell is sent as an Arrow table, instead of sending one CSS rule per
+    styled cell. Selectors that don't point to a single cell are sent as CSS
+    rules of their own, as before.
+
+    Parameters
+    ----------
+    proto : proto.Arrow
+        Output. The protobuf for Streamlit Arrow proto.
+
+    uuid : str
+        pandas.Styler uuid.
+
+    cell_styles : list of _CellStyle
+        pandas.Styler cell styles, without empty styles.
+
+    shape : tuple of int
+        The number of rows and columns of the styled DataFrame.
+
+    Returns
+    -------
+    list of str
+        The CSS rules of the classes, and of the other selectors.
+
+    """
+    import pyarrow as pa
+
+    nrows, ncols = shape
+    cell_classes = np.full((nrows, ncols), -1, dtype=np.int32)
+    class_indices: Dict[str, int] = {}
+    css_rules = []
+
+    for style in cell_styles:
+        declaration_block = style.declaration_block
+        other_selectors = list(style.other_selectors)
+
+        rows, cols = style.cells[:, 0], style.cells[:, 1]
+        in_bounds = (rows < nrows) & (cols < ncols)
+        rows, cols = rows[in_bounds], cols[in_bounds]
+
+        # A cell can only have one class, so a cell that's already styled gets
+        # an ID selector instead, and keeps the declarations of both styles.
+        is_styled = cell_classes[rows, cols] >= 0
+        other_selectors.extend(
+            f"row{row}_col{col}" for row, col in zip(rows[is_styled], cols[is_styled])
+        )
+        rows, cols = rows[~is_styled], cols[~is_styled]
+
+        if len(rows) > 0:
+            class_index = class_indices.get(declaration_block)
+            if class_index is None:
+                class_index = len(class_indices)
+                class_indices[declaration_block] = class_index
+                css_rules.append(
+                    f".T_{uuid}style{class_index} {{ {declaration_block} }}"
+                )
+            cell_classes[rows, cols] = class_index
+
+        if len(other_selectors) > 0:
+            selector = ", ".join(f"#T_{uuid}{s}" for s in other_selectors)
+            css_rules.append(f"{selector} {{ {declaration_block} }}")
+
+    if len(class_indices) > 0:
+        # The smallest integer type that holds every class index.
+        cell_classes = cell_classes.astype(np.min_scalar_type(-len(class_indices)))
+        table = pa.Table.from_arrays(
+            [pa.array(column, mask=column < 0) for column in cell_classes.T],
+            names=[str(col) for col in range(ncols)],
+        )
+        proto.styler.cell_classes = type_util.pyarrow_table_to_bytes(table)
+
+    return css_rules
+
+
+def _parse_cell_selectors(selectors: str) -> ndarray:
+    """Parse comma-separated cell selectors into an array of (row, col) pairs.
+
+    All of the numbers are parsed at once, rather than one selector at a time.
+    """
+    if not selectors:
+        return np.empty((0, 2), dtype=np.int64)
+    numbers = selectors.replace("row", "").replace("_col", " ").replace(",", " ")
+    return np.array(numbers.split(), dtype=np.int64).reshape(-1, 2)
+
+
 def _trim_pandas_styles(styles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Filter out empty styles.
 
@@ -303,13 +583,40 @@ def _pandas_style_to_css(
         A string separator used between table and cell selectors.
 
     """
-    declarations = []
-    for css_property, css_value in style["props"]:
-        declaration = css_property.strip() + ": " + css_value.strip()
-        declarations.append(declaration)
-
     table_selector = f"#T_{uuid}"
+    cell_selectors = _get_cell_selectors(style_type, style)
+
+    selectors = []
+    for cell_selector in cell_selectors:
+        selectors.append(table_selector + separator + cell_selector)
+    selector = ", ".join(selectors)
+
+    declaration_block = _pandas_props_to_css(style["props"])
+    rule_set = selector + " { " + declaration_block + " }"
+
+    return rule_set
 
+
+def _pandas_props_to_css(props: List[Tuple[str, str]]) -> str:
+    """Convert pandas.Styler translated style props to a CSS declaration block."""
+    return "; ".join(
+        css_property.strip() + ": " + css_value.strip()
+        for css_property, css_value in props
+    )
+
+
+def _get_cell_selectors(style_type: str, style: Dict[str, Any]) -> List[str]:
+    """Return the selectors of a pandas.Styler translated style.
+
+    Parameters
+    ----------
+    style_type : str
+        Either "table_styles" or "cell_style".
+
+    style : dict
+        pandas.Styler translated style.
+
+    """
     # In pandas < 1.1.0
     # translated_style["cellstyle"] has the following shape:
     # [
@@ -332,19 +639,9 @@ def _pandas_style_to_css(
     if style_type == "table_styles" or (
         style_type == "cell_style" and type_util.is_pandas_version_less_than("1.1.0")
     ):
-        cell_selectors = [style["selector"]]
+        return [style["selector"]]
     else:
-        cell_selectors = style["selectors"]
-
-    selectors = []
-    for cell_selector in cell_selectors:
-        selectors.append(table_selector + separator + cell_selector)
-    selector = ", ".join(selectors)
-
-    declaration_block = "; ".join(declarations)
-    rule_set = selector + " { " + declaration_block + " }"
-
-    return rule_set
+        return style["selectors"]
 
 
 def _marshall_display_values(
@@ -380,8 +677,6 @@ def _use_display_values(df: DataFrame, styles: Dict[str, Any]) -> DataFrame:
         pandas.Styler translated styles.
 
     """
-    import re
-
     # If values in a column are not of the same type, Arrow
     # serialization would fail. Thus, we need to cast all values
     # of the dataframe to strings before assigning them display values.
@@ -398,3 +693,177 @@ def _use_display_values(df: DataFrame, styles: Dict[str, Any]) -> DataFrame:
                     new_df.iat[r, c] = str(cell["display_value"])
 
     return new_df
+
+
+def _get_custom_formatters(
+    styler: Styler,
+) -> List[Tuple[Callable[[Any], Any], ndarray]]:
+    """Return the custom cell formatters of a pandas.Styler.
+
+    Cells that aren't in the list use pandas' default formatter, so the
+    frontend can format them itself.
+
+    Parameters
+    ----------
+    styler : pandas.Styler
+        Helps style a DataFrame or Series according to the data with HTML and CSS.
+
+    Returns
+    -------
+    list of (callable, numpy.ndarray)
+        Each formatter, and the (row, col) pairs of the cells it formats.
+
+    """
+    cells_by_formatter: Dict[int, Tuple[Callable[[Any], Any], List[Tuple[int, int]]]]
+    cells_by_formatter = {}
+    for cell, formatter in styler._display_funcs.items():
+        # pandas fills in a default formatter for every cell it renders.
+        if _is_default_formatter(formatter):
+            continue
+        entry = cells_by_formatter.setdefault(id(formatter), (formatter, []))
+        entry[1].append(cell)
+
+    return [
+        (formatter, np.array(cells, dtype=np.int64))
+        for formatter, cells in cells_by_formatter.values()
+    ]
+
+
+def _is_default_formatter(formatter: Callable[[Any], Any]) -> bool:
+    return (
+        isinstance(formatter, functools.partial)
+        and getattr(formatter.func, "__name__", None) == "_default_formatter"
+    )
+
+
+def _get_styler_key(
+    styler: Styler, formatters: List[Tuple[Callable[[Any], Any], ndarray]]
+) -> Optional[str]:
+    """Return a key for the marshalled styles and display values of a
+    pandas.Styler, or None if the Styler can't be hashed.
+
+    The key is a hash of the Styler's data, of the functions it applies, and
+    of its formatters, so that an unchanged Styler is only rendered once.
+    """
+    from pandas.util import hash_pandas_object
+
+    from streamlit import hashing
+
+    hasher = hashlib.new("md5")
+    try:
+        # The whole DataFrame is hashed, rather than the sample of rows that
+        # st.cache hashes for large DataFrames.
+        hasher.update(hash_pandas_object(styler.data).values.tobytes())
+        hashing.update_hash(
+            (
+                list(styler.data.columns),
+                list(styler.data.dtypes),
+                styler.uuid,
+                styler.table_styles,
+                _get_fingerprint(styler._todo),
+                _get_fingerprint(formatters),
+            ),
+            hasher=hasher,
+            hash_reason=hashing.HashReason.CACHING_FUNC_OUTPUT,
+            hash_source=_marshall_styler,
+        )
+    except Exception:
+        return None
+
+    return "styler-%s" % hasher.hexdigest()
+
+
+# How deep _get_fingerprint looks into nested functions and containers.
+_MAX_FINGERPRINT_DEPTH = 10
+
+
+def _get_fingerprint(obj: Any, depth: int = 0) -> Any:
+    """Return a hashable description of obj, where functions are described
+    by their code and by the values they close over.
+
+    st.cache's hasher identifies functions from outside the app's folder by
+    their name, but the formatters and styling functions that pandas builds
+    are closures that only differ by the values they close over.
+    """
+    if depth > _MAX_FINGERPRINT_DEPTH:
+        return obj
+
+    depth += 1
+    if isinstance(obj, functools.partial):
+        return (
+            _get_fingerprint(obj.func, depth),
+            _get_fingerprint(obj.args, depth),
+            _get_fingerprint(obj.keywords, depth),
+        )
+    if isinstance(obj, types.FunctionType):
+        closure = []
+        for cell in obj.__closure__ or ():
+            try:
+                closure.append(_get_fingerprint(cell.cell_contents, depth))
+            except ValueError:
+                # The cell is empty.
+                closure.append(None)
+        return (
+            obj,
+            _get_code_fingerprint(obj.__code__),
+            closure,
+            _get_fingerprint(obj.__defaults__, depth),
+            _get_fingerprint(obj.__kwdefaults__, depth),
+        )
+    if isinstance(obj, (list, tuple)):
+        return [_get_fingerprint(x, depth) for x in obj]
+    if isinstance(obj, dict):
+        return {k: _get_fingerprint(v, depth) for k, v in obj.items()}
+    return obj
+
+
+def _get_code_fingerprint(code: types.CodeType) -> Tuple[Any, ...]:
+    return (
+        code.co_code,
+        code.co_names,
+        tuple(
+            _get_code_fingerprint(const) if isinstance(const, types.CodeType) else const
+            for const in code.co_consts
+        ),
+    )
+
+
+def _marshall_custom_display_values(
+    proto: ArrowProto,
+    df: DataFrame,
+    formatters: List[Tuple[Callable[[Any], Any], ndarray]],
+) -> None:
+    """Marshall the display values of the cells with custom formatters into
+    an Arrow proto.
+
+    The display values are a copy of the source table where the other cells
+    are null, and they aren't sent at all if no cell has a custom formatter.
+
+    Parameters
+    ----------
+    proto : proto.Arrow
+        Output. The protobuf for Streamlit Arrow proto.
+
+    df : pandas.DataFrame
+        A dataframe with original values.
+
+    formatters : list of (callable, numpy.ndarray)
+        The custom cell formatters, from _get_custom_formatters.
+
+    """
+    if len(formatters) == 0:
+        return
+
+    nrows, ncols = df.shape
+    display_values = np.full((nrows, ncols), None, dtype=object)
+    for formatter, cells in formatters:
+        rows, cols = cells[:, 0], cells[:, 1]
+        in_bounds = (rows < nrows) & (cols < ncols)
+        rows, cols = rows[in_bounds], cols[in_bounds]
+        for col in np.unique(cols):
+            col_rows = rows[cols == col]
+            values = df.iloc[col_rows, col].tolist()
+            display_values[col_rows, col] = [str(formatter(x)) for x in values]
+
+    new_df = DataFrame(display_values, index=df.index, columns=df.columns)
+    proto.styler.display_values = type_util.data_frame_to_bytes(new_df)
@@ -18,7 +18,7 @@ a nice JSON schema for expressing graphs and charts."""
 
 from datetime import date
 from enum import Enum
-from typing import cast
+from typing import List, Optional, cast
 
 import altair as alt
 import pandas as pd
@@ -32,7 +32,11 @@ from streamlit.proto.ArrowVegaLiteChart_pb2 import (
 )
 
 from .arrow import Data
-from .utils import last_index_for_melted_dataframes
+from .utils import (
+    escape_field_name,
+    last_index_for_melted_dataframes,
+    prep_chart_data,
+)
 
 
 class ChartType(Enum):
@@ -48,6 +52,7 @@ class ArrowAltairMixin:
         width: int = 0,
         height: int = 0,
         use_container_width: bool = True,
+        max_points: Optional[int] = None,
     ) -> "streamlit.delta_generator.DeltaGenerator":
         """Display a line chart.
 
@@ -61,7 +66,7 @@ class ArrowAltairMixin:
 
         Parameters
         ----------
-        data : pandas.DataFrame, pandas.Styler, numpy.ndarray, Iterable, dict or None
+        data : pandas.DataFrame, pandas.Styler, pyarrow.Table, numpy.ndarray, Iterable, dict or None
             Data to be plotted.
 
         width : int
@@ -74,6 +79,13 @@ class ArrowAltairMixin:
             If True, set the chart width to the column width. This takes
             precedence over the width argument.
 
+        max_points : int or None
+            The max number of points to draw for each series. Longer series
+            are downsampled by keeping the smallest and largest value of each
+            group of consecutive rows, so that their peaks and dips are still
+            drawn. If None, uses the client.maxChartPoints config option. If
+            0, draws every point.
+
         Example
         -------
         >>> chart_data = pd.DataFrame(
@@ -84,7 +96,7 @@ class ArrowAltairMixin:
 
         """
         proto = ArrowVegaLiteChartProto()
-        chart = _generate_chart(ChartType.LINE, data, width, height)
+        chart = _generate_chart(ChartType.LINE, data, width, height, max_points)
         marshall(proto, chart, use_container_width)
         last_index = last_index_for_melted_dataframes(data)
 
@@ -99,6 +111,7 @@ class ArrowAltairMixin:
         width: int = 0,
         height: int = 0,
         use_container_width: bool = True,
+        max_points: Optional[int] = None,
     ) -> "streamlit.delta_generator.DeltaGenerator":
         """Display an area chart.
 
@@ -112,7 +125,7 @@ class ArrowAltairMixin:
 
         Parameters
         ----------
-        data : pandas.DataFrame, pandas.Styler, numpy.ndarray, Iterable, or dict
+        data : pandas.DataFrame, pandas.Styler, pyarrow.Table, numpy.ndarray, Iterable, or dict
             Data to be plotted.
 
         width : int
@@ -125,6 +138,13 @@ class ArrowAltairMixin:
             If True, set the chart width to the column width. This takes
             precedence over the width argument.
 
+        max_points : int or None
+            The max number of points to draw for each series. Longer series
+            are downsampled by keeping the smallest and largest value of each
+            group of consecutive rows, so that their peaks and dips are still
+            drawn. If None, uses the client.maxChartPoints config option. If
+            0, draws every point.
+
         Example
         -------
         >>> chart_data = pd.DataFrame(
@@ -135,7 +155,7 @@ class ArrowAltairMixin:
 
         """
         proto = ArrowVegaLiteChartProto()
-        chart = _generate_chart(ChartType.AREA, data, width, height)
+        chart = _generate_chart(ChartType.AREA, data, width, height, max_points)
         marshall(proto, chart, use_container_width)
         last_index = last_index_for_melted_dataframes(data)
 
@@ -163,7 +183,7 @@ class ArrowAltairMixin:
 
         Parameters
         ----------
-        data : pandas.DataFrame, pandas.Styler, numpy.ndarray, Iterable, or dict
+        data : pandas.DataFrame, pandas.Styler, pyarrow.Table, numpy.ndarray, Iterable, or dict
             Data to be plotted.
 
         width : int
@@ -271,7 +291,11 @@ def _is_date_column(df: pd.DataFrame, name: str) -> bool:
 
 
 def _generate_chart(
-    chart_type: ChartType, data: Data, width: int = 0, height: int = 0
+    chart_type: ChartType,
+    data: Data,
+    width: int = 0,
+    height: int = 0,
+    max_points: Optional[int] = None,
 ) -> Chart:
     """This function uses the chart's type, data columns and indices to figure out the chart's spec."""
     if data is None:
@@ -282,11 +306,10 @@ def _generate_chart(
     if not isinstance(data, pd.DataFrame):
         data = type_util.convert_anything_to_df(data)
 
-    index_name = data.index.name
-    if index_name is None:
-        index_name = "index"
-
-    data = pd.melt(data.reset_index(), id_vars=[index_name])
+    # Bar charts aren't downsampled, since each row is drawn as its own bar.
+    data, index_name, value_columns = prep_chart_data(
+        data, 0 if chart_type == ChartType.BAR else max_points
+    )
 
     if chart_type == ChartType.AREA:
         opacity = {"value": 0.7}
@@ -301,7 +324,8 @@ def _generate_chart(
     x_scale = (
         alt.Scale(type="utc") if _is_date_column(data, index_name) else alt.Undefined
     )
-    y_scale = alt.Scale(type="utc") if _is_date_column(data, "value") else alt.Undefined
+    y_type = _get_value_type(data, value_columns)
+    y_scale = alt.Scale(type="utc") if y_type == "temporal" else alt.Undefined
 
     x_type = alt.Undefined
     # Bar charts should have a discrete (ordinal) x-axis, UNLESS type is date/time
@@ -309,22 +333,44 @@ def _generate_chart(
     if chart_type == ChartType.BAR and not _is_date_column(data, index_name):
         x_type = "ordinal"
 
-    chart = (
-        getattr(
-            alt.Chart(data, width=width, height=height), "mark_" + chart_type.value
-        )()
-        .encode(
-            alt.X(index_name, title="", scale=x_scale, type=x_type),
-            alt.Y("value", title="", scale=y_scale),
-            alt.Color("variable", title="", type="nominal"),
-            alt.Tooltip([index_name, "value", "variable"]),
-            opacity=opacity,
-        )
-        .interactive()
-    )
+    # The data has one column per series, which Vega-Lite folds into
+    # "variable" and "value" fields. This is much less data to send than the
+    # melted dataframe, which repeats the index and the column name of every
+    # value.
+    fold = [escape_field_name(name) for name in value_columns]
+    chart = getattr(
+        alt.Chart(data, width=width, height=height), "mark_" + chart_type.value
+    )().transform_fold(fold, as_=["variable", "value"])
+    if fold != value_columns:
+        # Vega names the folded fields by their escaped names.
+        chart = chart.transform_calculate(variable=_UNESCAPE_VARIABLE_EXPR)
+
+    chart = chart.encode(
+        alt.X(index_name, title="", scale=x_scale, type=x_type),
+        alt.Y("value", title="", scale=y_scale, type=y_type),
+        alt.Color("variable", title="", type="nominal"),
+        alt.Tooltip([index_name, "value:" + y_type, "variable:nominal"]),
+        opacity=opacity,
+    ).interactive()
     return chart
 
 
+_UNESCAPE_VARIABLE_EXPR = r"replace(datum.variable, regexp('\\\\(.)', 'g'), '$1')"
+
+
+def _get_value_type(df: pd.DataFrame, value_columns: List[str]) -> str:
+    """Return the Vega-Lite type of the folded "value" field."""
+    dtypes = df.dtypes.iloc[1:]
+    if all(
+        pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+        for dtype in dtypes
+    ):
+        return "quantitative"
+    if any(_is_date_column(df, name) for name in value_columns):
+        return "temporal"
+    return "nominal"
+
+
 def marshall(
     vega_lite_chart: ArrowVegaLiteChartProto,
     altair_chart: Chart,
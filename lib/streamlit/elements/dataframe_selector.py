@@ -34,7 +34,7 @@ class DataFrameSelectorMixin:
 
         Parameters
         ----------
-        data : pandas.DataFrame, pandas.Styler, numpy.ndarray, Iterable, dict,
+        data : pandas.DataFrame, pandas.Styler, pyarrow.Table, numpy.ndarray, Iterable, dict,
             or None
             The data to display.
 
@@ -91,7 +91,7 @@ class DataFrameSelectorMixin:
 
         Parameters
         ----------
-        data : pandas.DataFrame, pandas.Styler, numpy.ndarray, Iterable, dict,
+        data : pandas.DataFrame, pandas.Styler, pyarrow.Table, numpy.ndarray, Iterable, dict,
             or None
             The table data.
 
@@ -113,7 +113,9 @@ class DataFrameSelectorMixin:
         else:
             return self.dg.legacy_table(data)
 
-    def line_chart(self, data=None, width=0, height=0, use_container_width=True):
+    def line_chart(
+        self, data=None, width=0, height=0, use_container_width=True, max_points=None
+    ):
         """Display a line chart.
 
         This is syntax-sugar around st._arrow_altair_chart. The main difference
@@ -126,7 +128,7 @@ class DataFrameSelectorMixin:
 
         Parameters
         ----------
-        data : pandas.DataFrame, pandas.Styler, numpy.ndarray, Iterable, dict or None
+        data : pandas.DataFrame, pandas.Styler, pyarrow.Table, numpy.ndarray, Iterable, dict or None
             Data to be plotted.
 
         width : int
@@ -139,6 +141,13 @@ class DataFrameSelectorMixin:
             If True, set the chart width to the column width. This takes
             precedence over the width argument.
 
+        max_points : int or None
+            The max number of points to draw for each series. Longer series
+            are downsampled by keeping the smallest and largest value of each
+            group of consecutive rows, so that their peaks and dips are still
+            drawn. If None, uses the client.maxChartPoints config option. If
+            0, draws every point.
+
         Example
         -------
         >>> chart_data = pd.DataFrame(
@@ -149,11 +158,17 @@ class DataFrameSelectorMixin:
 
         """
         if _use_arrow():
-            return self.dg.arrow_line_chart(data, width, height, use_container_width)
+            return self.dg.arrow_line_chart(
+                data, width, height, use_container_width, max_points
+            )
         else:
-            return self.dg.legacy_line_chart(data, width, height, use_container_width)
+            return self.dg.legacy_line_chart(
+                data, width, height, use_container_width, max_points
+            )
 
-    def area_chart(self, data=None, width=0, height=0, use_container_width=True):
+    def area_chart(
+        self, data=None, width=0, height=0, use_container_width=True, max_points=None
+    ):
         """Display an area chart.
 
         This is just syntax-sugar around st._arrow_altair_chart. The main difference
@@ -166,7 +181,7 @@ class DataFrameSelectorMixin:
 
         Parameters
         ----------
-        data : pandas.DataFrame, pandas.Styler, numpy.ndarray, Iterable, or dict
+        data : pandas.DataFrame, pandas.Styler, pyarrow.Table, numpy.ndarray, Iterable, or dict
             Data to be plotted.
 
         width : int
@@ -179,6 +194,13 @@ class DataFrameSelectorMixin:
             If True, set the chart width to the column width. This takes
             precedence over the width argument.
 
+        max_points : int or None
+            The max number of points to draw for each series. Longer series
+            are downsampled by keeping the smallest and largest value of each
+            group of consecutive rows, so that their peaks and dips are still
+            drawn. If None, uses the client.maxChartPoints config option. If
+            0, draws every point.
+
         Example
         -------
         >>> chart_data = pd.DataFrame(
@@ -189,9 +211,13 @@ class DataFrameSelectorMixin:
 
         """
         if _use_arrow():
-            return self.dg.arrow_area_chart(data, width, height, use_container_width)
+            return self.dg.arrow_area_chart(
+                data, width, height, use_container_width, max_points
+            )
         else:
-            return self.dg.legacy_area_chart(data, width, height, use_container_width)
+            return self.dg.legacy_area_chart(
+                data, width, height, use_container_width, max_points
+            )
 
     def bar_chart(self, data=None, width=0, height=0, use_container_width=True):
         """Display a bar chart.
@@ -206,7 +232,7 @@ class DataFrameSelectorMixin:
 
         Parameters
         ----------
-        data : pandas.DataFrame, pandas.Styler, numpy.ndarray, Iterable, or dict
+        data : pandas.DataFrame, pandas.Styler, pyarrow.Table, numpy.ndarray, Iterable, or dict
             Data to be plotted.
 
         width : int
@@ -283,7 +309,7 @@ class DataFrameSelectorMixin:
 
         Parameters
         ----------
-        data : pandas.DataFrame, pandas.Styler, numpy.ndarray, Iterable, dict,
+        data : pandas.DataFrame, pandas.Styler, pyarrow.Table, numpy.ndarray, Iterable, dict,
             or None
             Either the data to be plotted or a Vega-Lite spec containing the
             data (which more closely follows the Vega-Lite API).
@@ -338,15 +364,21 @@ class DataFrameSelectorMixin:
                 data, spec, use_container_width, **kwargs
             )
 
-    def add_rows(self, data=None, **kwargs):
+    def add_rows(self, data=None, max_rows=None, **kwargs):
         """Concatenate a dataframe to the bottom of the current one.
 
         Parameters
         ----------
-        data : pandas.DataFrame, pandas.Styler, numpy.ndarray, Iterable, dict,
+        data : pandas.DataFrame, pandas.Styler, pyarrow.Table, numpy.ndarray, Iterable, dict,
         or None
             Table to concat. Optional.
 
+        max_rows : int or None
+            If set, the element keeps only its last max_rows rows, and drops
+            the oldest ones as new rows are added. Use this for charts that
+            are updated for as long as the app runs, so that they don't grow
+            forever. Optional.
+
         **kwargs : pandas.DataFrame, numpy.ndarray, Iterable, dict, or None
             The named dataset to concat. Optional. You can only pass in 1
             dataset (including the one in the data parameter).
@@ -389,11 +421,17 @@ class DataFrameSelectorMixin:
         ... }),
         >>> my_chart.add_rows(some_fancy_name=df2)  # <-- name used as keyword
 
+        To keep only the most recent rows of a chart that is updated in a loop:
+
+        >>> my_chart = st.line_chart(df1)
+        >>> while True:
+        ...     my_chart.add_rows(get_new_rows(), max_rows=1000)
+
         """
         if _use_arrow():
-            return self.dg.arrow_add_rows(data, **kwargs)
+            return self.dg.arrow_add_rows(data, max_rows, **kwargs)
         else:
-            return self.dg.legacy_add_rows(data, **kwargs)
+            return self.dg.legacy_add_rows(data, max_rows, **kwargs)
 
     @property
     def dg(self) -> "streamlit.delta_generator.DeltaGenerator":
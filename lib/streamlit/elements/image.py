@@ -14,17 +14,23 @@
 
 """Image marshalling."""
 
+import hashlib
 import imghdr
 import io
 import mimetypes
-from typing import cast
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Optional, Tuple, cast
 from urllib.parse import urlparse
 
 import numpy as np
+from cachetools import LRUCache
 from PIL import Image, ImageFile
 
 import streamlit
 from streamlit import config
+from streamlit import metrics
 from streamlit.errors import StreamlitAPIException, StreamlitDeprecationWarning
 from streamlit.logger import get_logger
 from streamlit.media_file_manager import media_file_manager
@@ -38,6 +44,12 @@ LOGGER = get_logger(__name__)
 # DPI.
 MAXIMUM_CONTENT_WIDTH = 2 * 730
 
+# Max number of threads that the numpy arrays and PIL images of an image list
+# are encoded on. Pillow and numpy release the GIL while they work, so the
+# images of a list are encoded in parallel.
+_MAX_ENCODING_WORKERS = min(8, os.cpu_count() or 1)
+_executor = ThreadPoolExecutor(max_workers=_MAX_ENCODING_WORKERS)
+
 
 class ImageMixin:
     def image(
@@ -48,7 +60,7 @@ class ImageMixin:
         use_column_width=None,
         clamp=False,
         channels="RGB",
-        output_format="auto",
+        output_format=None,
     ):
         """Display an image or list of images.
 
@@ -86,12 +98,17 @@ class ImageMixin:
             `image[:, :, 0]` is the red channel, `image[:, :, 1]` is green, and
             `image[:, :, 2]` is blue. For images coming from libraries like
             OpenCV you should set this to 'BGR', instead.
-        output_format : 'JPEG', 'PNG', or 'auto'
+        output_format : 'JPEG', 'PNG', 'WEBP', 'auto', or None
             This parameter specifies the format to use when transferring the
-            image data. Photos should use the JPEG format for lossy compression
-            while diagrams should use the PNG format for lossless compression.
-            Defaults to 'auto' which identifies the compression type based
-            on the type and format of the image argument.
+            image data. Photos should use a lossy format like JPEG, while
+            diagrams should use a lossless format like PNG. 'auto' sends
+            numpy arrays and PIL images as WebP, if Pillow supports it:
+            lossless for images with transparency or at most 256 colors, and
+            lossy for other images. Without WebP support, it sends PNG for
+            images with transparency, and JPEG for other images. Image files
+            and bytes are sent as they are, unless they're resized. Defaults
+            to None, which uses the `client.imageFormat` config option
+            ('auto' by default).
 
         Example
         -------
@@ -115,6 +132,9 @@ class ImageMixin:
         elif width <= 0:
             raise StreamlitAPIException("Image width must be positive.")
 
+        if output_format is None:
+            output_format = config.get_option("client.imageFormat")
+
         image_list_proto = ImageListProto()
         marshall_images(
             self.dg._get_delta_path_str(),
@@ -143,29 +163,63 @@ def _image_has_alpha_channel(image):
         return False
 
 
+def _is_webp_supported() -> bool:
+    from PIL import features
+
+    return bool(features.check("webp"))
+
+
 def _format_from_image_type(image, output_format):
     output_format = output_format.upper()
     if output_format == "JPEG" or output_format == "PNG":
         return output_format
 
+    if output_format == "WEBP":
+        if not _is_webp_supported():
+            raise StreamlitAPIException(
+                "This installation of Pillow can't write WebP images."
+            )
+        return output_format
+
     # We are forgiving on the spelling of JPEG
     if output_format == "JPG":
         return "JPEG"
 
+    if _is_webp_supported():
+        return "WEBP"
+
     if _image_has_alpha_channel(image):
         return "PNG"
 
     return "JPEG"
 
 
-def _PIL_to_bytes(image, format="JPEG", quality=100):
+def _is_lossless_webp(image) -> bool:
+    """True if image should be sent as lossless WebP.
+
+    Images with transparency, and images with few colors, like diagrams and
+    charts, are compressed losslessly. Lossless WebP images are also smaller
+    than the PNG images they replace.
+    """
+    return _image_has_alpha_channel(image) or image.getcolors(256) is not None
+
+
+def _PIL_to_bytes(image, format="JPEG", quality=None):
     tmp = io.BytesIO()
 
+    if quality is None:
+        quality = config.get_option("client.imageQuality")
+
     # User must have specified JPEG, so we must convert it
     if format == "JPEG" and _image_has_alpha_channel(image):
         image = image.convert("RGB")
 
-    image.save(tmp, format=format, quality=quality)
+    if format == "WEBP":
+        image.save(
+            tmp, format=format, quality=quality, lossless=_is_lossless_webp(image)
+        )
+    else:
+        image.save(tmp, format=format, quality=quality)
 
     return tmp.getvalue()
 
@@ -208,7 +262,11 @@ def _normalize_to_bytes(data, width, output_format):
     format = _format_from_image_type(image, output_format)
     if output_format.lower() == "auto":
         ext = imghdr.what(None, data)
-        mimetype = mimetypes.guess_type("image.%s" % ext)[0]
+        # Not every system's mimetypes database knows about WebP.
+        if ext == "webp":
+            mimetype = "image/webp"
+        else:
+            mimetype = mimetypes.guess_type("image.%s" % ext)[0]
     else:
         mimetype = "image/" + format.lower()
 
@@ -218,7 +276,7 @@ def _normalize_to_bytes(data, width, output_format):
     if width > 0 and actual_width > width:
         new_height = int(1.0 * actual_height * width / actual_width)
         image = image.resize((width, new_height))
-        data = _PIL_to_bytes(image, format=format, quality=90)
+        data = _PIL_to_bytes(image, format=format)
         mimetype = "image/" + format.lower()
 
     return data, mimetype
@@ -242,11 +300,94 @@ def _clip_image(image, clamp):
     return data
 
 
-def image_to_url(
-    image, width, clamp, channels, output_format, image_id, allow_emoji=False
-):
+class _EncodedImageCache:
+    """A bounded cache of encoded images, keyed by the hash of the pixels of
+    the numpy array or PIL image they were encoded from, and the options they
+    were encoded with.
+
+    This lets every rerun and session that displays the same image, like the
+    frames of a video that repeat, skip encoding it again.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._cache: Optional[LRUCache] = None
+
+    def get(self, key: str) -> Optional[Tuple[bytes, str]]:
+        with self._lock:
+            return self._get_cache().get(key)
+
+    def set(self, key: str, data: bytes, mimetype: str) -> None:
+        with self._lock:
+            cache = self._get_cache()
+            # LRUCache raises ValueError for values bigger than the cache.
+            if len(data) <= cache.maxsize:
+                cache[key] = (data, mimetype)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache = None
+
+    def _get_cache(self) -> LRUCache:
+        # The cache is created lazily, so that it's sized from the config
+        # options the app was started with.
+        if self._cache is None:
+            max_bytes = config.get_option("global.maxImageCacheSize") * 1024 * 1024
+            self._cache = LRUCache(maxsize=max_bytes, getsizeof=lambda v: len(v[0]))
+        return self._cache
+
+
+encoded_image_cache = _EncodedImageCache()
+
+
+def _is_pil_image(image) -> bool:
+    return isinstance(image, ImageFile.ImageFile) or isinstance(image, Image.Image)
+
+
+def _is_pixel_image(image) -> bool:
+    """True if image is a numpy array or PIL image, which we encode."""
+    return type(image) is np.ndarray or _is_pil_image(image)
+
+
+def _get_image_key(image, width, clamp, channels, output_format) -> Optional[str]:
+    """Return the encoded image cache key of a numpy array or PIL image, or
+    None for other images.
+    """
+    hasher = hashlib.md5()
+    if type(image) is np.ndarray and not image.dtype.hasobject:
+        hasher.update(b"ndarray")
+        hasher.update(str((image.dtype.str, image.shape)).encode("utf-8"))
+        hasher.update(np.ascontiguousarray(image).data)
+    elif _is_pil_image(image):
+        hasher.update(b"PIL")
+        hasher.update(str((image.mode, image.size)).encode("utf-8"))
+        hasher.update(image.tobytes())
+        if image.mode == "P":
+            hasher.update(bytes(image.getpalette() or []))
+            hasher.update(str(image.info.get("transparency")).encode("utf-8"))
+    else:
+        return None
+
+    quality = config.get_option("client.imageQuality")
+    hasher.update(str((width, clamp, channels, output_format, quality)).encode("utf-8"))
+    return hasher.hexdigest()
+
+
+def _image_to_bytes(image, width, clamp, channels, output_format):
+    """Encode a PIL image, numpy array, BytesIO or bytes, resized to fit
+    width, and return (data, mimetype).
+
+    The encoded bytes of numpy arrays and PIL images are cached in
+    encoded_image_cache.
+    """
+    key = _get_image_key(image, width, clamp, channels, output_format)
+    if key is not None:
+        cached = encoded_image_cache.get(key)
+        if cached is not None:
+            return cached
+
     # PIL Images
-    if isinstance(image, ImageFile.ImageFile) or isinstance(image, Image.Image):
+    if _is_pil_image(image):
         format = _format_from_image_type(image, output_format)
         data = _PIL_to_bytes(image, format)
 
@@ -272,8 +413,40 @@ def image_to_url(
 
         data = _np_array_to_bytes(data, output_format=output_format)
 
+    # Assume input in bytes.
+    else:
+        data = image
+
+    data, mimetype = _normalize_to_bytes(data, width, output_format)
+
+    image_bytes = metrics.Client.get("streamlit_image_bytes_total")
+    image_bytes.labels(mimetype, "input").inc(_get_num_input_bytes(image))
+    image_bytes.labels(mimetype, "output").inc(len(data))
+
+    if key is not None:
+        encoded_image_cache.set(key, data, mimetype)
+    return data, mimetype
+
+
+def _get_num_input_bytes(image) -> int:
+    """Return the size of an image before it's encoded: the size of the
+    pixels of numpy arrays and PIL images, and of the data of other images.
+    """
+    if type(image) is np.ndarray:
+        return image.nbytes
+    if _is_pil_image(image):
+        width, height = image.size
+        return width * height * len(image.getbands())
+    if isinstance(image, io.BytesIO):
+        return image.getbuffer().nbytes
+    return len(image)
+
+
+def image_to_url(
+    image, width, clamp, channels, output_format, image_id, allow_emoji=False
+):
     # Strings
-    elif isinstance(image, str):
+    if isinstance(image, str):
         # If it's a url, then set the protobuf and continue
         try:
             p = urlparse(image)
@@ -285,7 +458,7 @@ def image_to_url(
         # Finally, see if it's a file.
         try:
             with open(image, "rb") as f:
-                data = f.read()
+                image = f.read()
         except:
             if allow_emoji:
                 # This might be an emoji string, so just pass it to the frontend
@@ -294,11 +467,7 @@ def image_to_url(
                 # Allow OS filesystem errors to raise
                 raise
 
-    # Assume input in bytes.
-    else:
-        data = image
-
-    (data, mimetype) = _normalize_to_bytes(data, width, output_format)
+    data, mimetype = _image_to_bytes(image, width, clamp, channels, output_format)
     this_file = media_file_manager.add(data, mimetype, image_id)
     return this_file.url
 
@@ -345,6 +514,11 @@ def marshall_images(
         len(images),
     )
 
+    # The numpy arrays and PIL images of a list are encoded on the thread
+    # pool. Their files are added, in order, once the whole list is encoded.
+    encode_in_parallel = sum(1 for image in images if _is_pixel_image(image)) > 1
+    pending_imgs: List[Tuple[Any, str, Any]] = []
+
     proto_imgs.width = width
     # Each image in an image list needs to be kept track of at its own coordinates.
     for coord_suffix, (image, caption) in enumerate(zip(images, captions)):
@@ -365,7 +539,23 @@ def marshall_images(
             if image.strip().startswith("<svg"):
                 proto_img.markup = f"data:image/svg+xml,{image}"
                 is_svg = True
-        if not is_svg:
+        if is_svg:
+            continue
+
+        if encode_in_parallel and _is_pixel_image(image):
+            if _is_pil_image(image):
+                # Image files are decoded lazily, and not thread-safely, so
+                # they're decoded here, in case the list has one twice.
+                image.load()
+            future = _executor.submit(
+                _image_to_bytes, image, width, clamp, channels, output_format
+            )
+            pending_imgs.append((proto_img, image_id, future))
+        else:
             proto_img.url = image_to_url(
                 image, width, clamp, channels, output_format, image_id
             )
+
+    for proto_img, image_id, future in pending_imgs:
+        data, mimetype = future.result()
+        proto_img.url = media_file_manager.add(data, mimetype, image_id).url
@@ -26,11 +26,17 @@ import streamlit.elements.legacy_vega_lite as vega_lite
 import altair as alt
 import pandas as pd
 
-from .utils import last_index_for_melted_dataframes
+from .utils import (
+    escape_field_name,
+    last_index_for_melted_dataframes,
+    prep_chart_data,
+)
 
 
 class LegacyAltairMixin:
-    def legacy_line_chart(self, data=None, width=0, height=0, use_container_width=True):
+    def legacy_line_chart(
+        self, data=None, width=0, height=0, use_container_width=True, max_points=None
+    ):
         """Display a line chart.
 
         This is syntax-sugar around st.altair_chart. The main difference
@@ -57,6 +63,13 @@ class LegacyAltairMixin:
             If True, set the chart width to the column width. This takes
             precedence over the width argument.
 
+        max_points : int or None
+            The max number of points to draw for each series. Longer series
+            are downsampled by keeping the smallest and largest value of each
+            group of consecutive rows, so that their peaks and dips are still
+            drawn. If None, uses the client.maxChartPoints config option. If
+            0, draws every point.
+
         Example
         -------
         >>> chart_data = pd.DataFrame(
@@ -72,7 +85,7 @@ class LegacyAltairMixin:
         """
         vega_lite_chart_proto = VegaLiteChartProto()
 
-        chart = generate_chart("line", data, width, height)
+        chart = generate_chart("line", data, width, height, max_points)
         marshall(vega_lite_chart_proto, chart, use_container_width)
         last_index = last_index_for_melted_dataframes(data)
 
@@ -80,7 +93,9 @@ class LegacyAltairMixin:
             "line_chart", vega_lite_chart_proto, last_index=last_index
         )
 
-    def legacy_area_chart(self, data=None, width=0, height=0, use_container_width=True):
+    def legacy_area_chart(
+        self, data=None, width=0, height=0, use_container_width=True, max_points=None
+    ):
         """Display an area chart.
 
         This is just syntax-sugar around st.altair_chart. The main difference
@@ -106,6 +121,13 @@ class LegacyAltairMixin:
             If True, set the chart width to the column width. This takes
             precedence over the width argument.
 
+        max_points : int or None
+            The max number of points to draw for each series. Longer series
+            are downsampled by keeping the smallest and largest value of each
+            group of consecutive rows, so that their peaks and dips are still
+            drawn. If None, uses the client.maxChartPoints config option. If
+            0, draws every point.
+
         Example
         -------
         >>> chart_data = pd.DataFrame(
@@ -121,7 +143,7 @@ class LegacyAltairMixin:
         """
         vega_lite_chart_proto = VegaLiteChartProto()
 
-        chart = generate_chart("area", data, width, height)
+        chart = generate_chart("area", data, width, height, max_points)
         marshall(vega_lite_chart_proto, chart, use_container_width)
         last_index = last_index_for_melted_dataframes(data)
 
@@ -252,7 +274,7 @@ def _is_date_column(df, name):
     return isinstance(column[0], date)
 
 
-def generate_chart(chart_type, data, width=0, height=0):
+def generate_chart(chart_type, data, width=0, height=0, max_points=None):
     if data is None:
         # Use an empty-ish dict because if we use None the x axis labels rotate
         # 90 degrees. No idea why. Need to debug.
@@ -261,11 +283,10 @@ def generate_chart(chart_type, data, width=0, height=0):
     if not isinstance(data, pd.DataFrame):
         data = type_util.convert_anything_to_df(data)
 
-    index_name = data.index.name
-    if index_name is None:
-        index_name = "index"
-
-    data = pd.melt(data.reset_index(), id_vars=[index_name])
+    # Bar charts aren't downsampled, since each row is drawn as its own bar.
+    data, index_name, value_columns = prep_chart_data(
+        data, 0 if chart_type == "bar" else max_points
+    )
 
     if chart_type == "area":
         opacity = {"value": 0.7}
@@ -280,7 +301,8 @@ def generate_chart(chart_type, data, width=0, height=0):
     x_scale = (
         alt.Scale(type="utc") if _is_date_column(data, index_name) else alt.Undefined
     )
-    y_scale = alt.Scale(type="utc") if _is_date_column(data, "value") else alt.Undefined
+    y_type = _get_value_type(data, value_columns)
+    y_scale = alt.Scale(type="utc") if y_type == "temporal" else alt.Undefined
 
     x_type = alt.Undefined
     # Bar charts should have a discrete (ordinal) x-axis, UNLESS type is date/time
@@ -288,20 +310,44 @@ def generate_chart(chart_type, data, width=0, height=0):
     if chart_type == "bar" and not _is_date_column(data, index_name):
         x_type = "ordinal"
 
-    chart = (
-        getattr(alt.Chart(data, width=width, height=height), "mark_" + chart_type)()
-        .encode(
-            alt.X(index_name, title="", scale=x_scale, type=x_type),
-            alt.Y("value", title="", scale=y_scale),
-            alt.Color("variable", title="", type="nominal"),
-            alt.Tooltip([index_name, "value", "variable"]),
-            opacity=opacity,
-        )
-        .interactive()
-    )
+    # The data has one column per series, which Vega-Lite folds into
+    # "variable" and "value" fields. This is much less data to send than the
+    # melted dataframe, which repeats the index and the column name of every
+    # value.
+    fold = [escape_field_name(name) for name in value_columns]
+    chart = getattr(
+        alt.Chart(data, width=width, height=height), "mark_" + chart_type
+    )().transform_fold(fold, as_=["variable", "value"])
+    if fold != value_columns:
+        # Vega names the folded fields by their escaped names.
+        chart = chart.transform_calculate(variable=_UNESCAPE_VARIABLE_EXPR)
+
+    chart = chart.encode(
+        alt.X(index_name, title="", scale=x_scale, type=x_type),
+        alt.Y("value", title="", scale=y_scale, type=y_type),
+        alt.Color("variable", title="", type="nominal"),
+        alt.Tooltip([index_name, "value:" + y_type, "variable:nominal"]),
+        opacity=opacity,
+    ).interactive()
     return chart
 
 
+_UNESCAPE_VARIABLE_EXPR = r"replace(datum.variable, regexp('\\\\(.)', 'g'), '$1')"
+
+
+def _get_value_type(df, value_columns):
+    """Return the Vega-Lite type of the folded "value" field."""
+    dtypes = df.dtypes.iloc[1:]
+    if all(
+        pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+        for dtype in dtypes
+    ):
+        return "quantitative"
+    if any(_is_date_column(df, name) for name in value_columns):
+        return "temporal"
+    return "nominal"
+
+
 def marshall(vega_lite_chart, altair_chart, use_container_width=False, **kwargs):
     import altair as alt
 
@@ -24,6 +24,7 @@ import tzlocal
 import streamlit
 from streamlit import type_util
 from streamlit.logger import get_logger
+from streamlit.proto.DataFrame_pb2 import CellStyle as CellStyleProto
 from streamlit.proto.DataFrame_pb2 import DataFrame as DataFrameProto
 
 LOGGER = get_logger(__name__)
@@ -183,20 +184,35 @@ def _marshall_styles(proto_table_style, df, styler=None):
         display_values = {}
 
     nrows, ncols = df.shape
-    for col in range(ncols):
-        proto_col = proto_table_style.cols.add()
-        for row in range(nrows):
-            proto_cell_style = proto_col.styles.add()
-
-            for css in css_styles.get((row, col), []):
-                proto_css = proto_cell_style.css.add()
-                proto_css.property = css.property
-                proto_css.value = css.value
 
-            display_value = display_values.get((row, col), None)
-            if display_value is not None:
-                proto_cell_style.display_value = display_value
-                proto_cell_style.has_display_value = True
+    # Every cell gets a CellStyle, even if it's empty. An empty CellStyle is
+    # just a tag and a zero length on the wire, so a column's worth of them
+    # is parsed at once, instead of being added one cell at a time.
+    empty_cell_styles = b"\x0a\x00" * nrows
+    for col in range(ncols):
+        proto_table_style.cols.add().MergeFromString(empty_cell_styles)
+
+    # Cells with the same styles share a css_list, so each list is only
+    # serialized once, and then merged into each of its cells.
+    serialized_css_lists = {}
+    for (row, col), css_list in css_styles.items():
+        if row < nrows and col < ncols:
+            serialized_css = serialized_css_lists.get(id(css_list))
+            if serialized_css is None:
+                cell_style = CellStyleProto()
+                for css in css_list:
+                    proto_css = cell_style.css.add()
+                    proto_css.property = css.property
+                    proto_css.value = css.value
+                serialized_css = cell_style.SerializeToString()
+                serialized_css_lists[id(css_list)] = serialized_css
+            proto_table_style.cols[col].styles[row].MergeFromString(serialized_css)
+
+    for (row, col), display_value in display_values.items():
+        if row < nrows and col < ncols and display_value is not None:
+            proto_cell_style = proto_table_style.cols[col].styles[row]
+            proto_cell_style.display_value = display_value
+            proto_cell_style.has_display_value = True
 
 
 def _get_css_styles(translated_style):
@@ -223,8 +239,6 @@ def _get_css_styles(translated_style):
     #   ...
     # ]
 
-    cell_selector_regex = re.compile(r"row(\d+)_col(\d+)")
-
     css_styles = {}
     for cell_style in translated_style["cellstyle"]:
         if type_util.is_pandas_version_less_than("1.1.0"):
@@ -232,26 +246,45 @@ def _get_css_styles(translated_style):
         else:
             cell_selectors = cell_style["selectors"]
 
+        # Every cell with this style shares the same list of declarations.
+        css_declarations = []
+        props = cell_style["props"]
+        for prop in props:
+            if not isinstance(prop, (tuple, list)) or len(prop) != 2:
+                raise RuntimeError('Unexpected cellstyle props "%s"' % prop)
+            name = str(prop[0]).strip()
+            value = str(prop[1]).strip()
+            if name and value:
+                css_declarations.append(CSSStyle(property=name, value=value))
+
+        for row, col in _parse_cell_selectors(cell_selectors):
+            css_styles[(row, col)] = css_declarations
+
+    return css_styles
+
+
+_CELL_SELECTOR_REGEX = re.compile(r"row(\d+)_col(\d+)")
+_CELL_SELECTORS_REGEX = re.compile(r"row\d+_col\d+(?:,row\d+_col\d+)*")
+
+
+def _parse_cell_selectors(cell_selectors):
+    """Parses a list of "row{row}_col{col}" cell selectors into a list of
+    (row, col) tuples.
+
+    The selectors are checked and parsed all at once, rather than with a
+    regex match per selector.
+    """
+    joined_selectors = ",".join(cell_selectors)
+    if not _CELL_SELECTORS_REGEX.fullmatch(joined_selectors):
         for cell_selector in cell_selectors:
-            match = cell_selector_regex.match(cell_selector)
-            if not match:
+            if not _CELL_SELECTOR_REGEX.fullmatch(cell_selector):
                 raise RuntimeError(
                     'Failed to parse cellstyle selector "%s"' % cell_selector
                 )
-            row = int(match.group(1))
-            col = int(match.group(2))
-            css_declarations = []
-            props = cell_style["props"]
-            for prop in props:
-                if not isinstance(prop, (tuple, list)) or len(prop) != 2:
-                    raise RuntimeError('Unexpected cellstyle props "%s"' % prop)
-                name = str(prop[0]).strip()
-                value = str(prop[1]).strip()
-                if name and value:
-                    css_declarations.append(CSSStyle(property=name, value=value))
-            css_styles[(row, col)] = css_declarations
 
-    return css_styles
+    numbers = joined_selectors.replace("row", "").replace("_col", " ")
+    numbers = [int(n) for n in numbers.replace(",", " ").split()]
+    return list(zip(numbers[0::2], numbers[1::2]))
 
 
 def _get_custom_display_values(df, translated_style):
@@ -386,6 +419,7 @@ def _marshall_any_array(pandas_array, proto_array):
     proto_array  - proto.AnyArray (output)
     """
     import numpy as np
+    import pandas as pd
 
     # Convert to np.array as necessary.
     if not hasattr(pandas_array, "dtype"):
@@ -395,22 +429,27 @@ def _marshall_any_array(pandas_array, proto_array):
     if len(pandas_array.shape) != 1:
         raise ValueError("Array must be 1D.")
 
-    # Perform type-conversion based on the array dtype.
+    # Perform type-conversion based on the array dtype. Each conversion is
+    # done on the whole array at once, rather than one element at a time.
     if issubclass(pandas_array.dtype.type, np.floating):
-        proto_array.doubles.data.extend(pandas_array)
+        _marshall_doubles(np.asarray(pandas_array), proto_array.doubles)
     elif issubclass(pandas_array.dtype.type, np.timedelta64):
-        proto_array.timedeltas.data.extend(pandas_array.astype(np.int64))
+        proto_array.timedeltas.data.extend(
+            np.asarray(pandas_array).astype(np.int64).tolist()
+        )
     elif issubclass(pandas_array.dtype.type, np.integer):
-        proto_array.int64s.data.extend(pandas_array)
-    elif pandas_array.dtype == np.bool:
-        proto_array.int64s.data.extend(pandas_array)
-    elif pandas_array.dtype == np.object:
-        proto_array.strings.data.extend(map(str, pandas_array))
+        proto_array.int64s.data.extend(np.asarray(pandas_array).tolist())
+    elif pandas_array.dtype == np.bool_:
+        proto_array.int64s.data.extend(
+            np.asarray(pandas_array).astype(np.int64).tolist()
+        )
+    elif pandas_array.dtype == np.object_:
+        proto_array.strings.data.extend(_to_strings(pandas_array))
     # dtype='string', <class 'pandas.core.arrays.string_.StringDtype'>
     # NOTE: StringDtype is considered experimental.
     # The implementation and parts of the API may change without warning.
     elif pandas_array.dtype.name == "string":
-        proto_array.strings.data.extend(map(str, pandas_array))
+        proto_array.strings.data.extend(_to_strings(pandas_array))
     # Setting a timezone changes (dtype, dtype.type) from
     #   'datetime64[ns]', <class 'numpy.datetime64'>
     # to
@@ -418,11 +457,78 @@ def _marshall_any_array(pandas_array, proto_array):
     elif pandas_array.dtype.name.startswith("datetime64"):
         # Just convert straight to ISO 8601, preserving timezone
         # awareness/unawareness. The frontend will render it correctly.
-        proto_array.datetimes.data.extend(pandas_array.map(datetime.datetime.isoformat))
+        proto_array.datetimes.data.extend(_to_isoformat(pd.DatetimeIndex(pandas_array)))
     else:
         raise NotImplementedError("Dtype %s not understood." % pandas_array.dtype)
 
 
+def _marshall_doubles(array, proto_doubles):
+    """Write a float array into a proto.DoubleArray.
+
+    Repeated doubles are packed on the wire as little-endian IEEE 754 values,
+    so the array's buffer is parsed as is, instead of being added one
+    element at a time.
+    """
+    from google.protobuf.internal.encoder import _VarintBytes
+
+    data = array.astype("<f8", copy=False).tobytes()
+    # Field 1 ("data"), with the length-delimited wire type.
+    proto_doubles.MergeFromString(b"\x0a" + _VarintBytes(len(data)) + data)
+
+
+def _to_strings(pandas_array):
+    """Convert each element of an array to str, like map(str, pandas_array)."""
+    import pandas as pd
+
+    return pd.Series(pandas_array, dtype=object, copy=False).astype(str).tolist()
+
+
+def _to_isoformat(datetime_index):
+    """Format a pandas.DatetimeIndex like datetime.datetime.isoformat does,
+    one element at a time: with microseconds if they aren't zero, and the
+    UTC offset of timezone-aware values.
+    """
+    import numpy as np
+
+    offsets = None
+    if datetime_index.tz is not None:
+        local_index = datetime_index.tz_localize(None)
+        utc_index = datetime_index.tz_convert("UTC").tz_localize(None)
+        offsets = (local_index - utc_index).values
+        datetime_index = local_index
+
+    # datetime.datetime doesn't have nanoseconds, so they're dropped.
+    values = datetime_index.values.astype("datetime64[us]")
+    strings = np.datetime_as_string(values, unit="s").astype(object)
+    has_microseconds = values != values.astype("datetime64[s]")
+    if has_microseconds.any():
+        strings[has_microseconds] = np.datetime_as_string(
+            values[has_microseconds], unit="us"
+        )
+
+    if offsets is not None:
+        offset_seconds = offsets.astype("timedelta64[s]").astype(np.int64)
+        unique_offsets, inverse = np.unique(offset_seconds, return_inverse=True)
+        suffixes = np.array([_format_utc_offset(o) for o in unique_offsets], object)
+        strings = strings + suffixes[inverse]
+
+    # datetime.datetime.isoformat formats NaT as datetime.min, so keep
+    # sending that.
+    strings[datetime_index.isna()] = datetime.datetime.min.isoformat()
+    return strings.tolist()
+
+
+def _format_utc_offset(seconds):
+    """Format a UTC offset like datetime.datetime.isoformat does."""
+    sign = "-" if seconds < 0 else "+"
+    hours, seconds = divmod(abs(int(seconds)), 3600)
+    minutes, seconds = divmod(seconds, 60)
+    offset = "%s%02d:%02d" % (sign, hours, minutes)
+    if seconds:
+        offset += ":%02d" % seconds
+    return offset
+
+
 def add_rows(delta1, delta2, name=None):
     """Concat the DataFrame in delta2 to the DataFrame in delta1.
 
@@ -442,9 +548,16 @@ def add_rows(delta1, delta2, name=None):
         df1.CopyFrom(df2)
         return
 
-    # Copy Data
     if len(df1.data.cols) != len(df2.data.cols):
         raise ValueError("Dataframes have incompatible shapes")
+
+    # Check that the arrays can be concatenated before changing any of them,
+    # since delta1 may be appended to in place.
+    for (col1, col2) in zip(df1.data.cols, df2.data.cols):
+        _check_concat_types(col1, col2, _any_array_len(col1))
+    _check_concat_types(df1.index, df2.index, _index_len(df1.index))
+
+    # Copy Data
     for (col1, col2) in zip(df1.data.cols, df2.data.cols):
         _concat_any_array(col1, col2)
 
@@ -460,6 +573,65 @@ def add_rows(delta1, delta2, name=None):
         _concat_cell_style_array(style_col1, style_col2)
 
 
+def truncate(delta, max_rows, name=None):
+    """Drop the oldest rows of the DataFrame in delta, keeping max_rows rows.
+
+    Parameters
+    ----------
+    delta : Delta
+    max_rows : int
+    name : str or None
+
+    """
+    df = _get_data_frame(delta, name)
+    num_rows_to_drop = _index_len(df.index) - max_rows
+    if num_rows_to_drop <= 0:
+        return
+
+    for col in df.data.cols:
+        del _any_array_data(col)[:num_rows_to_drop]
+
+    _drop_index_rows(df.index, num_rows_to_drop)
+
+    for style_col in df.style.cols:
+        del style_col.styles[:num_rows_to_drop]
+
+
+def _drop_index_rows(index, num_rows):
+    """Drop the first num_rows entries of an index."""
+    index_type = index.WhichOneof("type")
+    if index_type == "plain_index":
+        del _any_array_data(index.plain_index.data)[:num_rows]
+    elif index_type == "range_index":
+        index.range_index.start += num_rows
+    elif index_type == "multi_index":
+        for labels in index.multi_index.labels:
+            del labels.data[:num_rows]
+    elif index_type in (
+        "int_64_index",
+        "float_64_index",
+        "datetime_index",
+        "timedelta_index",
+    ):
+        del getattr(index, index_type).data.data[:num_rows]
+    else:
+        raise NotImplementedError('Cannot truncate "%s" indices.' % index_type)
+
+
+def _check_concat_types(array1, array2, array1_len):
+    """Raise ValueError if array2 can't be concatenated into array1."""
+    if array1_len == 0:
+        return
+
+    type1 = array1.WhichOneof("type")
+    type2 = array2.WhichOneof("type")
+    if type1 != type2:
+        raise ValueError(
+            "Cannot concatenate %(type1)s with %(type2)s."
+            % {"type1": type1, "type2": type2}
+        )
+
+
 def _concat_index(index1, index2):
     """Contact index2 into index1."""
     # Special case if index1 is empty.
@@ -598,3 +770,9 @@ def _any_array_len(any_array):
     array_type = any_array.WhichOneof("type")
     the_array = getattr(any_array, array_type).data
     return len(the_array)
+
+
+def _any_array_data(any_array):
+    """Return the repeated field that holds the elements of an any_array."""
+    array_type = any_array.WhichOneof("type")
+    return getattr(any_array, array_type).data
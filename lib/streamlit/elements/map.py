@@ -19,6 +19,7 @@ import json
 from typing import Any, Dict
 from typing import cast
 
+import numpy as np
 import pandas as pd
 
 import streamlit
@@ -70,7 +71,7 @@ class MapMixin:
 
         """
         map_proto = DeckGlJsonChartProto()
-        map_proto.json = to_deckgl_json(data, zoom)
+        marshall(map_proto, data, zoom)
         map_proto.use_container_width = use_container_width
         return self.dg._enqueue("deck_gl_json_chart", map_proto)
 
@@ -86,6 +87,7 @@ _DEFAULT_MAP["mapStyle"] = "mapbox://styles/mapbox/light-v10"
 
 # Other default parameters for st.map.
 _DEFAULT_COLOR = [200, 30, 0, 160]
+_LAYER_ID = "points"
 _DEFAULT_ZOOM_LEVEL = 12
 _ZOOM_LEVELS = [
     360,
@@ -138,10 +140,16 @@ def _get_zoom_level(distance):
             return i
 
 
-def to_deckgl_json(data, zoom):
+def marshall(map_proto, data, zoom):
+    """Marshall the deck.gl spec of st.map's chart into a DeckGlJsonChart.
 
+    The points' positions aren't part of the JSON spec. They are sent as a
+    binary attribute of the layer, since encoding and parsing millions of
+    coordinates as JSON numbers is many times slower, and larger.
+    """
     if data is None or data.empty:
-        return json.dumps(_DEFAULT_MAP)
+        map_proto.json = json.dumps(_DEFAULT_MAP)
+        return
 
     if "lat" in data:
         lat = "lat"
@@ -182,15 +190,6 @@ def to_deckgl_json(data, zoom):
             longitude_distance = range_lat
         zoom = _get_zoom_level(longitude_distance)
 
-    # "+1" because itertuples includes the row index.
-    lon_col_index = data.columns.get_loc(lon) + 1
-    lat_col_index = data.columns.get_loc(lat) + 1
-    final_data = []
-    for row in data.itertuples():
-        final_data.append(
-            {"lon": float(row[lon_col_index]), "lat": float(row[lat_col_index])}
-        )
-
     default = copy.deepcopy(_DEFAULT_MAP)
     default["initialViewState"]["latitude"] = center_lat
     default["initialViewState"]["longitude"] = center_lon
@@ -198,12 +197,21 @@ def to_deckgl_json(data, zoom):
     default["layers"] = [
         {
             "@@type": "ScatterplotLayer",
-            "getPosition": "@@=[lon, lat]",
+            "id": _LAYER_ID,
             "getRadius": 10,
             "radiusScale": 10,
             "radiusMinPixels": 3,
             "getFillColor": _DEFAULT_COLOR,
-            "data": final_data,
         }
     ]
-    return json.dumps(default)
+    map_proto.json = json.dumps(default)
+
+    binary_data = map_proto.binary_data.add()
+    binary_data.layer_id = _LAYER_ID
+    binary_data.length = len(data)
+    positions = binary_data.attributes.add()
+    positions.accessor = "getPosition"
+    positions.size = 2
+    positions.float64_values = np.column_stack(
+        (data[lon].to_numpy(dtype="<f8"), data[lat].to_numpy(dtype="<f8"))
+    ).tobytes()
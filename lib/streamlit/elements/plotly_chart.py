@@ -14,9 +14,10 @@
 
 """Streamlit support for Plotly charts."""
 
+import base64
 import json
 import urllib.parse
-from typing import cast
+from typing import Any, cast
 
 import streamlit
 from streamlit import caching
@@ -133,39 +134,150 @@ def marshall(proto, figure_or_data, use_container_width, sharing, **kwargs):
     # for their main parameter. I don't like the name, but its best to keep
     # it in sync with what Plotly calls it.
 
-    import plotly.tools
-
-    if type_util.is_type(figure_or_data, "matplotlib.figure.Figure"):
-        figure = plotly.tools.mpl_to_plotly(figure_or_data)
-
-    else:
-        figure = plotly.tools.return_figure_from_figure_or_data(
-            figure_or_data, validate_figure=True
-        )
-
     if not isinstance(sharing, str) or sharing.lower() not in SHARING_MODES:
         raise ValueError("Invalid sharing mode for Plotly chart: %s" % sharing)
 
     proto.use_container_width = use_container_width
 
     if sharing == "streamlit":
-        import plotly.utils
-
         config = dict(kwargs.get("config", {}))
         # Copy over some kwargs to config dict. Plotly does the same in plot().
         config.setdefault("showLink", kwargs.get("show_link", False))
         config.setdefault("linkText", kwargs.get("link_text", False))
 
-        proto.figure.spec = json.dumps(figure, cls=plotly.utils.PlotlyJSONEncoder)
+        proto.figure.spec = _get_spec(figure_or_data)
         proto.figure.config = json.dumps(config)
 
     else:
         url = _plot_to_url_or_load_cached_url(
-            figure, sharing=sharing, auto_open=False, **kwargs
+            _to_figure(figure_or_data), sharing=sharing, auto_open=False, **kwargs
         )
         proto.url = _get_embed_url(url)
 
 
+def _to_figure(figure_or_data):
+    """Convert figure_or_data to a validated Plotly figure dict."""
+    import plotly.tools
+
+    if type_util.is_type(figure_or_data, "matplotlib.figure.Figure"):
+        return plotly.tools.mpl_to_plotly(figure_or_data)
+
+    return plotly.tools.return_figure_from_figure_or_data(
+        figure_or_data, validate_figure=True
+    )
+
+
+def _get_spec(figure_or_data) -> str:
+    """Return the JSON spec of a figure.
+
+    The specs of figures returned by st.cache are cached, keyed by the figure's
+    st.cache value key, so reruns and sessions that show the same cached figure
+    skip converting and encoding it again.
+    """
+    key = caching.get_cached_value_key(figure_or_data)
+    if key is not None:
+        key = "plotly-%s" % key
+        data = type_util.arrow_bytes_cache.get(key)
+        if data is not None:
+            return data.decode("utf-8")
+
+    spec = _figure_to_json(_to_figure(figure_or_data))
+
+    if key is not None:
+        type_util.arrow_bytes_cache.set(key, spec.encode("utf-8"))
+    return spec
+
+
+def _figure_to_json(figure) -> str:
+    """Serialize a Plotly figure dict to JSON.
+
+    The numeric numpy arrays of its traces are sent as base64-encoded typed
+    arrays (see _encode_typed_arrays), and the rest is written by json's C
+    encoder. Plotly's own encoder is only used for the values that json can't
+    write, like dates, and for figures with NaN or infinite values outside of
+    the typed arrays, which it writes as null.
+    """
+    import plotly.utils
+
+    figure = dict(figure)
+    if "data" in figure:
+        figure["data"] = _encode_typed_arrays(figure["data"])
+    if "frames" in figure:
+        figure["frames"] = [
+            dict(frame, data=_encode_typed_arrays(frame["data"]))
+            if isinstance(frame, dict) and "data" in frame
+            else frame
+            for frame in figure["frames"]
+        ]
+
+    try:
+        return json.dumps(
+            figure,
+            default=plotly.utils.PlotlyJSONEncoder().default,
+            allow_nan=False,
+            separators=(",", ":"),
+        )
+    except ValueError:
+        return json.dumps(figure, cls=plotly.utils.PlotlyJSONEncoder)
+
+
+# numpy dtypes that are sent as typed arrays, by the dtype codes that Plotly
+# uses for them.
+_TYPED_ARRAY_DTYPES = {
+    "i1": "i1",
+    "u1": "u1",
+    "i2": "i2",
+    "u2": "u2",
+    "i4": "i4",
+    "u4": "u4",
+    "f2": "f4",
+    "f4": "f4",
+    "f8": "f8",
+}
+
+_INT32_MIN = -(2 ** 31)
+_INT32_MAX = 2 ** 31 - 1
+
+
+def _encode_typed_arrays(value: Any) -> Any:
+    """Return a copy of value where numeric numpy arrays with one or two
+    dimensions are replaced by Plotly's typed array dicts.
+
+    A typed array dict is {"dtype": "f8", "bdata": <base64 little-endian
+    values>}, with a "shape" of "<rows>, <columns>" for 2D arrays. This is the
+    format that plotly.py 6 and plotly.js 2.28 use. Other values are returned
+    as is.
+    """
+    import numpy as np
+
+    if isinstance(value, dict):
+        return {k: _encode_typed_arrays(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_encode_typed_arrays(v) for v in value]
+    if not isinstance(value, np.ndarray) or value.ndim not in (1, 2):
+        return value
+
+    dtype = "%s%d" % (value.dtype.kind, value.dtype.itemsize)
+    if value.dtype.kind in "iu" and value.dtype.itemsize == 8:
+        # JavaScript has no 64-bit integer arrays.
+        if value.size == 0 or (value.min() >= _INT32_MIN and value.max() <= _INT32_MAX):
+            dtype = "i4"
+        else:
+            dtype = "f8"
+    elif dtype not in _TYPED_ARRAY_DTYPES:
+        return value
+
+    code = _TYPED_ARRAY_DTYPES.get(dtype, dtype)
+    values = np.ascontiguousarray(value, dtype="<" + code)
+    encoded = {
+        "dtype": code,
+        "bdata": base64.b64encode(values.tobytes()).decode("ascii"),
+    }
+    if value.ndim == 2:
+        encoded["shape"] = "%d, %d" % value.shape
+    return encoded
+
+
 @caching.cache
 def _plot_to_url_or_load_cached_url(*args, **kwargs):
     """Call plotly.plot wrapped in st.cache.
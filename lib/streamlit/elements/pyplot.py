@@ -130,6 +130,19 @@ def marshall(coordinates, image_list_proto, fig=None, clear_figure=True, **kwarg
 
     image = io.BytesIO()
     fig.savefig(image, **kwargs)
+
+    # Figures are saved as PNG, and converted to the client.imageFormat
+    # format, unless that would give a PNG again.
+    output_format = config.get_option("client.imageFormat").upper()
+    if str(kwargs["format"]).lower() == "png" and (
+        output_format not in ("PNG", "AUTO") or image_utils._is_webp_supported()
+    ):
+        from PIL import Image
+
+        image = Image.open(image)
+    else:
+        output_format = "PNG"
+
     image_utils.marshall_images(
         coordinates,
         image,
@@ -138,7 +151,7 @@ def marshall(coordinates, image_list_proto, fig=None, clear_figure=True, **kwarg
         image_list_proto,
         False,
         channels="RGB",
-        output_format="PNG",
+        output_format=output_format,
     )
 
     # Clear the figure after rendering it. This means that subsequent
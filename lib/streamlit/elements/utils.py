@@ -13,9 +13,13 @@
 # limitations under the License.
 
 import textwrap
-from typing import Any, Optional, TYPE_CHECKING
+from typing import Any, List, Optional, Tuple, TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
 
 import streamlit
+from streamlit import config
 from streamlit import type_util
 from streamlit.elements.form import is_in_form
 from streamlit.errors import StreamlitAPIException
@@ -42,6 +46,112 @@ def last_index_for_melted_dataframes(data):
     return None
 
 
+def prep_chart_data(
+    data: pd.DataFrame, max_points: Optional[int] = 0
+) -> Tuple[pd.DataFrame, str, List[str]]:
+    """Prepare the data of a built-in chart, in wide format.
+
+    The built-in charts fold their value columns into "variable" and "value"
+    fields in the browser, with Vega-Lite's fold transform, so their data is
+    sent with one column per series, rather than melted into one row per
+    value.
+
+    Parameters
+    ----------
+    data : pandas.DataFrame
+        The chart's data, with one column per series.
+    max_points : int or None
+        The max number of points of each series, or 0 for no limit. If None,
+        uses the client.maxChartPoints config option.
+
+    Returns
+    -------
+    tuple of (pandas.DataFrame, str, list of str)
+        The data, with its index as its first column and with string column
+        names; the name of the index column; and the names of the value
+        columns.
+
+    """
+    if max_points is None:
+        max_points = config.get_option("client.maxChartPoints")
+
+    if max_points != 0 and max_points < _MIN_CHART_POINTS:
+        raise StreamlitAPIException(
+            "max_points must be 0, or at least %s." % _MIN_CHART_POINTS
+        )
+
+    if (
+        max_points != 0
+        and len(data) > max_points
+        and len(data.columns) > 0
+        and not isinstance(data.index, pd.MultiIndex)
+        and all(pd.api.types.is_numeric_dtype(t) for t in data.dtypes)
+    ):
+        rows = _downsample_min_max(data.to_numpy(dtype=float), max_points)
+        data = data.iloc[rows]
+
+    index_name = str(data.index.name if data.index.name is not None else "index")
+    data = data.reset_index()
+    data.columns = [str(column) for column in data.columns]
+    return data, index_name, list(data.columns[1:])
+
+
+# The first and last rows, and the min and max of at least one bucket.
+_MIN_CHART_POINTS = 4
+
+
+def _downsample_min_max(values: np.ndarray, max_points: int) -> np.ndarray:
+    """Pick the rows to keep, so that each column of values has at most
+    about max_points rows.
+
+    The first and last rows are kept, and the rows in between are split into
+    buckets of consecutive rows, where the rows with the smallest and largest
+    value of each column are kept. Every column is downsampled at once, and
+    since the columns share their rows, the number of buckets is divided by
+    the number of columns.
+
+    Returns
+    -------
+    numpy.ndarray
+        The sorted positions of the rows that were kept.
+
+    """
+    nrows, ncols = values.shape
+    ninner = nrows - 2
+    nbuckets = max(1, (max_points - 2) // (2 * ncols))
+    bucket_size = -(-ninner // nbuckets)
+    padding = nbuckets * bucket_size - ninner
+
+    # NaNs and padding are never the min or the max of a bucket, unless the
+    # whole bucket is NaNs and padding.
+    inner = values[1:-1]
+    is_nan = np.isnan(inner)
+    low = np.pad(
+        np.where(is_nan, np.inf, inner), ((0, padding), (0, 0)), constant_values=np.inf
+    )
+    high = np.pad(
+        np.where(is_nan, -np.inf, inner),
+        ((0, padding), (0, 0)),
+        constant_values=-np.inf,
+    )
+
+    bucket_starts = (np.arange(nbuckets) * bucket_size)[:, np.newaxis]
+    mins = low.reshape(nbuckets, bucket_size, ncols).argmin(axis=1) + bucket_starts
+    maxs = high.reshape(nbuckets, bucket_size, ncols).argmax(axis=1) + bucket_starts
+
+    positions = np.concatenate([mins.ravel(), maxs.ravel()]) + 1
+    # Padding is replaced by the last row, which is kept anyway.
+    positions[positions > ninner] = nrows - 1
+    return np.unique(np.concatenate([[0, nrows - 1], positions]))
+
+
+def escape_field_name(name: str) -> str:
+    """Escape the characters that Vega-Lite reads as nested field access."""
+    for char in "\\.[]":
+        name = name.replace(char, "\\" + char)
+    return name
+
+
 def check_callback_rules(
     dg: "DeltaGenerator", on_change: Optional[WidgetCallback]
 ) -> None:
@@ -0,0 +1,415 @@
+# Copyright 2018-2021 Streamlit Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Fragments: parts of a script that can be rerun on their own.
+
+A fragment is a function decorated with `st.experimental_fragment`. Each call
+to it writes into its own container. When the only widgets that changed since
+the last run were registered by a single fragment call, the ScriptRunner
+reruns just that call, and resends the rest of the last run's deltas as they
+were.
+"""
+
+import functools
+import threading
+from types import CodeType
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from streamlit import util
+from streamlit.cursor import RunningCursor
+from streamlit.error_util import handle_uncaught_app_exception
+from streamlit.logger import get_logger
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.report_queue import ReportQueue
+from streamlit.report_thread import get_report_ctx
+from streamlit.script_runner import ScriptControlException
+
+LOGGER = get_logger(__name__)
+
+
+class Fragment(object):
+    """A single call of a fragment function, and what it wrote."""
+
+    def __init__(self, func, args, kwargs, container):
+        """Constructor.
+
+        Parameters
+        ----------
+        func : callable
+            The undecorated fragment function.
+        args : tuple
+            The positional arguments it was called with.
+        kwargs : dict
+            The keyword arguments it was called with.
+        container : DeltaGenerator
+            The block DeltaGenerator the call writes into.
+
+        """
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.container = container
+
+        # The container's full delta path: its root container, followed by
+        # its path within that root container.
+        self.delta_path: Tuple[int, ...] = (
+            container._root_container,
+        ) + container._cursor.parent_path
+
+        self.id = "%s.%s:%s" % (
+            func.__module__,
+            func.__qualname__,
+            ",".join(str(i) for i in self.delta_path),
+        )
+
+        # IDs of the widgets registered during the call.
+        self.widget_ids: Set[str] = set()
+
+        # Set to False if the call wrote outside its container, or didn't run
+        # to completion. Rerunning it on its own would then leave the rest of
+        # the app out of date.
+        self.is_rerunnable = True
+
+    def __repr__(self) -> str:
+        return util.repr_(self)
+
+    def contains(self, delta_path) -> bool:
+        """True if the given delta path is inside this fragment's container."""
+        num_parents = len(self.delta_path)
+        return (
+            len(delta_path) > num_parents
+            and tuple(delta_path[:num_parents]) == self.delta_path
+        )
+
+    def new_call(self) -> "Fragment":
+        """Return a Fragment that calls the same function, with the same
+        arguments, into a fresh container at the same delta path.
+        """
+        from streamlit.delta_generator import DeltaGenerator
+
+        old_container = self.container
+        container = DeltaGenerator(
+            root_container=old_container._root_container,
+            cursor=RunningCursor(
+                root_container=old_container._root_container,
+                parent_path=old_container._cursor.parent_path,
+            ),
+            parent=old_container._parent,
+            block_type=old_container._block_type,
+        )
+        container._form_data = old_container._form_data
+        return Fragment(self.func, self.args, self.kwargs, container)
+
+
+class FragmentStorage(object):
+    """Everything a session needs to rerun one fragment of its last run.
+
+    This holds the deltas, widget IDs and fragments of the last script run
+    that finished, and records those of the run in progress. It is owned by
+    the ReportSession, so that it outlives its ScriptRunners, and is only
+    used from the script thread, except for clear().
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+
+        # The last finished run.
+        self._code: Optional[CodeType] = None
+        self._query_string: Optional[str] = None
+        self._fragments: Dict[str, Fragment] = {}
+        self._deltas = ReportQueue()
+        self._widget_ids: Set[str] = set()
+
+        # The run in progress.
+        self._is_recording = False
+        self._is_cleared_during_run = False
+        self._new_code: Optional[CodeType] = None
+        self._new_query_string: Optional[str] = None
+        self._new_fragments: Dict[str, Fragment] = {}
+        self._new_deltas = ReportQueue()
+        self._running_fragment: Optional[Fragment] = None
+        self._rerunning_fragment: Optional[Fragment] = None
+
+    def __repr__(self) -> str:
+        return util.repr_(self)
+
+    def clear(self) -> None:
+        """Forget the last run, so that the next run reruns the whole script.
+
+        Called when a source file changes or caches are cleared, since the
+        fragments of the last run may be out of date. This can be called
+        from any thread.
+        """
+        with self._lock:
+            self._clear()
+            self._is_cleared_during_run = self._is_recording
+
+    def _clear(self) -> None:
+        self._code = None
+        self._query_string = None
+        self._fragments = {}
+        self._deltas = ReportQueue()
+        self._widget_ids = set()
+
+    @property
+    def is_running_fragment(self) -> bool:
+        """True if a fragment function is being called."""
+        return self._running_fragment is not None
+
+    def get_fragment_to_rerun(
+        self, code: CodeType, query_string: str, changed_widget_ids: Set[str]
+    ) -> Optional[Fragment]:
+        """Return the fragment to rerun instead of the whole script, if any.
+
+        Parameters
+        ----------
+        code : CodeType
+            The compiled script that's about to run.
+        query_string : str
+            The URL query string of the run.
+        changed_widget_ids : set of str
+            The IDs of the widgets whose values changed since the last run.
+
+        Returns
+        -------
+        Fragment | None
+            The fragment of the last run that registered all of the changed
+            widgets, if it can be rerun on its own.
+
+        """
+        with self._lock:
+            if (
+                not changed_widget_ids
+                or code is not self._code
+                or query_string != self._query_string
+            ):
+                return None
+
+            for fragment in self._fragments.values():
+                if changed_widget_ids <= fragment.widget_ids:
+                    return fragment if fragment.is_rerunnable else None
+            return None
+
+    def get_deltas_outside(self, fragment: Fragment) -> List[ForwardMsg]:
+        """Return the last run's deltas that aren't inside the fragment,
+        along with the last run's DataSets.
+        """
+        with self._lock:
+            return [
+                msg
+                for msg in self._deltas
+                if not fragment.contains(msg.metadata.delta_path)
+            ]
+
+    def get_widget_ids_outside(self, fragment: Fragment) -> Set[str]:
+        """Return the last run's widget IDs that the fragment didn't register."""
+        with self._lock:
+            return self._widget_ids - fragment.widget_ids
+
+    def begin_run(
+        self,
+        code: CodeType,
+        query_string: str,
+        fragment: Optional[Fragment] = None,
+    ) -> None:
+        """Start recording a script run.
+
+        Parameters
+        ----------
+        code : CodeType
+            The compiled script.
+        query_string : str
+            The URL query string of the run.
+        fragment : Fragment | None
+            The fragment that is being rerun, or None for a full run.
+
+        """
+        with self._lock:
+            self._is_recording = True
+            self._is_cleared_during_run = False
+            self._new_code = code
+            self._new_query_string = query_string
+            self._new_fragments = {} if fragment is None else dict(self._fragments)
+            self._new_deltas = ReportQueue()
+            self._rerunning_fragment = fragment
+
+    def is_outside_rerun(self, msg: ForwardMsg) -> bool:
+        """True if msg is a delta that the fragment being rerun is writing
+        outside its container.
+        """
+        fragment = self._running_fragment
+        return (
+            fragment is not None
+            and self._rerunning_fragment is not None
+            and msg.HasField("delta")
+            and not fragment.contains(msg.metadata.delta_path)
+        )
+
+    def record(self, msg: ForwardMsg) -> None:
+        """Record a ForwardMsg that was enqueued by the running script."""
+        # DataSets are recorded too, since the deltas that are resent when a
+        # fragment is rerun may refer to them.
+        if not self._is_recording or not (
+            msg.HasField("delta") or msg.HasField("data_set")
+        ):
+            return
+
+        fragment = self._running_fragment
+        if (
+            fragment is not None
+            and msg.HasField("delta")
+            and not fragment.contains(msg.metadata.delta_path)
+        ):
+            fragment.is_rerunnable = False
+
+        # ReportQueue composes deltas with the same delta path, so this holds
+        # what the app shows, rather than every delta that was sent.
+        self._new_deltas.enqueue(msg)
+
+    def end_run(self, widget_ids: Set[str], finished: bool) -> None:
+        """Stop recording, and keep the run if it finished.
+
+        Parameters
+        ----------
+        widget_ids : set of str
+            The IDs of every widget registered during the run.
+        finished : bool
+            False if the run was cut short by a rerun. The next run is then
+            a full run, since the app may be missing the end of this one.
+
+        """
+        with self._lock:
+            if not self._is_recording:
+                return
+
+            self._is_recording = False
+            self._rerunning_fragment = None
+            if finished and not self._is_cleared_during_run:
+                self._code = self._new_code
+                self._query_string = self._new_query_string
+                self._fragments = self._new_fragments
+                self._deltas = self._new_deltas
+                self._widget_ids = widget_ids
+            else:
+                self._clear()
+
+            self._new_fragments = {}
+            self._new_deltas = ReportQueue()
+
+    def call(self, fragment: Fragment) -> Any:
+        """Call a fragment function in a full script run."""
+        try:
+            return self._call(fragment)
+        except BaseException:
+            # The rest of the script didn't run, so rerunning the fragment
+            # alone wouldn't bring it back.
+            fragment.is_rerunnable = False
+            raise
+
+    def rerun(self, fragment: Fragment) -> None:
+        """Call a fragment function again, on its own.
+
+        Exceptions are shown inside the fragment's container, rather than
+        ending the run, since the rest of the app has already been sent.
+        """
+        new_fragment = fragment.new_call()
+        try:
+            self._call(new_fragment, catch_exceptions=True)
+        except ScriptControlException:
+            new_fragment.is_rerunnable = False
+            raise
+
+    def _call(self, fragment: Fragment, catch_exceptions: bool = False) -> Any:
+        ctx = get_report_ctx()
+        widget_ids_before = ctx.widget_ids_this_run.items()
+        self._running_fragment = fragment
+        try:
+            with fragment.container:
+                if not catch_exceptions:
+                    return fragment.func(*fragment.args, **fragment.kwargs)
+
+                try:
+                    fragment.func(*fragment.args, **fragment.kwargs)
+                except ScriptControlException:
+                    raise
+                except BaseException as e:
+                    handle_uncaught_app_exception(e)
+                return None
+        finally:
+            self._running_fragment = None
+            fragment.widget_ids = ctx.widget_ids_this_run.items() - widget_ids_before
+            self._new_fragments[fragment.id] = fragment
+
+
+def fragment(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Function decorator to turn a function into a rerunnable fragment.
+
+    Each call to a fragment function writes into its own container. When
+    you interact with a widget created inside that call, Streamlit reruns
+    just the call instead of the whole script, and keeps the rest of your
+    app as it was. Interacting with any other widget reruns the whole script,
+    as usual.
+
+    Rerun only the parts of your app that depend on a widget, so that
+    changing a filter in one section doesn't redo the queries and charts of
+    every other section.
+
+    Parameters
+    ----------
+    func : callable
+        The function to turn into a fragment. When the fragment is rerun on
+        its own, it is called with the same arguments as in the last run, and
+        its return value is ignored.
+
+    Notes
+    -----
+    A fragment is rerun on its own only if everything it writes goes inside
+    its container, and its last call completed. Otherwise, widget changes in
+    it rerun the whole script. Changes that a widget callback makes to
+    Session State aren't shown outside the fragment until the whole script
+    reruns.
+
+    Example
+    -------
+    >>> @st.experimental_fragment
+    ... def filtered_chart(df):
+    ...     column = st.selectbox("Column", df.columns)
+    ...     st.line_chart(df[column])
+    ...
+    >>> df = load_expensive_data()
+    >>> filtered_chart(df)
+
+    """
+
+    @functools.wraps(func)
+    def wrapped_func(*args, **kwargs):
+        ctx = get_report_ctx()
+        if ctx is None:
+            return func(*args, **kwargs)
+
+        # Fragments called from inside another fragment are part of it.
+        storage = ctx.fragment_storage
+        if storage is not None and storage.is_running_fragment:
+            return func(*args, **kwargs)
+
+        import streamlit as st
+
+        container = st._main.beta_container()
+        if storage is None or container._cursor is None:
+            with container:
+                return func(*args, **kwargs)
+
+        return storage.call(Fragment(func, args, kwargs, container))
+
+    return wrapped_func
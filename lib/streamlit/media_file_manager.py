@@ -14,11 +14,13 @@
 
 """Provides global MediaFileManager object as `media_file_manager`."""
 
-from typing import Dict, DefaultDict, Set
+from typing import Dict, DefaultDict, Optional, Set
 import collections
 import hashlib
 import mimetypes
 
+from blinker import Signal
+
 from streamlit.report_thread import get_report_ctx
 from streamlit.logger import get_logger
 from streamlit import util
@@ -28,6 +30,7 @@ LOGGER = get_logger(__name__)
 STATIC_MEDIA_ENDPOINT = "/media"
 PREFERRED_MIMETYPE_EXTENSION_MAP = {
     "image/jpeg": ".jpeg",
+    "image/webp": ".webp",
     "audio/wav": ".wav",
 }
 
@@ -140,6 +143,20 @@ class MediaFileManager(object):
             dict
         )  # type: DefaultDict[str, Dict[str, MediaFile]]
 
+        self.on_file_added = Signal(
+            doc="""Emitted when a MediaFile is added to the manager.
+
+            Parameters
+            ----------
+            session_id : str
+                The ID of the session that added the file.
+            media_file : MediaFile
+                The file that was added.
+            coordinates : str
+                The coordinates of the element that uses the file.
+            """
+        )
+
     def __repr__(self) -> str:
         return util.repr_(self)
 
@@ -181,7 +198,7 @@ class MediaFileManager(object):
             len(self._files_by_session_and_coord),
         )
 
-    def add(self, content, mimetype, coordinates):
+    def add(self, content, mimetype, coordinates, session_id: Optional[str] = None):
         """Adds new MediaFile with given parameters; returns the object.
 
         If an identical file already exists, returns the existing object
@@ -202,6 +219,9 @@ class MediaFileManager(object):
             Unique string identifying an element's location.
             Prevents memory leak of "forgotten" file IDs when element media
             is being replaced-in-place (e.g. an st.image stream).
+        session_id : str or None
+            The ID of the session that uses the file, or None to use the
+            current ReportContext's session.
 
         """
         file_id = _calculate_file_id(content, mimetype)
@@ -213,7 +233,8 @@ class MediaFileManager(object):
         else:
             LOGGER.debug("Overwriting media file %s", file_id)
 
-        session_id = _get_session_id()
+        if session_id is None:
+            session_id = _get_session_id()
         self._files_by_id[mf.id] = mf
         self._files_by_session_and_coord[session_id][coordinates] = mf
 
@@ -223,6 +244,7 @@ class MediaFileManager(object):
             len(self._files_by_session_and_coord),
         )
 
+        self.on_file_added.send(session_id, media_file=mf, coordinates=coordinates)
         return mf
 
     def get(self, media_filename):
@@ -65,6 +65,12 @@ class Client(object):
         # yapf: disable
         self._raw_metrics  = [
             ('Counter', 'streamlit_enqueue_deltas_total', 'Total deltas enqueued', ['type']),
+            ('Counter', 'streamlit_script_runs_started_total', 'Total script runs started', []),
+            ('Counter', 'streamlit_script_runs_interrupted_total', 'Total script runs interrupted by a stop or rerun request', []),
+            ('Counter', 'streamlit_rerun_requests_coalesced_total', 'Total rerun requests merged into another rerun request', []),
+            ('Counter', 'streamlit_fragment_reruns_total', 'Total script runs that reran a single fragment', []),
+            ('Counter', 'streamlit_preheated_session_requests_total', 'Total browser connections, by whether a preheated session was available', ['result']),
+            ('Counter', 'streamlit_image_bytes_total', 'Total bytes of the images encoded by st.image and st.pyplot, before and after encoding', ['mimetype', 'stage']),
         ]
         # yapf: enable
 
@@ -257,13 +257,13 @@ def _should_save_report_msg(msg):
     """Returns True if the given ForwardMsg should be serialized into
     a shared report.
 
-    We serialize report & session metadata and deltas, but not transient
-    events such as upload progress.
+    We serialize report & session metadata, deltas and the DataSets that they
+    refer to, but not transient events such as upload progress.
 
     """
 
     msg_type = msg.WhichOneof("type")
-    return msg_type == "initialize" or msg_type == "new_report" or msg_type == "delta"
+    return msg_type in ("initialize", "new_report", "delta", "data_set")
 
 
 def _get_browser_address_bar_port():
@@ -19,10 +19,12 @@ Whenever possible, message deltas are combined.
 
 import copy
 import threading
+from typing import Dict, List, Set
 
 from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
 
 from streamlit.logger import get_logger
+from streamlit import type_util
 from streamlit import util
 
 LOGGER = get_logger(__name__)
@@ -42,25 +44,46 @@ class ReportQueue(object):
             # where delta_path = (container, parent block path as a string)
             self._delta_index_map = dict()
 
+            # Map: _queue index -> _ArrowAddRows, for arrow_add_rows deltas
+            # that will be merged into the message at that index.
+            self._arrow_add_rows: Dict[int, _ArrowAddRows] = dict()
+
+            # Indices of the messages in _queue that the queue created itself
+            # and that nobody else has a reference to, so that add_rows can
+            # be composed into them in place.
+            self._owned_indices: Set[int] = set()
+
+            # Map: DataSet ID -> data_set message. These are sent ahead of
+            # the messages in _queue, since a delta that refers to a DataSet
+            # may be composed into a message that was queued before it.
+            self._data_sets: Dict[str, ForwardMsg] = dict()
+
     def __repr__(self) -> str:
         return util.repr_(self)
 
     def get_debug(self):
         from google.protobuf.json_format import MessageToDict
 
+        with self._lock:
+            self._compose_arrow_add_rows()
+
         return {
-            "queue": [MessageToDict(m) for m in self._queue],
+            "queue": [MessageToDict(m) for m in self._messages()],
             "ids": list(self._delta_index_map.keys()),
         }
 
     def __iter__(self):
-        return iter(self._queue)
+        with self._lock:
+            self._compose_arrow_add_rows()
+            self._owned_indices = set()
+            return iter(self._messages())
 
     def is_empty(self):
-        return len(self._queue) == 0
+        return len(self._queue) == 0 and len(self._data_sets) == 0
 
     def get_initial_msg(self):
         if len(self._queue) > 0:
+            self._owned_indices.discard(0)
             return self._queue[0]
         return None
 
@@ -72,27 +95,61 @@ class ReportQueue(object):
         msg : ForwardMsg
         """
         with self._lock:
+            if msg.HasField("data_set"):
+                # Charts of the same data share a single DataSet.
+                self._data_sets.setdefault(msg.data_set.id, msg)
             # Optimize only if it's a delta message
-            if not msg.HasField("delta"):
+            elif not msg.HasField("delta"):
                 self._queue.append(msg)
             else:
                 # Deltas are uniquely identified by their delta_path.
                 delta_key = tuple(msg.metadata.delta_path)
 
+                index = self._delta_index_map.get(delta_key)
+
+                if index is not None and msg.delta.HasField("arrow_add_rows"):
+                    arrow_add_rows = self._arrow_add_rows.get(index)
+                    if arrow_add_rows is None:
+                        arrow_add_rows = _ArrowAddRows(self._queue[index])
+                    if arrow_add_rows.can_add(msg):
+                        # Merge consecutive add_rows into a single Arrow
+                        # stream. This is done lazily, when the queue is
+                        # read, so merging N deltas only copies each row once.
+                        arrow_add_rows.add(msg)
+                        self._arrow_add_rows[index] = arrow_add_rows
+                        return
+
                 if (
-                    delta_key in self._delta_index_map
+                    index is not None
                     # This delta combination logic is "legacy" only,
                     # and will be removed when that option is gone.
                     and not msg.delta.HasField("arrow_add_rows")
                 ):
                     # Combine the previous message into the new message.
-                    index = self._delta_index_map[delta_key]
+                    if index in self._arrow_add_rows:
+                        self._queue[index] = self._arrow_add_rows.pop(index).compose()
                     old_msg = self._queue[index]
+
+                    if msg.delta.HasField("add_rows"):
+                        # Append the rows to our own copy of the element, so
+                        # that streaming N batches into it copies each row
+                        # once, rather than copying the whole table N times.
+                        if index not in self._owned_indices:
+                            new_msg = ForwardMsg()
+                            new_msg.CopyFrom(old_msg)
+                            old_msg = new_msg
+                            self._queue[index] = old_msg
+                            self._owned_indices.add(index)
+                        compose_deltas_in_place(old_msg.delta, msg.delta)
+                        old_msg.metadata.CopyFrom(msg.metadata)
+                        return
+
                     composed_delta = compose_deltas(old_msg.delta, msg.delta)
                     new_msg = ForwardMsg()
                     new_msg.delta.CopyFrom(composed_delta)
                     new_msg.metadata.CopyFrom(msg.metadata)
                     self._queue[index] = new_msg
+                    self._owned_indices.add(index)
                 else:
                     # Append this message to the queue, and store its index
                     # for future combining.
@@ -104,14 +161,30 @@ class ReportQueue(object):
         r = ReportQueue()
 
         with self._lock:
+            self._compose_arrow_add_rows()
             r._queue = list(self._queue)
             r._delta_index_map = dict(self._delta_index_map)
+            r._data_sets = dict(self._data_sets)
+            # Both queues now reference the same messages.
+            self._owned_indices = set()
 
         return r
 
+    def _messages(self):
+        return list(self._data_sets.values()) + self._queue
+
+    def _compose_arrow_add_rows(self):
+        """Replace merged arrow_add_rows deltas with their composition."""
+        for index, arrow_add_rows in self._arrow_add_rows.items():
+            self._queue[index] = arrow_add_rows.compose()
+        self._arrow_add_rows = dict()
+
     def _clear(self):
         self._queue = []
         self._delta_index_map = dict()
+        self._arrow_add_rows = dict()
+        self._owned_indices = set()
+        self._data_sets = dict()
 
     def clear(self):
         """Clear this queue."""
@@ -120,7 +193,8 @@ class ReportQueue(object):
 
     def flush(self):
         with self._lock:
-            queue = self._queue
+            self._compose_arrow_add_rows()
+            queue = self._messages()
             self._clear()
         return queue
 
@@ -141,17 +215,117 @@ def compose_deltas(old_delta, new_delta):
         return new_delta
 
     elif new_delta_type == "add_rows":
-        import streamlit.elements.legacy_data_frame as data_frame
-
-        # We should make data_frame.add_rows *not* mutate any of the
-        # inputs. In the meantime, we have to deepcopy the input that will be
-        # mutated.
+        # data_frame.add_rows mutates its first input, so we have to copy it.
         composed_delta = copy.deepcopy(old_delta)
-        data_frame.add_rows(composed_delta, new_delta, name=new_delta.add_rows.name)
+        compose_deltas_in_place(composed_delta, new_delta)
         return composed_delta
 
-    # (HK) TODO: Implement composition of 2 deltas for arrow_add_rows.
+    # arrow_add_rows deltas are composed by ReportQueue, with _ArrowAddRows.
 
     LOGGER.error("Old delta: %s;\nNew delta: %s;", old_delta, new_delta)
 
     raise NotImplementedError("Need to implement the compose code.")
+
+
+def compose_deltas_in_place(old_delta, new_delta):
+    """Append the rows of an add_rows new_delta to old_delta."""
+    import streamlit.elements.legacy_data_frame as data_frame
+
+    name = new_delta.add_rows.name
+    data_frame.add_rows(old_delta, new_delta, name=name)
+
+    max_rows = new_delta.add_rows.max_rows
+    if max_rows:
+        # Drop the rows that the element would drop once it got new_delta,
+        # so that a long-running add_rows loop doesn't grow the queue.
+        data_frame.truncate(old_delta, max_rows, name=name)
+    if old_delta.HasField("add_rows"):
+        old_delta.add_rows.max_rows = max_rows
+
+
+class _ArrowAddRows(object):
+    """Consecutive arrow_add_rows deltas for a single element and dataset,
+    to be sent as a single Arrow stream.
+
+    Each delta is a complete Arrow IPC stream, with its own schema. The
+    composed delta has the schema of the first one, and a single record
+    batch with the rows of all of them.
+    """
+
+    def __init__(self, msg):
+        self._msgs: List[ForwardMsg] = []
+        self._schema = None
+        if msg.delta.HasField("arrow_add_rows") and not _has_styler(msg):
+            self._schema = _read_arrow_schema(msg)
+            self._msgs.append(msg)
+
+    def __repr__(self) -> str:
+        return util.repr_(self)
+
+    def can_add(self, msg) -> bool:
+        """True if msg can be merged into the deltas we hold."""
+        if self._schema is None or _has_styler(msg):
+            return False
+
+        first = self._msgs[0].delta.arrow_add_rows
+        other = msg.delta.arrow_add_rows
+        return (
+            first.name == other.name
+            and first.has_name == other.has_name
+            and self._schema.equals(_read_arrow_schema(msg), check_metadata=False)
+        )
+
+    def add(self, msg) -> None:
+        self._msgs.append(msg)
+
+    def compose(self) -> ForwardMsg:
+        """Return a ForwardMsg with all of our rows, as a single stream."""
+        import pyarrow as pa
+
+        batches = []
+        for msg in self._msgs:
+            reader = pa.ipc.open_stream(msg.delta.arrow_add_rows.data.data)
+            batches.extend(reader)
+
+        last_msg = self._msgs[-1]
+        num_rows = sum(batch.num_rows for batch in batches)
+        table = pa.Table.from_batches(batches)
+
+        # Drop the rows that the element would drop once it got the last
+        # delta, so that a long-running add_rows loop doesn't grow the queue.
+        max_rows = last_msg.delta.arrow_add_rows.max_rows
+        num_dropped_rows = 0
+        if max_rows and num_rows > max_rows:
+            num_dropped_rows = num_rows - max_rows
+            table = table.slice(num_dropped_rows)
+            num_rows = max_rows
+
+        schema = self._schema.with_metadata(
+            type_util.slice_range_index_metadata(
+                self._schema.metadata, num_dropped_rows, num_rows
+            )
+        )
+
+        # Write a single record batch, rather than one per delta, since each
+        # batch has its own header.
+        table = table.combine_chunks()
+        sink = pa.BufferOutputStream()
+        writer = pa.RecordBatchStreamWriter(sink, schema)
+        writer.write_table(table)
+        writer.close()
+
+        new_msg = ForwardMsg()
+        new_msg.delta.arrow_add_rows.CopyFrom(last_msg.delta.arrow_add_rows)
+        new_msg.delta.arrow_add_rows.data.data = sink.getvalue().to_pybytes()
+        new_msg.metadata.CopyFrom(last_msg.metadata)
+        return new_msg
+
+
+def _has_styler(msg) -> bool:
+    return msg.delta.arrow_add_rows.data.HasField("styler")
+
+
+def _read_arrow_schema(msg):
+    import pyarrow as pa
+
+    return pa.ipc.open_stream(msg.delta.arrow_add_rows.data.data).schema
@@ -25,8 +25,10 @@ from streamlit import __version__
 from streamlit import caching
 from streamlit import config
 from streamlit import url_util
+from streamlit.arrow_table_manager import arrow_table_manager
 from streamlit.case_converters import to_snake_case
 from streamlit.credentials import Credentials
+from streamlit.fragment import FragmentStorage
 from streamlit.logger import get_logger
 from streamlit.media_file_manager import media_file_manager
 from streamlit.metrics_util import Installation
@@ -120,6 +122,10 @@ class ReportSession(object):
 
         self._session_state = SessionState()
 
+        # Records the last script run, so that a single fragment of it can
+        # be rerun.
+        self._fragment_storage = FragmentStorage()
+
         LOGGER.debug("ReportSession initialized (id=%s)", self.id)
 
     def flush_browser_queue(self):
@@ -150,6 +156,7 @@ class ReportSession(object):
             self._uploaded_file_mgr.remove_session_files(self.id)
             media_file_manager.clear_session_files(self.id)
             media_file_manager.del_expired_files()
+            arrow_table_manager.clear_session_tables(self.id)
 
             # Shut down the ScriptRunner, if one is active.
             # self._state must not be set to SHUTDOWN_REQUESTED until
@@ -161,6 +168,11 @@ class ReportSession(object):
             self._local_sources_watcher.close()
             self._stop_config_listener()
 
+            if _use_process_execution_mode():
+                from streamlit import script_process_pool
+
+                script_process_pool.release_session(self.id)
+
     def enqueue(self, msg):
         """Enqueue a new ForwardMsg to our browser queue.
 
@@ -240,8 +252,16 @@ class ReportSession(object):
     def session_state(self) -> "SessionState":
         return self._session_state
 
+    @property
+    def is_script_running(self) -> bool:
+        """True if the script is running, or a request to run it is pending."""
+        return self._scriptrunner is not None or self._script_request_queue.has_request
+
     def _on_source_file_changed(self):
         """One of our source files changed. Schedule a rerun if appropriate."""
+        # Fragments of the last run may call code that has changed.
+        self._fragment_storage.clear()
+
         if self._run_on_save:
             self.request_rerun()
         else:
@@ -497,6 +517,14 @@ class ReportSession(object):
         caching.clear_cache()
 
         self._session_state.clear_state()
+        self._fragment_storage.clear()
+
+        if _use_process_execution_mode():
+            from streamlit import script_process_pool
+
+            # Scripts run in worker processes, which have their own caches
+            # and hold the session's widget state.
+            script_process_pool.clear_cache(self.id)
 
     def handle_set_run_on_save_request(self, new_value):
         """Change our run_on_save flag to the given value.
@@ -532,6 +560,13 @@ class ReportSession(object):
             return
 
         self._script_request_queue.enqueue(request, data)
+
+        # If a script is already running, interrupt it so that it handles the
+        # request right away.
+        scriptrunner = self._scriptrunner
+        if scriptrunner is not None:
+            scriptrunner.request_interrupt()
+
         self._maybe_create_scriptrunner()
 
     def _maybe_create_scriptrunner(self):
@@ -551,8 +586,16 @@ class ReportSession(object):
         ):
             return
 
+        if _use_process_execution_mode():
+            # Lazy-load, since most apps run their scripts in-process.
+            from streamlit.script_process_pool import ProcessScriptRunner
+
+            scriptrunner_class = ProcessScriptRunner
+        else:
+            scriptrunner_class = ScriptRunner
+
         # Create the ScriptRunner, attach event handlers, and start it
-        self._scriptrunner = ScriptRunner(
+        self._scriptrunner = scriptrunner_class(
             session_id=self.id,
             report=self._report,
             enqueue_forward_msg=self.enqueue,
@@ -560,6 +603,7 @@ class ReportSession(object):
             request_queue=self._script_request_queue,
             session_state=self._session_state,
             uploaded_file_mgr=self._uploaded_file_mgr,
+            fragment_storage=self._fragment_storage,
         )
         self._scriptrunner.on_event.connect(self._on_scriptrunner_event)
         self._scriptrunner.start()
@@ -647,6 +691,10 @@ class ReportSession(object):
         return self._storage
 
 
+def _use_process_execution_mode() -> bool:
+    return bool(config.get_option("runner.executionMode") == "process")
+
+
 def _populate_config_msg(msg: Config) -> None:
     msg.sharing_enabled = config.get_option("global.sharingMode") != "off"
     msg.gather_usage_stats = config.get_option("browser.gatherUsageStats")
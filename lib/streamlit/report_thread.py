@@ -45,6 +45,7 @@ class ReportContext:
         query_string: str,
         session_state: SessionState,
         uploaded_file_mgr: UploadedFileManager,
+        fragment_storage: Optional["streamlit.fragment.FragmentStorage"] = None,
     ):
         """Construct a ReportContext.
 
@@ -60,6 +61,9 @@ class ReportContext:
             The WidgetManager for the report.
         uploaded_file_mgr : UploadedFileManager
             The manager for files uploaded by all users.
+        fragment_storage : FragmentStorage | None
+            The session's FragmentStorage, or None if fragments can't be
+            rerun on their own.
 
         """
         self.cursors: Dict[int, "streamlit.cursor.RunningCursor"] = {}
@@ -71,6 +75,7 @@ class ReportContext:
         self.widget_ids_this_run = _StringSet()
         self.form_ids_this_run = _StringSet()
         self.uploaded_file_mgr = uploaded_file_mgr
+        self.fragment_storage = fragment_storage
         # set_page_config is allowed at most once, as the very first st.command
         self._set_page_config_allowed = True
         self._has_script_started = False
@@ -161,54 +166,6 @@ class _StringSet:
 REPORT_CONTEXT_ATTR_NAME = "streamlit_report_ctx"
 
 
-class ReportThread(threading.Thread):
-    """Extends threading.Thread with a ReportContext member"""
-
-    def __init__(
-        self,
-        session_id: str,
-        enqueue: Callable[[ForwardMsg], None],
-        query_string: str,
-        session_state: SessionState,
-        uploaded_file_mgr: UploadedFileManager,
-        target: Optional[Callable[[], None]] = None,
-        name: Optional[str] = None,
-    ):
-        """Construct a ReportThread.
-
-        Parameters
-        ----------
-        session_id : str
-            The ReportSession's id.
-        enqueue : callable
-            Function that enqueues ForwardMsg protos in the websocket.
-        query_string : str
-            The URL query string for this run.
-        widget_mgr : WidgetManager
-            The WidgetManager object for the report.
-        uploaded_file_mgr : UploadedFileManager
-            The manager for files uploaded by all users.
-        target : callable
-            The callable object to be invoked by the run() method.
-            Defaults to None, meaning nothing is called.
-        name : str
-            The thread name. By default, a unique name is constructed of
-            the form "Thread-N" where N is a small decimal number.
-
-        """
-        super(ReportThread, self).__init__(target=target, name=name)
-        self.streamlit_report_ctx = ReportContext(
-            session_id=session_id,
-            enqueue=enqueue,
-            query_string=query_string,
-            session_state=session_state,
-            uploaded_file_mgr=uploaded_file_mgr,
-        )
-
-    def __repr__(self) -> str:
-        return util.repr_(self)
-
-
 def add_report_ctx(
     thread: Optional[threading.Thread] = None, ctx: Optional[ReportContext] = None
 ):
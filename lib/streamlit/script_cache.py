@@ -0,0 +1,126 @@
+# Copyright 2018-2021 Streamlit Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Provides global ScriptCache object as `script_cache`."""
+
+import hashlib
+import threading
+from types import CodeType
+from typing import Dict, NamedTuple, Tuple
+
+from streamlit import config
+from streamlit import magic
+from streamlit import source_util
+from streamlit import util
+from streamlit.logger import get_logger
+
+LOGGER = get_logger(__name__)
+
+
+class _CacheEntry(NamedTuple):
+    # md5 of the script's source text.
+    source_hash: str
+    code: CodeType
+
+
+def _calculate_source_hash(filebody: str) -> str:
+    hasher = hashlib.new("md5")
+    hasher.update(filebody.encode("utf-8"))
+    return hasher.hexdigest()
+
+
+class ScriptCache(object):
+    """Thread-safe cache of compiled main-script bytecode.
+
+    Every rerun needs the compiled code of the main script. Parsing the
+    script (plus the magic AST transform) and compiling it is by far the
+    most expensive part of starting a run for large scripts, and its result
+    only changes when the script's source does. So we share compiled code
+    objects across all ReportSessions, keyed on the script path and
+    whether magic is enabled, and validated against a hash of the source.
+
+    Entries are also dropped by LocalSourcesWatcher when a watched file
+    changes on disk.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # Dict of (script_path, magic_enabled) -> _CacheEntry.
+        self._entries: Dict[Tuple[str, bool], _CacheEntry] = {}
+
+    def __repr__(self) -> str:
+        return util.repr_(self)
+
+    def get_bytecode(self, script_path: str) -> CodeType:
+        """Return the compiled code for the script at script_path.
+
+        The script is recompiled only if it isn't cached, or if its source
+        has changed since it was cached.
+
+        Raises
+        ------
+        Any error raised while reading, parsing or compiling the script.
+        Compile errors are never cached.
+
+        """
+        with source_util.open_python_file(script_path) as f:
+            filebody = f.read()
+
+        magic_enabled = bool(config.get_option("runner.magicEnabled"))
+        key = (script_path, magic_enabled)
+        source_hash = _calculate_source_hash(filebody)
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+        if entry is not None and entry.source_hash == source_hash:
+            return entry.code
+
+        LOGGER.debug("Compiling script %s", script_path)
+
+        if magic_enabled:
+            filebody = magic.add_magic(filebody, script_path)
+
+        code = compile(
+            filebody,
+            # Pass in the file path so it can show up in exceptions.
+            script_path,
+            # We're compiling entire blocks of Python, so we need "exec"
+            # mode (as opposed to "eval" or "single").
+            mode="exec",
+            # Don't inherit any flags or "future" statements.
+            flags=0,
+            dont_inherit=1,
+            # Use the default optimization options.
+            optimize=-1,
+        )
+
+        with self._lock:
+            self._entries[key] = _CacheEntry(source_hash=source_hash, code=code)
+
+        return code
+
+    def invalidate(self, script_path: str) -> None:
+        """Remove all cached entries for the given script path."""
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == script_path]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._entries.clear()
+
+
+script_cache = ScriptCache()
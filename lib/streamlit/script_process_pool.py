@@ -0,0 +1,848 @@
+# Copyright 2018-2021 Streamlit Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Process-isolated script execution (runner.executionMode = "process").
+
+In this mode, each ReportSession is pinned to one of a pool of worker
+processes. The session's ScriptRunner is replaced by a ProcessScriptRunner,
+which forwards ScriptRequests to the worker. The worker runs a regular
+ScriptRunner for the session and streams its ForwardMsgs, ScriptRunnerEvents
+and media files back to the server over a multiprocessing Connection.
+
+Widget state (including st.session_state) lives in the worker. Uploaded
+files are mirrored into the worker when they change. st.cache is local to
+each worker.
+
+Running this module starts a worker process. This is done by the server;
+it's not meant to be run by hand.
+"""
+
+import os
+import pickle
+import secrets
+import subprocess
+import sys
+import threading
+import time
+from multiprocessing.connection import Client, Connection, Listener
+from typing import Any, Dict, List, Optional, Set
+
+from blinker import Signal
+
+from streamlit import caching
+from streamlit import config
+from streamlit import type_util
+from streamlit import util
+from streamlit.arrow_table_manager import arrow_table_manager
+from streamlit.logger import get_logger
+from streamlit.media_file_manager import media_file_manager
+from streamlit.proto.ClientState_pb2 import ClientState
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetStates
+from streamlit.report import Report
+from streamlit.script_request_queue import RerunData
+from streamlit.script_request_queue import ScriptRequest
+from streamlit.script_request_queue import ScriptRequestQueue
+from streamlit.script_runner import ScriptRunner
+from streamlit.script_runner import ScriptRunnerEvent
+from streamlit.state.session_state import SessionState
+from streamlit.uploaded_file_manager import UploadedFileManager
+
+LOGGER = get_logger(__name__)
+
+# The worker reads its connection's authkey from this environment variable,
+# so that the key doesn't show up in the process list.
+_AUTHKEY_ENV_VAR = "STREAMLIT_SCRIPT_WORKER_AUTHKEY"
+
+# How long to wait for a newly-started worker to connect to the server.
+_WORKER_START_TIMEOUT_SECS = 60
+
+# How often a ProcessScriptRunner checks its ScriptRequestQueue for requests
+# to forward while its worker is running the script.
+_REQUEST_POLL_INTERVAL_SECS = 0.01
+
+# Message kinds sent from the server to a worker.
+_MSG_INIT = "init"
+_MSG_REQUEST = "request"
+_MSG_CLEAR_CACHE = "clear_cache"
+_MSG_CLOSE_SESSION = "close_session"
+
+# Message kinds sent from a worker to the server.
+_MSG_FORWARD_MSG = "forward_msg"
+_MSG_EVENT = "event"
+_MSG_MEDIA_FILE = "media_file"
+_MSG_ARROW_TABLE = "arrow_table"
+_MSG_IDLE = "idle"
+
+
+class ProcessScriptRunner(object):
+    """A ScriptRunner stand-in that runs the script in a worker process.
+
+    It has the same interface and lifecycle as ScriptRunner: it processes
+    its ScriptRequestQueue until it's empty, emitting the same
+    ScriptRunnerEvents, and then shuts down. But instead of running the
+    script itself, it forwards each request to its session's worker and
+    waits for the worker to become idle.
+    """
+
+    def __init__(
+        self,
+        session_id,
+        report,
+        enqueue_forward_msg,
+        client_state,
+        request_queue,
+        session_state,
+        uploaded_file_mgr=None,
+        fragment_storage=None,
+    ):
+        """Initialize the ProcessScriptRunner.
+
+        (The ProcessScriptRunner won't start executing until start() is
+        called.)
+
+        Parameters
+        ----------
+        See ScriptRunner. session_state is unused, since widget state lives
+        in the worker process. fragment_storage is unused too, so widget
+        changes always rerun the whole script.
+
+        """
+        self._session_id = session_id
+        self._report = report
+        self._enqueue_forward_msg = enqueue_forward_msg
+        self._client_state = client_state
+        self._request_queue = request_queue
+        self._uploaded_file_mgr = uploaded_file_mgr
+
+        self.on_event = Signal(
+            doc="""Emitted when a ScriptRunnerEvent occurs.
+
+            See ScriptRunner.on_event.
+            """
+        )
+
+        self._shutdown_requested = False
+
+        # Guards _seq and _worker_exited.
+        self._lock = threading.Lock()
+
+        # Sequence number of the last request forwarded to the worker.
+        self._seq = 0
+
+        # Set when the worker has processed our last forwarded request and
+        # has no more script runs to do.
+        self._idle = threading.Event()
+        self._worker_exited = False
+
+        self._worker: Optional[_WorkerProcess] = None
+
+        # This is initialized in start()
+        self._request_thread = None
+
+    def __repr__(self) -> str:
+        return util.repr_(self)
+
+    def start(self):
+        """Start a new thread to process the ScriptEventQueue.
+
+        This must be called only once.
+
+        """
+        if self._request_thread is not None:
+            raise Exception("ProcessScriptRunner was already started")
+
+        self._request_thread = threading.Thread(
+            target=self._process_request_queue,
+            name="ProcessScriptRunner.requestThread",
+        )
+        self._request_thread.start()
+
+    def maybe_handle_execution_control_request(self):
+        # Execution control happens inside the worker process. Our request
+        # thread forwards STOP and RERUN requests to it as they arrive.
+        pass
+
+    def request_interrupt(self):
+        # See maybe_handle_execution_control_request.
+        pass
+
+    def _process_request_queue(self):
+        """Process the ScriptRequestQueue and then exits.
+
+        This is run in a separate thread.
+
+        """
+        LOGGER.debug("Beginning request thread")
+
+        while not self._shutdown_requested and self._request_queue.has_request:
+            request, data = self._request_queue.dequeue()
+            if request == ScriptRequest.STOP:
+                LOGGER.debug("Ignoring STOP request while not running")
+            elif request == ScriptRequest.SHUTDOWN:
+                LOGGER.debug("Shutting down")
+                self._shutdown_requested = True
+            elif request == ScriptRequest.RERUN:
+                self._run_script(data)
+            else:
+                raise RuntimeError("Unrecognized ScriptRequest: %s" % request)
+
+        if self._worker is not None:
+            self._worker.unregister_runner(self._session_id, self)
+
+        self.on_event.send(ScriptRunnerEvent.SHUTDOWN, client_state=self._client_state)
+
+    def _run_script(self, rerun_data):
+        try:
+            worker = get_script_process_pool(self._report).get_worker(self._session_id)
+        except Exception as e:
+            LOGGER.error("Failed to start a script worker process", exc_info=e)
+            self.on_event.send(
+                ScriptRunnerEvent.SCRIPT_STOPPED_WITH_COMPILE_ERROR, exception=e
+            )
+            return
+
+        if worker is not self._worker:
+            if self._worker is not None:
+                self._worker.unregister_runner(self._session_id, self)
+            self._worker = worker
+            self._worker_exited = False
+            worker.register_runner(self._session_id, self)
+
+        self._forward_request(ScriptRequest.RERUN, rerun_data)
+
+        # While the worker runs the script, forward any STOP or RERUN
+        # requests that arrive so that it can handle them promptly.
+        while not self._idle.wait(_REQUEST_POLL_INTERVAL_SECS):
+            request, data = self._request_queue.dequeue()
+            if request is None:
+                continue
+
+            LOGGER.debug("Forwarding ScriptRequest: %s", request)
+            if request == ScriptRequest.SHUTDOWN:
+                self._shutdown_requested = True
+                self._forward_request(ScriptRequest.STOP)
+            else:
+                self._forward_request(request, data)
+
+        if self._worker_exited:
+            self.on_event.send(
+                ScriptRunnerEvent.SCRIPT_STOPPED_WITH_COMPILE_ERROR,
+                exception=RuntimeError(
+                    "The script worker process exited unexpectedly."
+                ),
+            )
+
+    def _forward_request(self, request, data=None):
+        with self._lock:
+            if self._worker_exited:
+                return
+            self._seq += 1
+            seq = self._seq
+            self._idle.clear()
+
+        payload = None
+        if request == ScriptRequest.RERUN:
+            payload = self._worker.make_rerun_payload(
+                self._session_id, data, self._uploaded_file_mgr
+            )
+
+        try:
+            self._worker.send(
+                _MSG_REQUEST, self._session_id, seq, request.value, payload
+            )
+        except (OSError, EOFError):
+            self.on_worker_exited()
+
+    def on_worker_message(self, kind: str, args: List[Any]) -> None:
+        """Handle a message that our worker sent for our session.
+
+        This is called on the worker's reader thread.
+        """
+        if kind == _MSG_FORWARD_MSG:
+            msg = ForwardMsg()
+            msg.ParseFromString(args[0])
+            self._enqueue_forward_msg(msg)
+
+        elif kind == _MSG_EVENT:
+            event = ScriptRunnerEvent(args[0])
+            if event == ScriptRunnerEvent.SCRIPT_STARTED:
+                # Mirror ScriptRunner: reset media files before each run.
+                media_file_manager.clear_session_files(self._session_id)
+
+            if event == ScriptRunnerEvent.SCRIPT_STOPPED_WITH_COMPILE_ERROR:
+                self.on_event.send(event, exception=args[1])
+            else:
+                self.on_event.send(event)
+
+            if event == ScriptRunnerEvent.SCRIPT_STOPPED_WITH_SUCCESS:
+                media_file_manager.del_expired_files()
+
+        elif kind == _MSG_IDLE:
+            seq, client_state_bytes = args
+            with self._lock:
+                if seq != self._seq:
+                    # The worker hasn't processed our latest request yet.
+                    return
+                self._client_state = ClientState()
+                self._client_state.ParseFromString(client_state_bytes)
+                self._idle.set()
+
+    def on_worker_exited(self) -> None:
+        """Called if our worker process goes away."""
+        with self._lock:
+            self._worker_exited = True
+            self._idle.set()
+
+
+class _WorkerProcess(object):
+    """The server's handle to a single script worker process."""
+
+    def __init__(self, name: str, report: Report):
+        authkey = secrets.token_bytes(32)
+        listener = Listener(authkey=authkey)
+
+        env = dict(os.environ)
+        env[_AUTHKEY_ENV_VAR] = authkey.hex()
+        self._process = subprocess.Popen(
+            [sys.executable, "-m", __name__, str(listener.address)], env=env
+        )
+
+        self._conn = _accept_with_timeout(
+            listener, self._process, _WORKER_START_TIMEOUT_SECS
+        )
+        if self._conn is None:
+            self._process.kill()
+            raise RuntimeError("The script worker process failed to start.")
+
+        self.name = name
+        self._send_lock = threading.Lock()
+
+        # Guards the dicts below.
+        self._lock = threading.Lock()
+        self._session_ids: Set[str] = set()
+        self._runners: Dict[str, ProcessScriptRunner] = {}
+
+        # session_id -> {widget_id: [file_id]}, for the uploaded files we
+        # last mirrored into the worker.
+        self._uploaded_file_ids: Dict[str, Dict[str, List[int]]] = {}
+
+        self.is_alive = True
+
+        self.send(
+            _MSG_INIT,
+            report.script_path,
+            report.command_line,
+            sys.argv,
+            _get_flag_options(),
+        )
+
+        self._reader_thread = threading.Thread(
+            target=self._read_loop, name="%s.readerThread" % name, daemon=True
+        )
+        self._reader_thread.start()
+
+    def __repr__(self) -> str:
+        return util.repr_(self)
+
+    @property
+    def num_sessions(self) -> int:
+        with self._lock:
+            return len(self._session_ids)
+
+    def add_session(self, session_id: str) -> None:
+        with self._lock:
+            self._session_ids.add(session_id)
+
+    def remove_session(self, session_id: str) -> None:
+        with self._lock:
+            self._session_ids.discard(session_id)
+            self._uploaded_file_ids.pop(session_id, None)
+        self._try_send(_MSG_CLOSE_SESSION, session_id)
+
+    def register_runner(self, session_id: str, runner: ProcessScriptRunner) -> None:
+        with self._lock:
+            self._runners[session_id] = runner
+            is_alive = self.is_alive
+        if not is_alive:
+            runner.on_worker_exited()
+
+    def unregister_runner(self, session_id: str, runner: ProcessScriptRunner) -> None:
+        with self._lock:
+            if self._runners.get(session_id) is runner:
+                del self._runners[session_id]
+
+    def make_rerun_payload(
+        self,
+        session_id: str,
+        rerun_data: RerunData,
+        uploaded_file_mgr: Optional[UploadedFileManager],
+    ):
+        widget_states = None
+        if rerun_data.widget_states is not None:
+            widget_states = rerun_data.widget_states.SerializeToString()
+
+        # Only send the session's uploaded files if they've changed since we
+        # last sent them, since they can be large.
+        files = None
+        next_file_id = None
+        if uploaded_file_mgr is not None:
+            session_files = uploaded_file_mgr.get_session_files(session_id)
+            file_ids = {
+                widget_id: [f.id for f in file_list]
+                for widget_id, file_list in session_files.items()
+            }
+            with self._lock:
+                if file_ids != self._uploaded_file_ids.get(session_id, {}):
+                    self._uploaded_file_ids[session_id] = file_ids
+                    files = session_files
+                    next_file_id = uploaded_file_mgr.next_file_id
+
+        return rerun_data.query_string, widget_states, files, next_file_id
+
+    def send(self, *msg: Any) -> None:
+        with self._send_lock:
+            self._conn.send(msg)
+
+    def _try_send(self, *msg: Any) -> None:
+        try:
+            self.send(*msg)
+        except (OSError, EOFError):
+            pass
+
+    def clear_cache(self, session_id: str) -> None:
+        self._try_send(_MSG_CLEAR_CACHE, session_id)
+
+    def stop(self) -> None:
+        """Terminate the worker process."""
+        self._process.terminate()
+        self._process.wait()
+
+    def _read_loop(self) -> None:
+        while True:
+            try:
+                msg = self._conn.recv()
+            except (OSError, EOFError):
+                break
+
+            kind, session_id, *args = msg
+            if kind == _MSG_MEDIA_FILE:
+                content, mimetype, coordinates = args
+                media_file_manager.add(
+                    content, mimetype, coordinates, session_id=session_id
+                )
+                continue
+
+            if kind == _MSG_ARROW_TABLE:
+                table_id, content, coordinates = args
+                arrow_table_manager.add(
+                    _bytes_to_pyarrow_table(content),
+                    coordinates,
+                    session_id=session_id,
+                    table_id=table_id,
+                )
+                continue
+
+            with self._lock:
+                runner = self._runners.get(session_id)
+
+            if runner is not None:
+                runner.on_worker_message(kind, args)
+            else:
+                LOGGER.debug("Dropping %s message for session %s", kind, session_id)
+
+        LOGGER.warning("Script worker %s exited", self.name)
+        with self._lock:
+            self.is_alive = False
+            runners = list(self._runners.values())
+        for runner in runners:
+            runner.on_worker_exited()
+
+        self._conn.close()
+        self._process.wait()
+
+
+class ScriptProcessPool(object):
+    """A pool of script worker processes.
+
+    Each session is assigned to the worker with the fewest sessions, and
+    stays on it (so that its widget state and st.cache entries stay put)
+    until it's released or the worker dies. Workers are started on demand,
+    up to max_processes.
+    """
+
+    def __init__(self, report: Report, max_processes: int):
+        self._report = report
+        self._max_processes = max_processes
+        self._lock = threading.Lock()
+        self._workers: List[_WorkerProcess] = []
+        self._workers_by_session: Dict[str, _WorkerProcess] = {}
+        self._num_workers_started = 0
+
+    def __repr__(self) -> str:
+        return util.repr_(self)
+
+    def get_worker(self, session_id: str) -> "_WorkerProcess":
+        """Return the worker for the given session, assigning one if needed.
+
+        This may start a new worker process, which can take a moment, so it
+        should not be called on the main thread.
+        """
+        with self._lock:
+            worker = self._workers_by_session.get(session_id)
+            if worker is not None and worker.is_alive:
+                return worker
+
+            self._workers = [w for w in self._workers if w.is_alive]
+            if len(self._workers) < self._max_processes:
+                worker = _WorkerProcess(
+                    "ScriptWorker-%s" % self._num_workers_started, self._report
+                )
+                self._num_workers_started += 1
+                self._workers.append(worker)
+            else:
+                worker = min(self._workers, key=lambda w: w.num_sessions)
+
+            worker.add_session(session_id)
+            self._workers_by_session[session_id] = worker
+            return worker
+
+    def release_session(self, session_id: str) -> None:
+        """Drop the given session's state from its worker."""
+        with self._lock:
+            worker = self._workers_by_session.pop(session_id, None)
+        if worker is not None:
+            worker.remove_session(session_id)
+
+    def clear_cache(self, session_id: str) -> None:
+        """Clear st.cache in every worker, and the session's widget state."""
+        with self._lock:
+            workers = list(self._workers)
+        for worker in workers:
+            worker.clear_cache(session_id)
+
+    def shutdown(self) -> None:
+        """Stop all worker processes."""
+        with self._lock:
+            workers = self._workers
+            self._workers = []
+            self._workers_by_session.clear()
+        for worker in workers:
+            worker.stop()
+
+
+_pool: Optional[ScriptProcessPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_script_process_pool(report: Report) -> ScriptProcessPool:
+    """Return the process-wide ScriptProcessPool, creating it if needed."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            max_processes = config.get_option("runner.maxScriptProcesses")
+            if max_processes <= 0:
+                max_processes = os.cpu_count() or 1
+            _pool = ScriptProcessPool(report, max_processes)
+        return _pool
+
+
+def release_session(session_id: str) -> None:
+    """Release a session's worker state, if the pool exists."""
+    pool = _pool
+    if pool is not None:
+        pool.release_session(session_id)
+
+
+def clear_cache(session_id: str) -> None:
+    """Clear st.cache in all workers, if the pool exists."""
+    pool = _pool
+    if pool is not None:
+        pool.clear_cache(session_id)
+
+
+def _get_flag_options() -> Dict[str, Any]:
+    """Return the config options that were set via command-line flags or
+    environment variables, so that workers can be configured the same way.
+    """
+    return {
+        key: option.value
+        for key, option in config.get_config_options().items()
+        if option.where_defined == config._DEFINED_BY_FLAG
+    }
+
+
+def _accept_with_timeout(
+    listener: Listener, process: subprocess.Popen, timeout: float
+) -> Optional[Connection]:
+    """Accept the worker's connection on listener.
+
+    Returns None if the worker process exits, or doesn't connect within
+    timeout seconds.
+    """
+    result: List[Connection] = []
+
+    def accept():
+        try:
+            result.append(listener.accept())
+        except (OSError, EOFError):
+            pass
+
+    # accept() can't be interrupted, so we run it on a daemon thread that we
+    # abandon if the worker never connects.
+    thread = threading.Thread(
+        target=accept, name="ScriptWorker.acceptThread", daemon=True
+    )
+    thread.start()
+
+    deadline = time.monotonic() + timeout
+    while thread.is_alive():
+        if process.poll() is not None or time.monotonic() > deadline:
+            return None
+        thread.join(0.1)
+
+    listener.close()
+    return result[0] if result else None
+
+
+def _make_picklable(exception: Optional[BaseException]) -> Optional[BaseException]:
+    if exception is None:
+        return None
+    try:
+        pickle.dumps(exception)
+        return exception
+    except Exception:
+        return RuntimeError("%s: %s" % (type(exception).__name__, exception))
+
+
+class _WorkerSession(object):
+    """A session's script state inside a worker process.
+
+    This mirrors the script-running half of ReportSession: it owns the
+    session's ScriptRequestQueue and SessionState, and creates a new
+    ScriptRunner whenever there are requests to process.
+    """
+
+    def __init__(self, worker, session_id, report, uploaded_file_mgr):
+        self._worker = worker
+        self._session_id = session_id
+        self._report = report
+        self._uploaded_file_mgr = uploaded_file_mgr
+
+        self._lock = threading.Lock()
+        self._request_queue = ScriptRequestQueue()
+        self._client_state = ClientState()
+        self._scriptrunner = None
+        self._is_shutdown = False
+
+        # Sequence number of the last request we received.
+        self._seq = 0
+
+        self.session_state = SessionState()
+
+    def __repr__(self) -> str:
+        return util.repr_(self)
+
+    def enqueue_request(self, request, payload, seq):
+        data = None
+        if request == ScriptRequest.RERUN:
+            query_string, widget_states_bytes, files, next_file_id = payload
+
+            widget_states = None
+            if widget_states_bytes is not None:
+                widget_states = WidgetStates()
+                widget_states.ParseFromString(widget_states_bytes)
+
+            if files is not None:
+                self._uploaded_file_mgr.set_session_files(
+                    self._session_id, files, next_file_id
+                )
+
+            data = RerunData(query_string, widget_states)
+
+        with self._lock:
+            self._seq = seq
+            self._request_queue.enqueue(request, data)
+            if self._scriptrunner is not None:
+                self._scriptrunner.request_interrupt()
+            self._maybe_create_scriptrunner()
+
+    def shutdown(self):
+        with self._lock:
+            self._is_shutdown = True
+            if self._scriptrunner is not None:
+                self._request_queue.enqueue(ScriptRequest.SHUTDOWN)
+        media_file_manager.clear_session_files(self._session_id)
+
+    def _maybe_create_scriptrunner(self):
+        if (
+            self._is_shutdown
+            or self._scriptrunner is not None
+            or not self._request_queue.has_request
+        ):
+            return
+
+        self._scriptrunner = ScriptRunner(
+            session_id=self._session_id,
+            report=self._report,
+            enqueue_forward_msg=self._enqueue_forward_msg,
+            client_state=self._client_state,
+            request_queue=self._request_queue,
+            session_state=self.session_state,
+            uploaded_file_mgr=self._uploaded_file_mgr,
+        )
+        self._scriptrunner.on_event.connect(self._on_scriptrunner_event)
+        self._scriptrunner.start()
+
+    def _enqueue_forward_msg(self, msg):
+        # See ReportSession.enqueue.
+        if not config.get_option("runner.installTracer"):
+            scriptrunner = self._scriptrunner
+            if scriptrunner is not None:
+                scriptrunner.maybe_handle_execution_control_request()
+
+        self._worker.send(_MSG_FORWARD_MSG, self._session_id, msg.SerializeToString())
+
+    def _on_scriptrunner_event(self, event, exception=None, client_state=None):
+        if event == ScriptRunnerEvent.SHUTDOWN:
+            with self._lock:
+                self._client_state = client_state
+                self._scriptrunner = None
+                self._maybe_create_scriptrunner()
+                if self._scriptrunner is None:
+                    self._worker.send(
+                        _MSG_IDLE,
+                        self._session_id,
+                        self._seq,
+                        client_state.SerializeToString(),
+                    )
+        else:
+            self._worker.send(
+                _MSG_EVENT, self._session_id, event.value, _make_picklable(exception)
+            )
+
+
+class _ScriptWorker(object):
+    """The main loop of a script worker process."""
+
+    def __init__(self, conn: Connection, report: Report):
+        self._conn = conn
+        self._report = report
+        self._send_lock = threading.Lock()
+        self._sessions: Dict[str, _WorkerSession] = {}
+        self._closed_session_ids: Set[str] = set()
+        self._uploaded_file_mgr = UploadedFileManager()
+
+        media_file_manager.on_file_added.connect(self._on_media_file_added)
+        arrow_table_manager.on_table_added.connect(self._on_arrow_table_added)
+
+    def __repr__(self) -> str:
+        return util.repr_(self)
+
+    def send(self, *msg: Any) -> None:
+        with self._send_lock:
+            self._conn.send(msg)
+
+    def run(self) -> None:
+        while True:
+            try:
+                msg = self._conn.recv()
+            except (OSError, EOFError):
+                # The server went away.
+                return
+
+            kind, session_id, *args = msg
+            if kind == _MSG_REQUEST:
+                seq, request_value, payload = args
+                if session_id in self._closed_session_ids:
+                    self.send(
+                        _MSG_IDLE, session_id, seq, ClientState().SerializeToString()
+                    )
+                    continue
+
+                session = self._sessions.get(session_id)
+                if session is None:
+                    session = _WorkerSession(
+                        self, session_id, self._report, self._uploaded_file_mgr
+                    )
+                    self._sessions[session_id] = session
+                session.enqueue_request(ScriptRequest(request_value), payload, seq)
+
+            elif kind == _MSG_CLEAR_CACHE:
+                caching.clear_cache()
+                session = self._sessions.get(session_id)
+                if session is not None:
+                    session.session_state.clear_state()
+
+            elif kind == _MSG_CLOSE_SESSION:
+                self._closed_session_ids.add(session_id)
+                session = self._sessions.pop(session_id, None)
+                if session is not None:
+                    session.shutdown()
+                self._uploaded_file_mgr.remove_session_files(session_id)
+
+            else:
+                LOGGER.error("Unrecognized worker message: %s", kind)
+
+    def _on_media_file_added(self, session_id, media_file, coordinates):
+        self.send(
+            _MSG_MEDIA_FILE,
+            session_id,
+            media_file.content,
+            media_file.mimetype,
+            coordinates,
+        )
+
+    def _on_arrow_table_added(self, session_id, table_id, table, coordinates):
+        # The server serves the table's pages, so it needs its own copy.
+        # Ours is dropped right away.
+        self.send(
+            _MSG_ARROW_TABLE,
+            session_id,
+            table_id,
+            type_util.pyarrow_table_to_bytes(table),
+            coordinates,
+        )
+        arrow_table_manager.remove(table_id)
+
+
+def _bytes_to_pyarrow_table(content):
+    import pyarrow as pa
+
+    return pa.ipc.open_stream(content).read_all()
+
+
+def _worker_main() -> None:
+    import streamlit
+    from streamlit import bootstrap
+
+    address = sys.argv[1]
+    authkey = bytes.fromhex(os.environ.pop(_AUTHKEY_ENV_VAR))
+    conn = Client(address, authkey=authkey)
+
+    kind, script_path, command_line, argv, flag_options = conn.recv()
+    assert kind == _MSG_INIT
+
+    # Set up the process the same way `streamlit run` sets up the server.
+    streamlit._is_running_with_streamlit = True
+    config.get_config_options(force_reparse=True, options_from_flags=flag_options)
+    sys.argv = argv
+    bootstrap._fix_sys_path(script_path)
+    bootstrap._fix_matplotlib_crash()
+
+    _ScriptWorker(conn, Report(script_path, command_line)).run()
+
+
+if __name__ == "__main__":
+    _worker_main()
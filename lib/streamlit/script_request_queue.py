@@ -13,10 +13,12 @@
 # limitations under the License.
 
 import threading
+import time
 from collections import deque
 from enum import Enum
 from typing import Any, Tuple, Deque
 
+from streamlit import metrics
 from streamlit import util
 from streamlit.proto.ClientState_pb2 import ClientState
 from streamlit.state.widgets import coalesce_widget_states
@@ -51,7 +53,11 @@ class ScriptRequestQueue(object):
 
     def __init__(self):
         self._lock = threading.Lock()
+        # Notified whenever a request is enqueued. Used by debounce_rerun.
+        self._request_enqueued = threading.Condition(self._lock)
         self._queue = deque()  # type: Deque[Tuple[ScriptRequest, Any]]
+        # time.monotonic() of the most recent RERUN request.
+        self._last_rerun_time = 0.0
 
     @property
     def has_request(self):
@@ -81,48 +87,19 @@ class ScriptRequestQueue(object):
                 # queue to be processed immediately.
                 self._queue.appendleft((request, data))
             elif request == ScriptRequest.RERUN:
+                self._last_rerun_time = time.monotonic()
                 index = _index_if(self._queue, lambda item: item[0] == request)
                 if index >= 0:
                     _, old_data = self._queue[index]
-
-                    if old_data.widget_states is None:
-                        # The existing request's widget_states is None, which
-                        # means it wants to rerun with whatever the most
-                        # recent script execution's widget state was.
-                        # We have no meaningful state to merge with, and
-                        # so we simply overwrite the existing request.
-                        self._queue[index] = (
-                            request,
-                            RerunData(
-                                query_string=data.query_string,
-                                widget_states=data.widget_states,
-                            ),
-                        )
-                    elif data.widget_states is None:
-                        # If this request's widget_states is None, and the
-                        # existing request's widget_states was not, this
-                        # new request is entirely redundant and can be dropped.
-                        # TODO: Figure out if this should even happen. This sounds like it should
-                        # raise an exception...
-                        pass
-                    else:
-                        # Both the existing and the new request have
-                        # non-null widget_states. Merge them together.
-                        coalesced_states = coalesce_widget_states(
-                            old_data.widget_states, data.widget_states
-                        )
-                        self._queue[index] = (
-                            request,
-                            RerunData(
-                                query_string=data.query_string,
-                                widget_states=coalesced_states,
-                            ),
-                        )
+                    self._queue[index] = (request, _coalesce_rerun_data(old_data, data))
+                    metrics.Client.get("streamlit_rerun_requests_coalesced_total").inc()
                 else:
                     self._queue.append((request, data))
             else:
                 self._queue.append((request, data))
 
+            self._request_enqueued.notify_all()
+
     def dequeue(self):
         """Pops the front-most request from the queue and returns it.
 
@@ -138,6 +115,89 @@ class ScriptRequestQueue(object):
             else:
                 return None, None
 
+    def debounce_rerun(self, rerun_data, debounce_secs):
+        """Wait for more RERUN requests before starting a rerun.
+
+        Blocks until no RERUN request has been enqueued for debounce_secs,
+        then pops any RERUN request that's waiting at the front of the queue
+        and merges it into rerun_data. This lets a burst of widget changes
+        (e.g. typing, or dragging a slider) result in a single script run.
+
+        The wait is cut short if any other request reaches the front of the
+        queue, and is never longer than _MAX_DEBOUNCE_WINDOWS * debounce_secs,
+        so that a steady stream of requests can't stall the script.
+
+        Parameters
+        ----------
+        rerun_data : RerunData
+            The data of the rerun that's about to start.
+
+        debounce_secs : float
+            The debounce window. If 0, this returns rerun_data immediately.
+
+        Returns
+        -------
+        RerunData
+            The data to rerun with.
+
+        """
+        if debounce_secs <= 0:
+            return rerun_data
+
+        with self._lock:
+            deadline = time.monotonic() + _MAX_DEBOUNCE_WINDOWS * debounce_secs
+            while True:
+                if len(self._queue) > 0 and self._queue[0][0] != ScriptRequest.RERUN:
+                    break
+
+                now = time.monotonic()
+                timeout = min(self._last_rerun_time + debounce_secs, deadline) - now
+                if timeout <= 0:
+                    break
+                self._request_enqueued.wait(timeout)
+
+            if len(self._queue) > 0 and self._queue[0][0] == ScriptRequest.RERUN:
+                _, data = self._queue.popleft()
+                rerun_data = _coalesce_rerun_data(rerun_data, data)
+                metrics.Client.get("streamlit_rerun_requests_coalesced_total").inc()
+
+        return rerun_data
+
+
+# The most that debounce_rerun will delay a rerun, in debounce windows.
+_MAX_DEBOUNCE_WINDOWS = 5
+
+
+def _coalesce_rerun_data(old_data, new_data):
+    """Combine two RerunDatas, with new_data taking precedence."""
+    if old_data.widget_states is None:
+        # The existing request's widget_states is None, which
+        # means it wants to rerun with whatever the most
+        # recent script execution's widget state was.
+        # We have no meaningful state to merge with, and
+        # so we simply overwrite the existing request.
+        return RerunData(
+            query_string=new_data.query_string,
+            widget_states=new_data.widget_states,
+        )
+    elif new_data.widget_states is None:
+        # If this request's widget_states is None, and the
+        # existing request's widget_states was not, this
+        # new request is entirely redundant and can be dropped.
+        # TODO: Figure out if this should even happen. This sounds like it should
+        # raise an exception...
+        return old_data
+    else:
+        # Both the existing and the new request have
+        # non-null widget_states. Merge them together.
+        coalesced_states = coalesce_widget_states(
+            old_data.widget_states, new_data.widget_states
+        )
+        return RerunData(
+            query_string=new_data.query_string,
+            widget_states=coalesced_states,
+        )
+
 
 def _index_if(collection, pred):
     """Find the index of the first item in a collection for which a predicate is true.
@@ -15,20 +15,22 @@
 import sys
 import threading
 import gc
+import platform
 from contextlib import contextmanager
 from enum import Enum
 
 from blinker import Signal
 
 from streamlit import config
-from streamlit import magic
-from streamlit import source_util
+from streamlit import metrics
 from streamlit import util
 from streamlit.error_util import handle_uncaught_app_exception
 from streamlit.media_file_manager import media_file_manager
-from streamlit.report_thread import ReportThread, ReportContext
+from streamlit.report_thread import ReportContext
 from streamlit.report_thread import get_report_ctx
-from streamlit.script_request_queue import ScriptRequest
+from streamlit.script_cache import script_cache
+from streamlit.script_request_queue import RerunData, ScriptRequest
+from streamlit.script_thread_pool import ScriptJob, get_script_thread_pool
 from streamlit.state.session_state import SessionState
 from streamlit.logger import get_logger
 from streamlit.proto.ClientState_pb2 import ClientState
@@ -62,6 +64,7 @@ class ScriptRunner(object):
         request_queue,
         session_state,
         uploaded_file_mgr=None,
+        fragment_storage=None,
     ):
         """Initialize the ScriptRunner.
 
@@ -89,12 +92,17 @@ class ScriptRunner(object):
         uploaded_file_mgr : UploadedFileManager
             The File manager to store the data uploaded by the file_uploader widget.
 
+        fragment_storage : FragmentStorage | None
+            The ReportSession's FragmentStorage. If None, widget changes
+            always rerun the whole script.
+
         """
         self._session_id = session_id
         self._report = report
         self._enqueue_forward_msg = enqueue_forward_msg
         self._request_queue = request_queue
         self._uploaded_file_mgr = uploaded_file_mgr
+        self._fragment_storage = fragment_storage
 
         self._client_state = client_state
         self._session_state: SessionState = session_state
@@ -124,34 +132,61 @@ class ScriptRunner(object):
         self._shutdown_requested = False
 
         # Set to true while we're executing. Used by
-        # maybe_handle_execution_control_request.
+        # maybe_handle_execution_control_request and request_interrupt.
         self._execing = False
 
+        # Set to true when request_interrupt has scheduled an
+        # InterruptException in the script thread that hasn't fired yet.
+        self._interrupt_pending = False
+
+        # Guards _execing and _interrupt_pending, so that we never schedule an
+        # InterruptException once the script thread has left exec().
+        self._execing_lock = threading.Lock()
+
         # This is initialized in start()
-        self._script_thread = None
+        self._script_job = None
 
     def __repr__(self) -> str:
         return util.repr_(self)
 
     def start(self):
-        """Start a new thread to process the ScriptEventQueue.
+        """Schedule the ScriptEventQueue to be processed on a script thread.
 
-        This must be called only once.
+        The work is submitted to the shared ScriptThreadPool, so it may be
+        queued until a thread is free. This must be called only once.
 
         """
-        if self._script_thread is not None:
+        if self._script_job is not None:
             raise Exception("ScriptRunner was already started")
 
-        self._script_thread = ReportThread(
+        ctx = ReportContext(
             session_id=self._session_id,
-            enqueue=self._enqueue_forward_msg,
+            enqueue=self._enqueue,
             query_string=self._client_state.query_string,
             session_state=self._session_state,
             uploaded_file_mgr=self._uploaded_file_mgr,
-            target=self._process_request_queue,
-            name="ScriptRunner.scriptThread",
+            fragment_storage=self._fragment_storage,
         )
-        self._script_thread.start()
+        self._script_job = ScriptJob(ctx, self._process_request_queue)
+        get_script_thread_pool().submit(self._script_job)
+
+    def _enqueue(self, msg):
+        """Enqueue a ForwardMsg from the script, recording it for fragment
+        reruns."""
+        storage = self._fragment_storage
+        if storage is None or not self._is_in_script_thread():
+            self._enqueue_forward_msg(msg)
+            return
+
+        if storage.is_outside_rerun(msg):
+            # The fragment being rerun is writing outside its container,
+            # which would overwrite other elements. Rerun the whole script
+            # instead. (Widget states were already applied.)
+            LOGGER.debug("Fragment wrote outside its container")
+            raise RerunException(RerunData(query_string=get_report_ctx().query_string))
+
+        self._enqueue_forward_msg(msg)
+        storage.record(msg)
 
     def _process_request_queue(self):
         """Process the ScriptRequestQueue and then exits.
@@ -169,7 +204,7 @@ class ScriptRunner(object):
                 LOGGER.debug("Shutting down")
                 self._shutdown_requested = True
             elif request == ScriptRequest.RERUN:
-                self._run_script(data)
+                self._run_script(self._debounce_rerun(data))
             else:
                 raise RuntimeError("Unrecognized ScriptRequest: %s" % request)
 
@@ -185,7 +220,13 @@ class ScriptRunner(object):
 
     def _is_in_script_thread(self):
         """True if the calling function is running in the script thread"""
-        return self._script_thread == threading.current_thread()
+        # Once our job is done, its thread may be running another session's
+        # job, so it's no longer our script thread.
+        return (
+            self._script_job is not None
+            and not self._script_job.is_done
+            and self._script_job.thread == threading.current_thread()
+        )
 
     def maybe_handle_execution_control_request(self):
         if not self._is_in_script_thread():
@@ -207,7 +248,12 @@ class ScriptRunner(object):
         if request is None:
             return
 
+        # We're handling the request ourselves, so an interrupt scheduled
+        # for it is no longer needed.
+        self._cancel_interrupt()
+
         LOGGER.debug("Received ScriptRequest: %s", request)
+        metrics.Client.get("streamlit_script_runs_interrupted_total").inc()
         if request == ScriptRequest.STOP:
             raise StopException()
         elif request == ScriptRequest.SHUTDOWN:
@@ -218,6 +264,45 @@ class ScriptRunner(object):
         else:
             raise RuntimeError("Unrecognized ScriptRequest: %s" % request)
 
+    def request_interrupt(self):
+        """Interrupt the running script so that it handles its next request.
+
+        Without a tracer, a running script only checks for STOP and RERUN
+        requests when it enqueues a ForwardMsg, so a long pure-Python loop
+        can't be stopped. This raises an InterruptException in the script
+        thread instead, which Python delivers between two bytecodes of the
+        script. The request itself stays in the queue, and is picked up when
+        the exception is caught.
+
+        This is a no-op if the script isn't running, if the tracer is
+        installed (since it already checks before every line), if the
+        runner.asyncInterrupt option is off, or if the Python interpreter
+        doesn't support asynchronous exceptions.
+
+        Unlike the other ScriptRunner methods, this can be called from any
+        thread.
+
+        """
+        if (
+            not _ASYNC_EXC_SUPPORTED
+            or not config.get_option("runner.asyncInterrupt")
+            or config.get_option("runner.installTracer")
+        ):
+            return
+
+        with self._execing_lock:
+            if not self._execing or self._interrupt_pending:
+                return
+            if _set_async_exc(self._script_job.thread, InterruptException):
+                self._interrupt_pending = True
+
+    def _cancel_interrupt(self):
+        """Cancel an InterruptException that hasn't been raised yet."""
+        with self._execing_lock:
+            if self._interrupt_pending:
+                _set_async_exc(self._script_job.thread, None)
+                self._interrupt_pending = False
+
     def _install_tracer(self):
         """Install function that runs before each line of the script."""
 
@@ -236,13 +321,16 @@ class ScriptRunner(object):
         Used by maybe_handle_execution_control_request to ensure that
         we only handle requests while we're inside an exec() call
         """
-        if self._execing:
-            raise RuntimeError("Nested set_execing_flag call")
-        self._execing = True
+        with self._execing_lock:
+            if self._execing:
+                raise RuntimeError("Nested set_execing_flag call")
+            self._execing = True
         try:
             yield
         finally:
-            self._execing = False
+            with self._execing_lock:
+                self._execing = False
+            self._cancel_interrupt()
 
     def _run_script(self, rerun_data):
         """Run our script.
@@ -257,9 +345,6 @@ class ScriptRunner(object):
 
         LOGGER.debug("Running script %s", rerun_data)
 
-        # Reset DeltaGenerators, widgets, media files.
-        media_file_manager.clear_session_files()
-
         ctx = get_report_ctx()
         if ctx is None:
             # This should never be possible on the script_runner thread.
@@ -270,31 +355,14 @@ class ScriptRunner(object):
         ctx.reset(query_string=rerun_data.query_string)
 
         self.on_event.send(ScriptRunnerEvent.SCRIPT_STARTED)
+        metrics.Client.get("streamlit_script_runs_started_total").inc()
 
         # Compile the script. Any errors thrown here will be surfaced
         # to the user via a modal dialog in the frontend, and won't result
         # in their previous report disappearing.
 
         try:
-            with source_util.open_python_file(self._report.script_path) as f:
-                filebody = f.read()
-
-            if config.get_option("runner.magicEnabled"):
-                filebody = magic.add_magic(filebody, self._report.script_path)
-
-            code = compile(
-                filebody,
-                # Pass in the file path so it can show up in exceptions.
-                self._report.script_path,
-                # We're compiling entire blocks of Python, so we need "exec"
-                # mode (as opposed to "eval" or "single").
-                mode="exec",
-                # Don't inherit any flags or "future" statements.
-                flags=0,
-                dont_inherit=1,
-                # Use the default optimization options.
-                optimize=-1,
-            )
+            code = script_cache.get_bytecode(self._report.script_path)
 
         except BaseException as e:
             # We got a compile error. Send an error event and bail immediately.
@@ -308,6 +376,20 @@ class ScriptRunner(object):
         # is to run it. Errors thrown during execution will be shown to the
         # user as ExceptionElements.
 
+        if rerun_data.widget_states is not None:
+            # Update the WidgetManager with the new widget_states.
+            # The old states, used to skip callbacks if values
+            # haven't changed, are also preserved in the
+            # WidgetManager.
+            self._session_state.compact_state()
+            self._session_state.set_from_proto(rerun_data.widget_states)
+
+        fragment = self._get_fragment_to_rerun(code, rerun_data)
+        if fragment is None:
+            # Reset media files. A fragment rerun keeps the files of the
+            # elements it resends from the last run.
+            media_file_manager.clear_session_files()
+
         if config.get_option("runner.installTracer"):
             self._install_tracer()
 
@@ -316,38 +398,40 @@ class ScriptRunner(object):
         rerun_with_data = None
 
         try:
-            # Create fake module. This gives us a name global namespace to
-            # execute the code in.
-            module = _new_module("__main__")
-
-            # Install the fake module as the __main__ module. This allows
-            # the pickle module to work inside the user's code, since it now
-            # can know the module where the pickled objects stem from.
-            # IMPORTANT: This means we can't use "if __name__ == '__main__'" in
-            # our code, as it will point to the wrong module!!!
-            sys.modules["__main__"] = module
-
-            # Add special variables to the module's globals dict.
-            # Note: The following is a requirement for the CodeHasher to
-            # work correctly. The CodeHasher is scoped to
-            # files contained in the directory of __main__.__file__, which we
-            # assume is the main script directory.
-            module.__dict__["__file__"] = self._report.script_path
+            if fragment is None:
+                # Create fake module. This gives us a name global namespace to
+                # execute the code in.
+                module = _new_module("__main__")
+
+                # Install the fake module as the __main__ module. This allows
+                # the pickle module to work inside the user's code, since it
+                # now can know the module where the pickled objects stem from.
+                # IMPORTANT: This means we can't use "if __name__ == '__main__'"
+                # in our code, as it will point to the wrong module!!!
+                sys.modules["__main__"] = module
+
+                # Add special variables to the module's globals dict.
+                # Note: The following is a requirement for the CodeHasher to
+                # work correctly. The CodeHasher is scoped to
+                # files contained in the directory of __main__.__file__, which
+                # we assume is the main script directory.
+                module.__dict__["__file__"] = self._report.script_path
 
             with modified_sys_path(self._report), self._set_execing_flag():
                 # Run callbacks for widgets whose values have changed.
                 if rerun_data.widget_states is not None:
-                    # Update the WidgetManager with the new widget_states.
-                    # The old states, used to skip callbacks if values
-                    # haven't changed, are also preserved in the
-                    # WidgetManager.
-                    self._session_state.compact_state()
-                    self._session_state.set_from_proto(rerun_data.widget_states)
-
                     self._session_state.call_callbacks()
 
+                if self._fragment_storage is not None:
+                    self._fragment_storage.begin_run(
+                        code, rerun_data.query_string, fragment
+                    )
+
                 ctx.on_script_start()
-                exec(code, module.__dict__)
+                if fragment is None:
+                    exec(code, module.__dict__)
+                else:
+                    self._rerun_fragment(fragment, ctx)
 
         except RerunException as e:
             rerun_with_data = e.rerun_data
@@ -355,10 +439,18 @@ class ScriptRunner(object):
         except StopException:
             pass
 
+        except InterruptException:
+            rerun_with_data = self._handle_interrupt()
+
         except BaseException as e:
             handle_uncaught_app_exception(e)
 
         finally:
+            if self._fragment_storage is not None:
+                self._fragment_storage.end_run(
+                    ctx.widget_ids_this_run.items(),
+                    finished=rerun_with_data is None,
+                )
             self._on_script_finished(ctx)
 
         # Use _log_if_error() to make sure we never ever ever stop running the
@@ -366,7 +458,68 @@ class ScriptRunner(object):
         _log_if_error(_clean_problem_modules)
 
         if rerun_with_data is not None:
-            self._run_script(rerun_with_data)
+            self._run_script(self._debounce_rerun(rerun_with_data))
+
+    def _get_fragment_to_rerun(self, code, rerun_data):
+        """Return the fragment to rerun instead of the whole script, if any.
+
+        This must be called after the new widget states are applied.
+        """
+        if self._fragment_storage is None or rerun_data.widget_states is None:
+            return None
+
+        changed_widget_ids = set(self._session_state.get_changed_widget_ids())
+        return self._fragment_storage.get_fragment_to_rerun(
+            code, rerun_data.query_string, changed_widget_ids
+        )
+
+    def _rerun_fragment(self, fragment, ctx):
+        """Rerun a single fragment of the last run.
+
+        Everything outside the fragment is resent as it was, so that the
+        browser doesn't remove it as stale when the run finishes. Since
+        unchanged elements are sent as cache references, this is cheap.
+        """
+        LOGGER.debug("Rerunning fragment %s", fragment.id)
+        metrics.Client.get("streamlit_fragment_reruns_total").inc()
+
+        for msg in self._fragment_storage.get_deltas_outside(fragment):
+            ctx.enqueue(msg)
+
+        # Keep the state of the widgets outside the fragment.
+        for widget_id in self._fragment_storage.get_widget_ids_outside(fragment):
+            ctx.widget_ids_this_run.add(widget_id)
+
+        self._fragment_storage.rerun(fragment)
+
+    def _debounce_rerun(self, rerun_data):
+        """Merge rerun requests that arrive within runner.rerunDebounceMs."""
+        debounce_ms = config.get_option("runner.rerunDebounceMs")
+        return self._request_queue.debounce_rerun(rerun_data, debounce_ms / 1000)
+
+    def _handle_interrupt(self):
+        """Handle the request that an InterruptException was raised for.
+
+        Returns
+        -------
+        RerunData | None
+            The data to rerun the script with, if the request was a RERUN.
+
+        """
+        with self._execing_lock:
+            self._interrupt_pending = False
+            # The exception may have landed in _set_execing_flag's cleanup,
+            # just after exec() returned.
+            self._execing = False
+
+        request, data = self._request_queue.dequeue()
+        LOGGER.debug("Script interrupted for ScriptRequest: %s", request)
+        metrics.Client.get("streamlit_script_runs_interrupted_total").inc()
+        if request == ScriptRequest.SHUTDOWN:
+            self._shutdown_requested = True
+        elif request == ScriptRequest.RERUN:
+            return data
+        return None
 
     def _on_script_finished(self, ctx: ReportContext) -> None:
         """Called when our script finishes executing, even if it finished
@@ -401,6 +554,16 @@ class StopException(ScriptControlException):
     pass
 
 
+class InterruptException(ScriptControlException):
+    """Raised asynchronously in the script thread by request_interrupt.
+
+    Asynchronous exceptions are raised from a class, so this carries no
+    data: the request that caused it is still in the ScriptRequestQueue.
+    """
+
+    pass
+
+
 class RerunException(ScriptControlException):
     """Silently stop and rerun the user's script."""
 
@@ -418,6 +581,31 @@ class RerunException(ScriptControlException):
         return util.repr_(self)
 
 
+# PyThreadState_SetAsyncExc is part of the CPython C API.
+_ASYNC_EXC_SUPPORTED = platform.python_implementation() == "CPython"
+
+
+def _set_async_exc(thread, exc_type):
+    """Schedule exc_type to be raised in the given thread.
+
+    Passing None for exc_type clears a previously scheduled exception.
+
+    Returns
+    -------
+    bool
+        True if the thread was found.
+
+    """
+    import ctypes
+
+    if exc_type is not None:
+        exc_type = ctypes.py_object(exc_type)
+    num_modified = ctypes.pythonapi.PyThreadState_SetAsyncExc(
+        ctypes.c_ulong(thread.ident), exc_type
+    )
+    return num_modified == 1
+
+
 def _clean_problem_modules():
     """Some modules are stateful, so we have to clear their state."""
 
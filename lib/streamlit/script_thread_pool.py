@@ -0,0 +1,180 @@
+# Copyright 2018-2021 Streamlit Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A pool of long-lived threads that ScriptRunners execute scripts on."""
+
+import sys
+import threading
+from collections import deque
+from typing import Callable, Deque, List, Optional
+
+from streamlit import config
+from streamlit import util
+from streamlit.logger import get_logger
+from streamlit.report_thread import REPORT_CONTEXT_ATTR_NAME
+from streamlit.report_thread import ReportContext
+from streamlit.report_thread import add_report_ctx
+
+LOGGER = get_logger(__name__)
+
+
+class ScriptJob(object):
+    """A unit of work submitted to a ScriptThreadPool.
+
+    A ScriptJob runs its target on one of the pool's threads, with its
+    ReportContext attached to that thread for the duration of the job.
+    """
+
+    def __init__(self, ctx: ReportContext, target: Callable[[], None]):
+        self.ctx = ctx
+        self.target = target
+
+        # The thread that is running (or that ran) this job. Set by the
+        # worker thread just before the target is invoked.
+        self.thread: Optional[threading.Thread] = None
+
+        self._done = threading.Event()
+
+    def __repr__(self) -> str:
+        return util.repr_(self)
+
+    @property
+    def is_done(self) -> bool:
+        return self._done.is_set()
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """Block until the job has finished running.
+
+        Returns
+        -------
+        bool
+            True if the job finished, or False if the timeout elapsed first.
+
+        """
+        return self._done.wait(timeout)
+
+
+class ScriptThreadPool(object):
+    """A bounded pool of long-lived script execution threads.
+
+    Starting a fresh thread (and a fresh ReportContext) for every script run
+    adds overhead to every rerun. Instead, ScriptRunners submit ScriptJobs to
+    this pool, which runs them on threads that are reused across runs and
+    across sessions.
+
+    The pool grows on demand up to max_threads. Once it's full, new jobs are
+    queued and run in the order they were submitted. Each session has at most
+    one ScriptRunner (and therefore at most one ScriptJob) at a time, so this
+    ordering is fair across sessions.
+    """
+
+    def __init__(self, max_threads: int = 0):
+        """Initialize the pool.
+
+        Parameters
+        ----------
+        max_threads : int
+            The maximum number of jobs that may run concurrently. 0 means
+            no limit.
+
+        """
+        self._max_threads = max_threads
+        self._cond = threading.Condition()
+        self._pending_jobs: Deque[ScriptJob] = deque()
+        self._threads: List[threading.Thread] = []
+        self._num_idle_threads = 0
+
+    def __repr__(self) -> str:
+        return util.repr_(self)
+
+    @property
+    def num_threads(self) -> int:
+        with self._cond:
+            return len(self._threads)
+
+    @property
+    def num_pending_jobs(self) -> int:
+        with self._cond:
+            return len(self._pending_jobs)
+
+    def submit(self, job: ScriptJob) -> None:
+        """Schedule a job to run on one of the pool's threads."""
+        with self._cond:
+            self._pending_jobs.append(job)
+
+            # Only create a new thread if there are more pending jobs than
+            # there are idle threads to pick them up.
+            if len(self._pending_jobs) > self._num_idle_threads and (
+                self._max_threads <= 0 or len(self._threads) < self._max_threads
+            ):
+                self._start_thread()
+
+            self._cond.notify()
+
+    def _start_thread(self) -> None:
+        thread = threading.Thread(
+            target=self._worker_loop,
+            name="ScriptRunner.scriptThread-%s" % len(self._threads),
+        )
+        # Pool threads sit idle for the lifetime of the server, so they must
+        # not keep the process alive on their own.
+        thread.daemon = True
+        self._threads.append(thread)
+        thread.start()
+
+    def _worker_loop(self) -> None:
+        thread = threading.current_thread()
+
+        while True:
+            with self._cond:
+                while len(self._pending_jobs) == 0:
+                    self._num_idle_threads += 1
+                    self._cond.wait()
+                    self._num_idle_threads -= 1
+                job = self._pending_jobs.popleft()
+
+            _run_job(thread, job)
+
+
+def _run_job(thread: threading.Thread, job: ScriptJob) -> None:
+    add_report_ctx(thread, job.ctx)
+    job.thread = thread
+    try:
+        job.target()
+    except BaseException as e:
+        LOGGER.error("Uncaught exception in script thread", exc_info=e)
+    finally:
+        # Don't leak per-run thread state into the next job that runs on
+        # this thread.
+        if hasattr(sys, "settrace"):
+            sys.settrace(None)
+        delattr(thread, REPORT_CONTEXT_ATTR_NAME)
+        job._done.set()
+
+
+_pool: Optional[ScriptThreadPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_script_thread_pool() -> ScriptThreadPool:
+    """Return the process-wide ScriptThreadPool, creating it if needed.
+
+    The pool is sized by the runner.maxScriptThreads config option at the
+    time of its creation.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ScriptThreadPool(config.get_option("runner.maxScriptThreads"))
+        return _pool
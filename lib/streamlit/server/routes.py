@@ -21,6 +21,7 @@ from streamlit import metrics
 from streamlit.logger import get_logger
 from streamlit.server.server_util import serialize_forward_msg
 from streamlit.media_file_manager import media_file_manager
+from streamlit.arrow_table_manager import arrow_table_manager
 
 
 LOGGER = get_logger(__name__)
@@ -258,3 +259,40 @@ class MessageCacheHandler(tornado.web.RequestHandler):
         """/OPTIONS handler for preflight CORS checks."""
         self.set_status(204)
         self.finish()
+
+
+class ArrowTableHandler(tornado.web.RequestHandler):
+    """Returns pages of rows of the tables in our ArrowTableManager."""
+
+    def set_default_headers(self):
+        if allow_cross_origin_requests():
+            self.set_header("Access-Control-Allow-Origin", "*")
+
+    def get(self, table_id):
+        try:
+            start = int(self.get_argument("start"))
+            end = int(self.get_argument("end"))
+        except (tornado.web.MissingArgumentError, ValueError):
+            # The row range is missing! This is a malformed request.
+            LOGGER.error("HTTP request for table rows has a missing or bad range.")
+            self.set_status(400)
+            raise tornado.web.Finish()
+
+        rows = arrow_table_manager.get_rows(table_id, start, end)
+        if rows is None:
+            # The table was replaced, or evicted.
+            LOGGER.error(
+                "HTTP request for table rows could not be fulfilled. "
+                "No such table: %s" % table_id
+            )
+            self.set_status(404)
+            raise tornado.web.Finish()
+
+        self.set_header("Content-Type", "application/octet-stream")
+        self.write(rows)
+        self.set_status(200)
+
+    def options(self):
+        """/OPTIONS handler for preflight CORS checks."""
+        self.set_status(204)
+        self.finish()
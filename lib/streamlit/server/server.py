@@ -18,10 +18,11 @@ import threading
 import socket
 import sys
 import errno
+import time
 import traceback
 import click
 from enum import Enum
-from typing import Any, Dict, Optional, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 
 import tornado.concurrent
 import tornado.gen
@@ -32,12 +33,14 @@ import tornado.websocket
 
 from streamlit import config
 from streamlit import file_util
+from streamlit import metrics
 from streamlit import util
 from streamlit.config_option import ConfigOption
 from streamlit.forward_msg_cache import ForwardMsgCache
 from streamlit.forward_msg_cache import create_reference_msg
 from streamlit.forward_msg_cache import populate_hash_if_needed
 from streamlit.report_session import ReportSession
+from streamlit.script_thread_pool import get_script_thread_pool
 from streamlit.uploaded_file_manager import UploadedFileManager
 from streamlit.logger import get_logger
 from streamlit.components.v1.components import ComponentRegistry
@@ -49,6 +52,7 @@ from streamlit.server.upload_file_request_handler import (
     UPLOAD_FILE_ROUTE,
 )
 from streamlit.server.routes import AddSlashHandler
+from streamlit.server.routes import ArrowTableHandler
 from streamlit.server.routes import AssetsFileHandler
 from streamlit.server.routes import DebugHandler
 from streamlit.server.routes import HealthHandler
@@ -89,6 +93,14 @@ TORNADO_SETTINGS = {
 # up to MAX_PORT_SEARCH_RETRIES.
 MAX_PORT_SEARCH_RETRIES = 100
 
+# Elements smaller than this (in bytes) are always resent in full, since a
+# ref_hash message isn't any smaller.
+_MIN_UNCHANGED_ELEMENT_SIZE = 64
+
+# Minimum time between two preheated sessions being created, so that
+# refilling the pool never takes over the script threads.
+_PREHEAT_INTERVAL_SECS = 1.0
+
 # When server.address starts with this prefix, the server will bind
 # to an unix socket.
 UNIX_SOCKET_PREFIX = "unix://"
@@ -116,9 +128,52 @@ class SessionInfo(object):
         self.ws = ws
         self.report_run_count = 0
 
+        # delta_path -> hash of the element we sent there, for the current
+        # and the previous script run.
+        self._element_hashes: Dict[Tuple[int, ...], str] = {}
+        self._prev_element_hashes: Dict[Tuple[int, ...], str] = {}
+
     def __repr__(self) -> str:
         return util.repr_(self)
 
+    def is_unchanged_element(self, msg: ForwardMsg) -> bool:
+        """Record an outgoing element, and return True if it's unchanged.
+
+        An element is unchanged if the previous script run sent the exact
+        same element to the same delta_path. Most of a typical app doesn't
+        change between reruns, so these elements are worth caching on the
+        client even if they're smaller than global.minCachedMessageSize.
+
+        Parameters
+        ----------
+        msg : ForwardMsg
+            A message that's about to be sent to this session.
+
+        Returns
+        -------
+        bool
+            True if msg is a new_element delta that this session was sent
+            last run.
+
+        """
+        msg_type = msg.WhichOneof("type")
+        if msg_type == "new_report":
+            self._prev_element_hashes = self._element_hashes
+            self._element_hashes = {}
+            return False
+
+        if msg_type != "delta" or msg.delta.WhichOneof("type") != "new_element":
+            return False
+
+        # Referencing tiny elements would cost more than resending them.
+        if msg.ByteSize() < _MIN_UNCHANGED_ELEMENT_SIZE:
+            return False
+
+        delta_path = tuple(msg.metadata.delta_path)
+        msg_hash = populate_hash_if_needed(msg)
+        self._element_hashes[delta_path] = msg_hash
+        return self._prev_element_hashes.get(delta_path) == msg_hash
+
 
 class State(Enum):
     INITIAL = "INITIAL"
@@ -252,7 +307,12 @@ class Server(object):
         self._uploaded_file_mgr = UploadedFileManager()
         self._uploaded_file_mgr.on_files_updated.connect(self.on_files_updated)
         self._report = None  # type: Optional[Report]
-        self._preheated_session_id = None  # type: Optional[str]
+
+        # IDs of the preheated sessions that haven't been handed to a
+        # browser yet, oldest first.
+        self._preheated_session_ids: List[str] = []
+        self._is_preheating = False
+        self._last_preheat_time = 0.0
 
     def __repr__(self) -> str:
         return util.repr_(self)
@@ -360,6 +420,7 @@ class Server(object):
                 {"path": "%s/" % file_util.get_assets_dir()},
             ),
             (make_url_path_regex(base, "media/(.*)"), MediaFileHandler, {"path": ""}),
+            (make_url_path_regex(base, "dataframe/(.*)"), ArrowTableHandler),
             (
                 make_url_path_regex(base, "component/(.*)"),
                 ComponentRequestHandler,
@@ -424,6 +485,9 @@ class Server(object):
 
             while not self._must_stop.is_set():
 
+                if self._is_preheating:
+                    self._maybe_add_preheated_report_session()
+
                 if self._state == State.WAITING_FOR_FIRST_BROWSER:
                     pass
 
@@ -481,7 +545,9 @@ Please report this bug at https://github.com/streamlit/streamlit/issues.
 
         If the client is likely to have already cached the message, we may
         instead send a "reference" message that contains only the hash of the
-        message.
+        message. Large messages are always cached. Smaller elements are
+        cached once they've been sent unchanged in two consecutive script
+        runs, so that from the third run on they're sent as references.
 
         Parameters
         ----------
@@ -491,7 +557,9 @@ Please report this bug at https://github.com/streamlit/streamlit/issues.
             The message to send to the client
 
         """
-        msg.metadata.cacheable = is_cacheable_msg(msg)
+        # Don't short-circuit: is_unchanged_element must see every message.
+        is_unchanged_element = session_info.is_unchanged_element(msg)
+        msg.metadata.cacheable = is_cacheable_msg(msg) or is_unchanged_element
         msg_to_send = msg
         if msg.metadata.cacheable:
             populate_hash_if_needed(msg)
@@ -551,11 +619,61 @@ Please report this bug at https://github.com/streamlit/streamlit/issues.
         """Register a fake browser with the server and run the script.
 
         This is used to start running the user's script even before the first
-        browser connects.
+        browser connects. From then on, the server loop keeps
+        server.preheatedSessions preheated sessions ready for new browsers.
         """
+        if config.get_option("server.preheatedSessions") <= 0:
+            return
+
+        self._is_preheating = True
+        self._last_preheat_time = time.time()
         session = self._create_or_reuse_report_session(ws=None)
         session.handle_rerun_script_request(is_preheat=True)
 
+    def _maybe_add_preheated_report_session(self):
+        """Replace a preheated session that was handed to a browser.
+
+        Refilling is rate-limited so that it can't starve live sessions: a
+        new preheated session is only created once the previous one has
+        finished its run, at most once per _PREHEAT_INTERVAL_SECS, and never
+        while script runs are waiting for a thread.
+        """
+        if len(self._preheated_session_ids) >= config.get_option(
+            "server.preheatedSessions"
+        ):
+            return
+
+        if time.time() - self._last_preheat_time < _PREHEAT_INTERVAL_SECS:
+            return
+
+        if any(
+            self._session_info_by_id[session_id].session.is_script_running
+            for session_id in self._preheated_session_ids
+        ):
+            return
+
+        if get_script_thread_pool().num_pending_jobs > 0:
+            return
+
+        self.add_preheated_report_session()
+
+    def _pop_preheated_session_id(self) -> Optional[str]:
+        """Remove and return the ID of the best preheated session to hand to
+        a new browser: the oldest one whose run has finished, or else the
+        oldest one.
+        """
+        if len(self._preheated_session_ids) == 0:
+            return None
+
+        session_id = self._preheated_session_ids[0]
+        for preheated_id in self._preheated_session_ids:
+            if not self._session_info_by_id[preheated_id].session.is_script_running:
+                session_id = preheated_id
+                break
+
+        self._preheated_session_ids.remove(session_id)
+        return session_id
+
     def _create_or_reuse_report_session(self, ws):
         """Register a connected browser with the server.
 
@@ -571,13 +689,15 @@ Please report this bug at https://github.com/streamlit/streamlit/issues.
             The newly-created ReportSession for this browser connection.
 
         """
-        if self._preheated_session_id is not None:
-            assert len(self._session_info_by_id) == 1
-            assert ws is not None
-
-            session_id = self._preheated_session_id
-            self._preheated_session_id = None
-
+        session_id = None
+        if ws is not None:
+            session_id = self._pop_preheated_session_id()
+            if self._is_preheating:
+                metrics.Client.get("streamlit_preheated_session_requests_total").labels(
+                    "miss" if session_id is None else "hit"
+                ).inc()
+
+        if session_id is not None:
             session_info = self._session_info_by_id[session_id]
             session_info.ws = ws
             session = session_info.session
@@ -605,7 +725,7 @@ Please report this bug at https://github.com/streamlit/streamlit/issues.
         self._session_info_by_id[session.id] = SessionInfo(ws, session)
 
         if ws is None:
-            self._preheated_session_id = session.id
+            self._preheated_session_ids.append(session.id)
         else:
             self._set_state(State.ONE_OR_MORE_BROWSERS_CONNECTED)
 
@@ -627,7 +747,11 @@ Please report this bug at https://github.com/streamlit/streamlit/issues.
             del self._session_info_by_id[session_id]
             session_info.session.shutdown()
 
-        if len(self._session_info_by_id) == 0:
+        if session_id in self._preheated_session_ids:
+            self._preheated_session_ids.remove(session_id)
+
+        # Preheated sessions don't count as connected browsers.
+        if len(self._session_info_by_id) == len(self._preheated_session_ids):
             self._set_state(State.NO_BROWSERS_CONNECTED)
 
 
@@ -383,12 +383,14 @@ class SessionState(MutableMapping[str, Any]):
             self._new_widget_state.set_from_proto(state)
 
     def call_callbacks(self):
-        changed_widget_ids = [
-            wid for wid in self._new_widget_state if self._widget_changed(wid)
-        ]
-        for wid in changed_widget_ids:
+        for wid in self.get_changed_widget_ids():
             self._new_widget_state.call_callback(wid)
 
+    def get_changed_widget_ids(self) -> List[str]:
+        """Return the IDs of widgets whose values changed in the last
+        set_from_proto call."""
+        return [wid for wid in self._new_widget_state if self._widget_changed(wid)]
+
     def _widget_changed(self, widget_id: str) -> bool:
         new_value = self._new_widget_state.get(widget_id)
         old_value = self._old_state.get(widget_id)
@@ -133,7 +133,7 @@ def register_widget(
 
     ctx = report_thread.get_report_ctx()
     if ctx is None:
-        # Early-out if we're not running inside a ReportThread (which
+        # Early-out if we're not running inside a script thread (which
         # probably means we're running as a "bare" Python script, and
         # not via `streamlit run`).
         return (deserializer(None, ""), False)
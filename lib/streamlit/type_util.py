@@ -14,14 +14,21 @@
 
 """A bunch of useful utilities for dealing with types."""
 
+import json
 import re
-from typing import Any, Sequence, Tuple, Union, cast
+import threading
+from typing import TYPE_CHECKING, Any, Optional, Sequence, Tuple, Union, cast
 
+from cachetools import LRUCache
 from pandas import DataFrame, Series, Index
 import numpy as np
 
+from streamlit import config
 from streamlit import errors
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
 OptionSequence = Union[Sequence[Any], DataFrame, Series, Index, np.ndarray]
 
 
@@ -69,6 +76,9 @@ _PANDAS_INDEX_TYPE_STR = "pandas.core.indexes.base.Index"
 _PANDAS_SERIES_TYPE_STR = "pandas.core.series.Series"
 _PANDAS_STYLER_TYPE_STR = "pandas.io.formats.style.Styler"
 _NUMPY_ARRAY_TYPE_STR = "numpy.ndarray"
+_PYARROW_TABLE_TYPE_STR = "pyarrow.lib.Table"
+_PYARROW_RECORD_BATCH_TYPE_STR = "pyarrow.lib.RecordBatch"
+_POLARS_DATAFRAME_TYPE_RE = re.compile(r"^polars\..*\.DataFrame$")
 
 _DATAFRAME_LIKE_TYPES = (
     _PANDAS_DF_TYPE_STR,
@@ -95,7 +105,95 @@ def is_dataframe(obj):
 
 
 def is_dataframe_like(obj):
-    return any(is_type(obj, t) for t in _DATAFRAME_LIKE_TYPES)
+    return any(is_type(obj, t) for t in _DATAFRAME_LIKE_TYPES) or is_arrow_compatible(
+        obj
+    )
+
+
+def is_arrow_compatible(obj):
+    """True if obj can be converted to a pyarrow.Table without going through
+    pandas: a pyarrow.Table or RecordBatch, a Polars DataFrame, or any object
+    that exports an Arrow C stream.
+    """
+    if get_fqn_type(obj).startswith("pandas."):
+        # Recent pandas versions export Arrow C streams too, but we still
+        # want pandas objects to go through pandas.
+        return False
+
+    return (
+        is_type(obj, _PYARROW_TABLE_TYPE_STR)
+        or is_type(obj, _PYARROW_RECORD_BATCH_TYPE_STR)
+        or is_type(obj, _POLARS_DATAFRAME_TYPE_RE)
+        or hasattr(obj, "__arrow_c_stream__")
+    )
+
+
+def convert_arrow_compatible_to_table(obj) -> "pa.Table":
+    """Convert an Arrow-compatible object (see is_arrow_compatible) to a
+    pyarrow.Table, without copying its data.
+
+    The table always has pandas metadata, which is where the frontend gets
+    the index and column types from.
+    """
+    import pyarrow as pa
+
+    if is_type(obj, _PYARROW_TABLE_TYPE_STR):
+        table = obj
+    elif is_type(obj, _PYARROW_RECORD_BATCH_TYPE_STR):
+        table = pa.Table.from_batches([obj])
+    elif is_type(obj, _POLARS_DATAFRAME_TYPE_RE):
+        table = obj.to_arrow()
+    else:
+        try:
+            table = pa.table(obj)
+        except TypeError:
+            raise errors.StreamlitAPIException(
+                "Unable to convert object of type `%s` to `pyarrow.Table`. "
+                "Objects that export an Arrow C stream require pyarrow 14 "
+                "or newer." % type(obj)
+            )
+
+    return _ensure_pandas_metadata(table)
+
+
+def _ensure_pandas_metadata(table: "pa.Table") -> "pa.Table":
+    """Return the table with pandas metadata that matches its columns and
+    number of rows, adding it if needed.
+    """
+    import pyarrow as pa
+
+    pandas_metadata = table.schema.pandas_metadata
+    if (
+        pandas_metadata is not None
+        and [column["field_name"] for column in pandas_metadata.get("columns", [])]
+        == table.column_names
+    ):
+        # The table may have been filtered or sliced since it was created
+        # from a DataFrame, so its RangeIndex may be out of date.
+        return table.replace_schema_metadata(
+            slice_range_index_metadata(table.schema.metadata, 0, table.num_rows)
+        )
+
+    # Let pyarrow work out the pandas metadata of the table's columns, from
+    # an empty DataFrame with the same schema, and give it a RangeIndex.
+    schema = table.schema.remove_metadata()
+    empty_df = schema.empty_table().to_pandas()
+    pandas_metadata = pa.Table.from_pandas(
+        empty_df, schema=schema, preserve_index=False
+    ).schema.pandas_metadata
+    pandas_metadata["index_columns"] = [
+        {
+            "kind": "range",
+            "name": None,
+            "start": 0,
+            "stop": table.num_rows,
+            "step": 1,
+        }
+    ]
+
+    metadata = dict(table.schema.metadata or {})
+    metadata[b"pandas"] = json.dumps(pandas_metadata).encode("utf-8")
+    return table.replace_schema_metadata(metadata)
 
 
 def is_dataframe_compatible(obj):
@@ -251,6 +349,9 @@ def convert_anything_to_df(df):
     if is_pandas_styler(df):
         return df.data
 
+    if is_arrow_compatible(df):
+        return convert_arrow_compatible_to_table(df).to_pandas()
+
     import pandas as pd
 
     if is_type(df, "numpy.ndarray") and len(df.shape) == 0:
@@ -335,9 +436,54 @@ def is_pandas_version_less_than(v: str) -> bool:
     return version.parse(pd.__version__) < version.parse(v)
 
 
+class _ArrowBytesCache:
+    """A bounded cache of the Arrow IPC bytes of the dataframes returned by
+    st.cache, keyed by their st.cache keys, of marshalled pandas.Stylers,
+    keyed by the hash of their data and styles, and of the JSON specs of the
+    Plotly figures returned by st.cache.
+
+    This lets every session and rerun that displays the same cached
+    dataframe or figure, or the same styled dataframe, skip serializing it
+    again.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._cache: Optional[LRUCache] = None
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            return self._get_cache().get(key)
+
+    def set(self, key: str, data: bytes) -> None:
+        with self._lock:
+            cache = self._get_cache()
+            # LRUCache raises ValueError for values bigger than the cache.
+            if len(data) <= cache.maxsize:
+                cache[key] = data
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache = None
+
+    def _get_cache(self) -> LRUCache:
+        # The cache is created lazily, so that it's sized from the config
+        # options the app was started with.
+        if self._cache is None:
+            max_bytes = config.get_option("global.maxArrowCacheSize") * 1024 * 1024
+            self._cache = LRUCache(maxsize=max_bytes, getsizeof=len)
+        return self._cache
+
+
+arrow_bytes_cache = _ArrowBytesCache()
+
+
 def data_frame_to_bytes(df: DataFrame) -> bytes:
     """Convert pandas.DataFrame to bytes.
 
+    The bytes of dataframes returned by st.cache are cached, and reused for
+    as long as the dataframe is alive.
+
     Parameters
     ----------
     df : pandas.DataFrame
@@ -346,7 +492,89 @@ def data_frame_to_bytes(df: DataFrame) -> bytes:
     """
     import pyarrow as pa
 
-    table = pa.Table.from_pandas(df)
+    from streamlit import caching
+
+    key = caching.get_cached_value_key(df)
+    if key is not None:
+        data = arrow_bytes_cache.get(key)
+        if data is not None:
+            return data
+
+    table = dictionary_encode_strings(pa.Table.from_pandas(df))
+    data = pyarrow_table_to_bytes(table)
+
+    if key is not None:
+        arrow_bytes_cache.set(key, data)
+    return data
+
+
+# String columns with at least this many rows, and at most this fraction of
+# distinct values, are dictionary-encoded, so that each distinct value is
+# only sent once.
+_DICTIONARY_ENCODING_MIN_ROWS = 1000
+_DICTIONARY_ENCODING_MAX_DISTINCT_RATIO = 0.5
+
+
+def dictionary_encode_strings(table: "pa.Table") -> "pa.Table":
+    """Dictionary-encode the low-cardinality string columns of a
+    pyarrow.Table.
+
+    The pandas metadata of the table is left as is, so the columns are still
+    read as strings (see bytes_to_data_frame), rather than categoricals.
+    """
+    import pyarrow as pa
+
+    if table.num_rows < _DICTIONARY_ENCODING_MIN_ROWS:
+        return table
+
+    max_distinct = table.num_rows * _DICTIONARY_ENCODING_MAX_DISTINCT_RATIO
+    for i, field in enumerate(table.schema):
+        if not pa.types.is_string(field.type):
+            continue
+
+        column = table.column(i).dictionary_encode()
+        num_distinct = sum(len(chunk.dictionary) for chunk in column.chunks)
+        if num_distinct <= max_distinct:
+            table = table.set_column(i, field.name, column)
+    return table
+
+
+def _dictionary_decode_strings(table: "pa.Table") -> "pa.Table":
+    """Undo dictionary_encode_strings, for the columns that pandas doesn't
+    expect to be categoricals.
+    """
+    import pyarrow as pa
+
+    pandas_metadata = table.schema.pandas_metadata or {}
+    pandas_types = {
+        column["field_name"]: column["pandas_type"]
+        for column in pandas_metadata.get("columns", [])
+    }
+    for i, field in enumerate(table.schema):
+        if (
+            pa.types.is_dictionary(field.type)
+            and pa.types.is_string(field.type.value_type)
+            and pandas_types.get(field.name) != "categorical"
+        ):
+            column = pa.chunked_array(
+                [chunk.dictionary_decode() for chunk in table.column(i).chunks],
+                type=field.type.value_type,
+            )
+            table = table.set_column(i, field.name, column)
+    return table
+
+
+def pyarrow_table_to_bytes(table: "pa.Table") -> bytes:
+    """Serialize pyarrow.Table to bytes, as an Arrow IPC stream.
+
+    Parameters
+    ----------
+    table : pyarrow.Table
+        A table to convert.
+
+    """
+    import pyarrow as pa
+
     sink = pa.BufferOutputStream()
     writer = pa.RecordBatchStreamWriter(sink, table.schema)
     writer.write_table(table)
@@ -354,6 +582,42 @@ def data_frame_to_bytes(df: DataFrame) -> bytes:
     return cast(bytes, sink.getvalue().to_pybytes())
 
 
+def slice_pyarrow_table(table: "pa.Table", start: int, num_rows: int) -> "pa.Table":
+    """Return num_rows rows of a pyarrow.Table, from row start.
+
+    Unlike pyarrow.Table.slice, this also slices the table's pandas
+    RangeIndex, if it has one.
+
+    """
+    table = table.slice(start, num_rows)
+    return table.replace_schema_metadata(
+        slice_range_index_metadata(table.schema.metadata, start, table.num_rows)
+    )
+
+
+def slice_range_index_metadata(metadata, start: int, num_rows: int):
+    """Return a copy of an Arrow schema's metadata, with its pandas RangeIndex
+    (if any) sliced to num_rows rows, from row start.
+
+    A RangeIndex isn't stored as a column, but as start, stop and step values
+    in the pandas metadata, so the frontend gets the number of rows of the
+    index from there.
+    """
+    metadata = dict(metadata or {})
+    if b"pandas" not in metadata:
+        return metadata
+
+    pandas_metadata = json.loads(metadata[b"pandas"])
+    for index_column in pandas_metadata.get("index_columns", []):
+        if isinstance(index_column, dict) and index_column["kind"] == "range":
+            index_column["start"] += start * index_column["step"]
+            index_column["stop"] = (
+                index_column["start"] + num_rows * index_column["step"]
+            )
+    metadata[b"pandas"] = json.dumps(pandas_metadata).encode("utf-8")
+    return metadata
+
+
 def bytes_to_data_frame(source: bytes) -> DataFrame:
     """Convert bytes to pandas.DataFrame.
 
@@ -366,4 +630,4 @@ def bytes_to_data_frame(source: bytes) -> DataFrame:
     import pyarrow as pa
 
     reader = pa.RecordBatchStreamReader(source)
-    return reader.read_pandas()
+    return _dictionary_decode_strings(reader.read_all()).to_pandas()
@@ -142,6 +142,61 @@ class UploadedFileManager(object):
         with self._files_lock:
             return self._files_by_id.get(file_list_id, []).copy()
 
+    def get_session_files(self, session_id: str) -> Dict[str, List[UploadedFileRec]]:
+        """Return all the files stored for the given session, by widget ID.
+
+        Parameters
+        ----------
+        session_id
+            The session ID of the report that owns the files.
+        """
+        with self._files_lock:
+            return {
+                widget_id: file_list.copy()
+                for (file_session_id, widget_id), file_list in self._files_by_id.items()
+                if file_session_id == session_id
+            }
+
+    def set_session_files(
+        self,
+        session_id: str,
+        files_by_widget: Dict[str, List[UploadedFileRec]],
+        next_file_id: int,
+    ) -> None:
+        """Replace all the files stored for the given session.
+
+        This is used to mirror another UploadedFileManager's files for a
+        session (for example, in a script worker process). Files keep their
+        IDs, and our ID counter is advanced to at least next_file_id so that
+        ID comparisons stay consistent with the mirrored manager.
+
+        Does not emit any signals.
+
+        Parameters
+        ----------
+        session_id
+            The session ID of the report that owns the files.
+        files_by_widget
+            The session's file lists, keyed by FileUploader widget ID.
+        next_file_id
+            The mirrored manager's next file ID.
+        """
+        with self._files_lock:
+            for files_id in list(self._files_by_id.keys()):
+                if files_id[0] == session_id:
+                    del self._files_by_id[files_id]
+            for widget_id, file_list in files_by_widget.items():
+                self._files_by_id[(session_id, widget_id)] = list(file_list)
+
+        with self._file_id_lock:
+            self._file_id_counter = max(self._file_id_counter, next_file_id)
+
+    @property
+    def next_file_id(self) -> int:
+        """The ID that will be assigned to the next file that's added."""
+        with self._file_id_lock:
+            return self._file_id_counter
+
     def get_files(
         self, session_id: str, widget_id: str, file_ids: List[int]
     ) -> List[UploadedFileRec]:
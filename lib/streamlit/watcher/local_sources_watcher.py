@@ -21,6 +21,7 @@ import types
 from streamlit import config
 from streamlit import file_util
 from streamlit.folder_black_list import FolderBlackList
+from streamlit.script_cache import script_cache
 
 from streamlit.logger import get_logger
 from streamlit.watcher.file_watcher import (
@@ -61,6 +62,9 @@ class LocalSourcesWatcher(object):
             LOGGER.error("Received event for non-watched file: %s", filepath)
             return
 
+        # Drop any bytecode we've compiled from the stale source.
+        script_cache.invalidate(filepath)
+
         # Workaround:
         # Delete all watched modules so we can guarantee changes to the
         # updated module are reflected on reload.
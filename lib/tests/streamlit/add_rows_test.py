@@ -43,7 +43,7 @@ class DeltaGeneratorAddRowsTest(testutil.DeltaGeneratorTestCase):
             # TODO: line_chart, bar_chart, etc.
         ]
 
-    def _get_deltas_that_melt_dataframes(self):
+    def _get_deltas_that_fold_dataframes(self):
         return [
             lambda df: st.line_chart(df),
             lambda df: st.bar_chart(df),
@@ -65,8 +65,8 @@ class DeltaGeneratorAddRowsTest(testutil.DeltaGeneratorTestCase):
             # TODO: deck_gl_chart
         ]
 
-    def test_deltas_that_melt_dataframes(self):
-        deltas = self._get_deltas_that_melt_dataframes()
+    def test_deltas_that_fold_dataframes(self):
+        deltas = self._get_deltas_that_fold_dataframes()
 
         for delta in deltas:
             el = delta(DATAFRAME)
@@ -80,9 +80,9 @@ class DeltaGeneratorAddRowsTest(testutil.DeltaGeneratorTestCase):
             df_proto = data_frame._get_data_frame(self.get_delta_from_queue())
             num_rows = len(df_proto.data.cols[0].int64s.data)
 
-            self.assertEqual(num_rows, 16)
+            self.assertEqual(num_rows, 8)
             self.assertEqual(
-                [0, 1, 0, 1, 2, 3, 4, 2, 3, 4, 5, 6, 7, 5, 6, 7],
+                [0, 1, 2, 3, 4, 5, 6, 7],
                 df_proto.data.cols[0].int64s.data,
             )
 
@@ -90,3 +90,88 @@ class ArrowAltairTest(testutil.DeltaGeneratorTestCase):
         # use date values.
         y_scale = _deep_get(spec_dict, "encoding", "y", "scale", "type")
         self.assertNotEqual(y_scale, "utc")
+
+    def test_line_chart_fold(self):
+        """Test that the chart's data is sent in wide format, and folded by
+        Vega-Lite.
+        """
+        df = pd.DataFrame({"a": [1, 2], "b.c": [3.0, 4.0]})
+
+        st._arrow_line_chart(df)
+
+        proto = self.get_delta_from_queue().new_element.arrow_vega_lite_chart
+        pd.testing.assert_frame_equal(
+            bytes_to_data_frame(proto.datasets[0].data.data), df.reset_index()
+        )
+
+        spec_dict = json.loads(proto.spec)
+        self.assertEqual(
+            spec_dict["transform"][0],
+            {"fold": ["a", "b\\.c"], "as": ["variable", "value"]},
+        )
+        self.assertEqual(spec_dict["transform"][1]["as"], "variable")
+        self.assertEqual(
+            spec_dict["encoding"]["y"],
+            {"field": "value", "title": "", "type": "quantitative"},
+        )
+        self.assertEqual(
+            spec_dict["encoding"]["color"],
+            {"field": "variable", "title": "", "type": "nominal"},
+        )
+
+    def test_line_chart_max_points(self):
+        """Test that long series are downsampled to max_points."""
+        df = pd.DataFrame({"a": range(100), "b": range(100, 0, -1)})
+
+        st._arrow_line_chart(df, max_points=10)
+
+        proto = self.get_delta_from_queue().new_element.arrow_vega_lite_chart
+        chart_data = bytes_to_data_frame(proto.datasets[0].data.data)
+        self.assertEqual(list(chart_data.columns), ["index", "a", "b"])
+        self.assertLessEqual(len(chart_data), 10)
+        a_values = chart_data["a"].tolist()
+        self.assertEqual(a_values[0], 0)
+        self.assertEqual(a_values[-1], 99)
+        self.assertEqual(a_values, sorted(a_values))
+
+    @testutil.patch_config_options({"client.maxChartPoints": 10})
+    def test_area_chart_max_points_config(self):
+        """Test that client.maxChartPoints is the default max_points."""
+        df = pd.DataFrame({"a": [i % 7 for i in range(100)]})
+
+        st._arrow_area_chart(df)
+        proto = self.get_delta_from_queue().new_element.arrow_vega_lite_chart
+        self.assertLessEqual(len(bytes_to_data_frame(proto.datasets[0].data.data)), 10)
+
+        st._arrow_area_chart(df, max_points=0)
+        proto = self.get_delta_from_queue().new_element.arrow_vega_lite_chart
+        self.assertEqual(len(bytes_to_data_frame(proto.datasets[0].data.data)), 100)
+
+    @testutil.patch_config_options({"global.minCachedMessageSize": 5000})
+    def test_large_datasets_are_shared(self):
+        """Test that charts of the same large data refer to a single DataSet."""
+        df = pd.DataFrame({"a": range(1000)})
+        chart = alt.Chart(df).mark_line().encode(x="a", y="a")
+
+        st._arrow_altair_chart(chart)
+        st._arrow_line_chart(df)
+        st._arrow_altair_chart(chart)
+        st._arrow_line_chart(pd.DataFrame({"a": range(10)}))
+
+        data_sets = list(self.report_queue._data_sets.values())
+        self.assertEqual(len(data_sets), 2)
+        pd.testing.assert_frame_equal(
+            bytes_to_data_frame(data_sets[0].data_set.arrow.data), df
+        )
+
+        protos = [
+            delta.new_element.arrow_vega_lite_chart
+            for delta in self.get_all_deltas_from_queue()
+        ]
+        ids = [proto.datasets[0].data_set_id for proto in protos]
+        self.assertEqual(ids[0], data_sets[0].data_set.id)
+        self.assertEqual(ids[1], data_sets[1].data_set.id)
+        self.assertEqual(ids[0], ids[2])
+        self.assertEqual(ids[3], "")
+        self.assertFalse(protos[0].datasets[0].HasField("data"))
+        self.assertTrue(protos[3].datasets[0].HasField("data"))
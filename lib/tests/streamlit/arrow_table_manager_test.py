@@ -0,0 +1,92 @@
+# Copyright 2018-2021 Streamlit Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for ArrowTableManager"""
+
+import unittest
+
+import pandas as pd
+import pyarrow as pa
+
+from streamlit.arrow_table_manager import ArrowTableManager
+from streamlit.type_util import bytes_to_data_frame
+from tests.testutil import patch_config_options
+
+
+def _create_table(num_rows):
+    return pa.Table.from_pandas(pd.DataFrame({"col1": range(num_rows)}))
+
+
+class ArrowTableManagerTest(unittest.TestCase):
+    def setUp(self):
+        self.mgr = ArrowTableManager()
+
+    def test_get_rows(self):
+        """get_rows returns a range of rows, with its RangeIndex."""
+        table_id = self.mgr.add(_create_table(10), "1.(2).3", session_id="s1")
+
+        df = bytes_to_data_frame(self.mgr.get_rows(table_id, 3, 6))
+        self.assertEqual([3, 4, 5], df["col1"].tolist())
+        self.assertEqual([3, 4, 5], df.index.tolist())
+
+        # Ranges are clamped to the table.
+        df = bytes_to_data_frame(self.mgr.get_rows(table_id, 8, 100))
+        self.assertEqual([8, 9], df["col1"].tolist())
+
+        self.assertIsNone(self.mgr.get_rows("non_existent", 0, 1))
+
+    def test_replace_table_at_coordinates(self):
+        """Adding a table drops the one that the session had at the same
+        coordinates."""
+        table_id1 = self.mgr.add(_create_table(10), "1.(2).3", session_id="s1")
+        table_id2 = self.mgr.add(_create_table(10), "1.(2).3", session_id="s2")
+        table_id3 = self.mgr.add(_create_table(10), "1.(2).3", session_id="s1")
+
+        self.assertNotIn(table_id1, self.mgr)
+        self.assertIn(table_id2, self.mgr)
+        self.assertIn(table_id3, self.mgr)
+
+    def test_clear_session_tables(self):
+        table_id1 = self.mgr.add(_create_table(10), "1.(2).3", session_id="s1")
+        table_id2 = self.mgr.add(_create_table(10), "1.(2).4", session_id="s1")
+        table_id3 = self.mgr.add(_create_table(10), "1.(2).3", session_id="s2")
+
+        self.mgr.clear_session_tables("s1")
+        self.assertEqual(1, len(self.mgr))
+        self.assertIn(table_id3, self.mgr)
+        self.assertNotIn(table_id1, self.mgr)
+        self.assertNotIn(table_id2, self.mgr)
+
+    @patch_config_options({"server.maxDataFrameCacheSize": 1})
+    def test_evict_least_recently_used(self):
+        """The least recently used tables are dropped when the tables don't
+        fit in server.maxDataFrameCacheSize."""
+        # Each table is 400KB.
+        num_rows = 50 * 1024
+        table_ids = [
+            self.mgr.add(_create_table(num_rows), str(i), session_id="s1")
+            for i in range(2)
+        ]
+        self.mgr.get_rows(table_ids[0], 0, 1)
+        table_ids.append(self.mgr.add(_create_table(num_rows), "2", session_id="s1"))
+
+        # table_ids[1] was used the least recently.
+        self.assertEqual(
+            [True, False, True], [table_id in self.mgr for table_id in table_ids]
+        )
+
+        # A table that doesn't fit on its own is still added.
+        table_id = self.mgr.add(_create_table(4 * num_rows), "3", session_id="s1")
+        self.assertEqual(1, len(self.mgr))
+        self.assertIn(table_id, self.mgr)
@@ -18,10 +18,13 @@ from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
+from pandas.io.formats.style import Styler as PandasStyler
 from streamlit.type_util import bytes_to_data_frame, is_pandas_version_less_than
 from tests import testutil
 
 import streamlit as st
+from streamlit import type_util
+from streamlit.arrow_table_manager import arrow_table_manager
 
 # In Pandas 1.3.0, Styler functionality was moved under StylerRenderer.
 if is_pandas_version_less_than("1.3.0"):
@@ -48,6 +51,56 @@ class ArrowTest(testutil.DeltaGeneratorTestCase):
         proto = self.get_delta_from_queue().new_element.arrow_table
         pd.testing.assert_frame_equal(bytes_to_data_frame(proto.data), df)
 
+    def test_pyarrow_table(self):
+        """pyarrow.Tables are sent without being converted to DataFrames."""
+        import pyarrow as pa
+
+        table = pa.table({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+        with patch("streamlit.type_util.convert_anything_to_df") as convert:
+            st._arrow_dataframe(table)
+            convert.assert_not_called()
+
+        proto = self.get_delta_from_queue().new_element.arrow_data_frame
+        pd.testing.assert_frame_equal(
+            bytes_to_data_frame(proto.data),
+            pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]}),
+        )
+
+    @testutil.patch_config_options({"server.dataFramePageSize": 3})
+    def test_paged_dataframe(self):
+        """A dataframe with more than one page of rows is sent with just its
+        first page, and the rest are kept in arrow_table_manager."""
+        df = pd.DataFrame({"col1": range(10)})
+        st._arrow_dataframe(df)
+
+        proto = self.get_delta_from_queue().new_element.arrow_data_frame
+        self.assertEqual(10, proto.num_rows)
+        self.assertEqual(3, proto.page_size)
+        self.assertIn(proto.table_id, arrow_table_manager)
+        pd.testing.assert_frame_equal(bytes_to_data_frame(proto.data), df.iloc[:3])
+
+        rows = arrow_table_manager.get_rows(proto.table_id, 3, 6)
+        pd.testing.assert_frame_equal(bytes_to_data_frame(rows), df.iloc[3:6])
+        arrow_table_manager.remove(proto.table_id)
+
+    @testutil.patch_config_options({"server.dataFramePageSize": 3})
+    def test_unpaged_dataframe(self):
+        """Dataframes with one page of rows, and styled dataframes, are sent
+        whole."""
+        df = pd.DataFrame({"col1": range(3)})
+        st._arrow_dataframe(df)
+
+        proto = self.get_delta_from_queue().new_element.arrow_data_frame
+        self.assertEqual("", proto.table_id)
+        pd.testing.assert_frame_equal(bytes_to_data_frame(proto.data), df)
+
+        df = pd.DataFrame({"col1": range(10)})
+        st._arrow_dataframe(df.style)
+
+        proto = self.get_delta_from_queue().new_element.arrow_data_frame
+        self.assertEqual("", proto.table_id)
+        pd.testing.assert_frame_equal(bytes_to_data_frame(proto.data), df)
+
     def test_uuid(self):
         df = mock_data_frame()
         styler = df.style
@@ -91,9 +144,46 @@ class ArrowTest(testutil.DeltaGeneratorTestCase):
 
         proto = self.get_delta_from_queue().new_element.arrow_table
         self.assertEqual(
-            proto.styler.styles, "#T_FAKE_UUIDrow1_col2 { background-color: yellow }"
+            proto.styler.styles, ".T_FAKE_UUIDstyle0 { background-color: yellow }"
+        )
+        pd.testing.assert_frame_equal(
+            bytes_to_data_frame(proto.styler.cell_classes),
+            pd.DataFrame(
+                {"0": [None, None], "1": [None, None], "2": [None, 0.0]},
+                dtype="float64",
+            ),
+        )
+
+    def test_shared_cell_styles(self):
+        df = pd.DataFrame([[1, 2, 1], [2, 1, 3]])
+        styler = df.style
+        styler.set_uuid("FAKE_UUID")
+        styler.applymap(lambda x: "color: red" if x == 1 else "color: blue")
+        st._arrow_table(styler)
+
+        proto = self.get_delta_from_queue().new_element.arrow_table
+        self.assertEqual(
+            proto.styler.styles,
+            ".T_FAKE_UUIDstyle0 { color: red }\n.T_FAKE_UUIDstyle1 { color: blue }",
+        )
+        pd.testing.assert_frame_equal(
+            bytes_to_data_frame(proto.styler.cell_classes),
+            pd.DataFrame(
+                {"0": [0, 1], "1": [1, 0], "2": [0, 1]},
+                dtype="int8",
+            ),
         )
 
+    def test_unstyled_cells(self):
+        df = mock_data_frame()
+        styler = df.style
+        styler.set_uuid("FAKE_UUID")
+        st._arrow_table(styler)
+
+        proto = self.get_delta_from_queue().new_element.arrow_table
+        self.assertEqual(proto.styler.styles, "")
+        self.assertEqual(proto.styler.cell_classes, b"")
+
     def test_display_values(self):
         df = pd.DataFrame(
             [[1, 2, 3], [4, 5, 6]],
@@ -123,9 +213,65 @@ class ArrowTest(testutil.DeltaGeneratorTestCase):
     @patch("streamlit.type_util.is_pandas_version_less_than", return_value=False)
     @patch.object(Styler, "_translate")
     def test_pandas_version_1_3_0_and_above(self, mock_styler_translate, _):
-        """Tests that `styler._translate` is called with correct arguments in Pandas >= 1.3.0"""
+        """Tests that `styler._translate` isn't called in Pandas >= 1.3.0"""
         df = mock_data_frame()
         styler = df.style.set_uuid("FAKE_UUID")
 
         st._arrow_table(styler)
-        mock_styler_translate.assert_called_once_with(False, False)
+        mock_styler_translate.assert_not_called()
+
+    def test_custom_display_values_only(self):
+        """Test that only the cells with custom formatters get display values."""
+        df = pd.DataFrame([[1, 2, 3], [4, 5, 6]])
+        styler = df.style.format("{:.2%}", subset=[1])
+        st._arrow_table(styler)
+
+        expected = pd.DataFrame(
+            [[None, "200.00%", None], [None, "500.00%", None]],
+        )
+
+        proto = self.get_delta_from_queue().new_element.arrow_table
+        pd.testing.assert_frame_equal(
+            bytes_to_data_frame(proto.styler.display_values), expected
+        )
+
+    def test_no_display_values(self):
+        """Test that no display values are sent without custom formatters."""
+        df = pd.DataFrame([[1, 2, 3], [4, 5, 6]])
+        styler = df.style.highlight_max()
+        st._arrow_table(styler)
+
+        proto = self.get_delta_from_queue().new_element.arrow_table
+        self.assertEqual(proto.styler.display_values, b"")
+
+    def test_styler_cache(self):
+        """Test that an unchanged Styler is only computed once."""
+        type_util.arrow_bytes_cache.clear()
+        self.addCleanup(type_util.arrow_bytes_cache.clear)
+
+        def make_styler(df, precision):
+            styler = df.style.set_uuid("FAKE_UUID")
+            styler.highlight_max(axis=None).format(f"{{:.{precision}f}}")
+            return styler
+
+        df = pd.DataFrame([[1, 2, 3], [4, 5, 6]])
+        with patch.object(
+            PandasStyler, "_compute", autospec=True, side_effect=PandasStyler._compute
+        ) as mock_compute:
+            st._arrow_table(make_styler(df, 2))
+            first_proto = self.get_delta_from_queue().new_element.arrow_table
+            st._arrow_table(make_styler(df.copy(), 2))
+            second_proto = self.get_delta_from_queue().new_element.arrow_table
+            self.assertEqual(mock_compute.call_count, 1)
+            self.assertEqual(first_proto, second_proto)
+
+            # Changing the data, or the arguments of the formatter, computes
+            # the styles again.
+            st._arrow_table(make_styler(df + 1, 2))
+            st._arrow_table(make_styler(df, 3))
+            self.assertEqual(mock_compute.call_count, 3)
+
+        proto = self.get_delta_from_queue().new_element.arrow_table
+        self.assertEqual(
+            bytes_to_data_frame(proto.styler.display_values).iat[0, 0], "1.000"
+        )
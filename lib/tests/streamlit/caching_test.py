@@ -18,6 +18,7 @@ import types
 import unittest
 from unittest.mock import patch, Mock
 
+import pandas as pd
 from parameterized import parameterized
 
 import streamlit as st
@@ -411,6 +412,30 @@ class CacheTest(testutil.DeltaGeneratorTestCase):
         foo("ahoy")
         str_hash_func.assert_called_once_with("ahoy")
 
+    def test_cached_value_key(self):
+        """Values returned by st.cache have a key that identifies their
+        contents, unless their output can be mutated."""
+
+        @st.cache
+        def foo(x):
+            return pd.DataFrame({"a": [x]})
+
+        @st.cache(allow_output_mutation=True)
+        def bar(x):
+            return pd.DataFrame({"a": [x]})
+
+        df1 = foo(1)
+        key = caching.get_cached_value_key(df1)
+        self.assertIsNotNone(key)
+        self.assertEqual(key, caching.get_cached_value_key(foo(1)))
+        self.assertNotEqual(key, caching.get_cached_value_key(foo(2)))
+
+        self.assertIsNone(caching.get_cached_value_key(bar(1)))
+        self.assertIsNone(caching.get_cached_value_key(pd.DataFrame({"a": [1]})))
+
+        caching.clear_cache()
+        self.assertIsNone(caching.get_cached_value_key(df1))
+
 
 # Temporarily turn off these tests since there's no Cache object in __init__
 # right now.
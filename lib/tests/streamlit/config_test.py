@@ -292,6 +292,9 @@ class ConfigTest(unittest.TestCase):
                 "client.caching",
                 "client.displayEnabled",
                 "client.showErrorDetails",
+                "client.maxChartPoints",
+                "client.imageFormat",
+                "client.imageQuality",
                 "theme.base",
                 "theme.primaryColor",
                 "theme.backgroundColor",
@@ -312,12 +315,19 @@ class ConfigTest(unittest.TestCase):
                 "global.suppressDeprecationWarnings",
                 "global.unitTest",
                 "global.dataFrameSerialization",
+                "global.maxArrowCacheSize",
+                "global.maxImageCacheSize",
                 "logger.level",
                 "logger.messageFormat",
                 "runner.magicEnabled",
                 "runner.installTracer",
+                "runner.asyncInterrupt",
+                "runner.rerunDebounceMs",
                 "runner.fixMatplotlib",
                 "runner.postScriptGC",
+                "runner.maxScriptThreads",
+                "runner.executionMode",
+                "runner.maxScriptProcesses",
                 "mapbox.token",
                 "s3.accessKeyId",
                 "s3.bucket",
@@ -330,6 +340,9 @@ class ConfigTest(unittest.TestCase):
                 "server.enableCORS",
                 "server.cookieSecret",
                 "server.enableWebsocketCompression",
+                "server.preheatedSessions",
+                "server.dataFramePageSize",
+                "server.maxDataFrameCacheSize",
                 "server.enableXsrfProtection",
                 "server.fileWatcherType",
                 "server.folderWatchBlacklist",
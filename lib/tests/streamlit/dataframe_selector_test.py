@@ -71,33 +71,33 @@ class DataFrameSelectorTest(unittest.TestCase):
     @patch.object(DeltaGenerator, "arrow_line_chart")
     @patch_config_options({"global.dataFrameSerialization": "legacy"})
     def test_legacy_line_chart(self, arrow_line_chart, legacy_line_chart):
-        streamlit.line_chart(DATAFRAME, 100, 200, True)
-        legacy_line_chart.assert_called_once_with(DATAFRAME, 100, 200, True)
+        streamlit.line_chart(DATAFRAME, 100, 200, True, 1000)
+        legacy_line_chart.assert_called_once_with(DATAFRAME, 100, 200, True, 1000)
         arrow_line_chart.assert_not_called()
 
     @patch.object(DeltaGenerator, "legacy_line_chart")
     @patch.object(DeltaGenerator, "arrow_line_chart")
     @patch_config_options({"global.dataFrameSerialization": "arrow"})
     def test_arrow_line_chart(self, arrow_line_chart, legacy_line_chart):
-        streamlit.line_chart(DATAFRAME, 100, 200, True)
+        streamlit.line_chart(DATAFRAME, 100, 200, True, 1000)
         legacy_line_chart.assert_not_called()
-        arrow_line_chart.assert_called_once_with(DATAFRAME, 100, 200, True)
+        arrow_line_chart.assert_called_once_with(DATAFRAME, 100, 200, True, 1000)
 
     @patch.object(DeltaGenerator, "legacy_area_chart")
     @patch.object(DeltaGenerator, "arrow_area_chart")
     @patch_config_options({"global.dataFrameSerialization": "legacy"})
     def test_legacy_area_chart(self, arrow_area_chart, legacy_area_chart):
-        streamlit.area_chart(DATAFRAME, 100, 200, True)
-        legacy_area_chart.assert_called_once_with(DATAFRAME, 100, 200, True)
+        streamlit.area_chart(DATAFRAME, 100, 200, True, 1000)
+        legacy_area_chart.assert_called_once_with(DATAFRAME, 100, 200, True, 1000)
         arrow_area_chart.assert_not_called()
 
     @patch.object(DeltaGenerator, "legacy_area_chart")
     @patch.object(DeltaGenerator, "arrow_area_chart")
     @patch_config_options({"global.dataFrameSerialization": "arrow"})
     def test_arrow_area_chart(self, arrow_area_chart, legacy_area_chart):
-        streamlit.area_chart(DATAFRAME, 100, 200, True)
+        streamlit.area_chart(DATAFRAME, 100, 200, True, 1000)
         legacy_area_chart.assert_not_called()
-        arrow_area_chart.assert_called_once_with(DATAFRAME, 100, 200, True)
+        arrow_area_chart.assert_called_once_with(DATAFRAME, 100, 200, True, 1000)
 
     @patch.object(DeltaGenerator, "legacy_bar_chart")
     @patch.object(DeltaGenerator, "arrow_bar_chart")
@@ -163,7 +163,7 @@ class DataFrameSelectorTest(unittest.TestCase):
     def test_legacy_add_rows(self, arrow_add_rows, legacy_add_rows):
         elt = streamlit.dataframe(DATAFRAME)
         elt.add_rows(DATAFRAME, foo=DATAFRAME)
-        legacy_add_rows.assert_called_once_with(DATAFRAME, foo=DATAFRAME)
+        legacy_add_rows.assert_called_once_with(DATAFRAME, None, foo=DATAFRAME)
         arrow_add_rows.assert_not_called()
 
     @patch.object(DeltaGenerator, "legacy_add_rows")
@@ -173,4 +173,4 @@ class DataFrameSelectorTest(unittest.TestCase):
         elt = streamlit.dataframe(DATAFRAME)
         elt.add_rows(DATAFRAME, foo=DATAFRAME)
         legacy_add_rows.assert_not_called()
-        arrow_add_rows.assert_called_once_with(DATAFRAME, foo=DATAFRAME)
+        arrow_add_rows.assert_called_once_with(DATAFRAME, None, foo=DATAFRAME)
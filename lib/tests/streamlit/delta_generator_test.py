@@ -486,7 +486,7 @@ class DeltaGeneratorChartTest(testutil.DeltaGeneratorTestCase):
         element = self.get_delta_from_queue().new_element.vega_lite_chart
         chart_spec = json.loads(element.spec)
         self.assertEqual(chart_spec["mark"], "line")
-        self.assertEqual(element.datasets[0].data.data.cols[2].int64s.data[0], 20)
+        self.assertEqual(element.datasets[0].data.data.cols[1].int64s.data[0], 20)
 
     def test_line_chart_with_generic_index(self):
         """Test dg.line_chart with a generic index."""
@@ -498,7 +498,7 @@ class DeltaGeneratorChartTest(testutil.DeltaGeneratorTestCase):
         element = self.get_delta_from_queue().new_element.vega_lite_chart
         chart_spec = json.loads(element.spec)
         self.assertEqual(chart_spec["mark"], "line")
-        self.assertEqual(element.datasets[0].data.data.cols[2].int64s.data[0], 30)
+        self.assertEqual(element.datasets[0].data.data.cols[1].int64s.data[0], 30)
 
     def test_line_chart_add_rows_with_generic_index(self):
         """Test empty dg.line_chart with add_rows funciton and a generic index."""
@@ -511,7 +511,26 @@ class DeltaGeneratorChartTest(testutil.DeltaGeneratorTestCase):
         element = self.get_delta_from_queue().new_element.vega_lite_chart
         chart_spec = json.loads(element.spec)
         self.assertEqual(chart_spec["mark"], "line")
-        self.assertEqual(element.datasets[0].data.data.cols[2].int64s.data[0], 30)
+        self.assertEqual(element.datasets[0].data.data.cols[1].int64s.data[0], 30)
+
+    def test_line_chart_add_rows_max_rows(self):
+        """Test dg.line_chart with add_rows and max_rows."""
+        chart = st.line_chart(pd.DataFrame({"a": [1, 2], "b": [3, 4]}))
+        self.report_queue.clear()
+        chart.add_rows(pd.DataFrame({"a": [5, 6, 7], "b": [8, 9, 10]}), max_rows=2)
+
+        add_rows = self.get_delta_from_queue().add_rows
+        self.assertEqual(2, add_rows.max_rows)
+        self.assertEqual([3, 4], add_rows.data.data.cols[0].int64s.data)
+        self.assertEqual([6, 7], add_rows.data.data.cols[1].int64s.data)
+        self.assertEqual([9, 10], add_rows.data.data.cols[2].int64s.data)
+
+    def test_add_rows_bad_max_rows(self):
+        """Test add_rows with a max_rows that isn't a positive integer."""
+        chart = st.line_chart(pd.DataFrame({"a": [1, 2]}))
+        for max_rows in [0, -1, 1.5, "10", True]:
+            with self.assertRaises(StreamlitAPIException):
+                chart.add_rows(pd.DataFrame({"a": [3]}), max_rows=max_rows)
 
     def test_area_chart(self):
         """Test dg.area_chart."""
@@ -522,7 +541,7 @@ class DeltaGeneratorChartTest(testutil.DeltaGeneratorTestCase):
         element = self.get_delta_from_queue().new_element.vega_lite_chart
         chart_spec = json.loads(element.spec)
         self.assertEqual(chart_spec["mark"], "area")
-        self.assertEqual(element.datasets[0].data.data.cols[2].int64s.data[0], 20)
+        self.assertEqual(element.datasets[0].data.data.cols[1].int64s.data[0], 20)
 
     def test_bar_chart(self):
         """Test dg.bar_chart."""
@@ -534,7 +553,7 @@ class DeltaGeneratorChartTest(testutil.DeltaGeneratorTestCase):
         chart_spec = json.loads(element.spec)
 
         self.assertEqual(chart_spec["mark"], "bar")
-        self.assertEqual(element.datasets[0].data.data.cols[2].int64s.data[0], 20)
+        self.assertEqual(element.datasets[0].data.data.cols[1].int64s.data[0], 20)
 
 
 class AutogeneratedWidgetIdTests(testutil.DeltaGeneratorTestCase):
@@ -15,9 +15,15 @@
 import unittest
 from unittest.mock import MagicMock, patch
 
+import numpy as np
+import pandas as pd
 import pytest
 
-from streamlit.elements.utils import check_callback_rules, check_session_state_rules
+from streamlit.elements.utils import (
+    check_callback_rules,
+    check_session_state_rules,
+    prep_chart_data,
+)
 from streamlit.errors import StreamlitAPIException
 
 
@@ -104,3 +110,57 @@ class ElementUtilsTest(unittest.TestCase):
             check_session_state_rules(5, key="the key", writes_allowed=False)
 
         assert "cannot be set using st.session_state" in str(e.value)
+
+    def test_prep_chart_data_short_series(self):
+        """Test that series with at most max_points rows are kept whole."""
+        df = pd.DataFrame({"a": [1, 2, 3], 4: [4.0, 5.0, 6.0]})
+
+        data, index_name, value_columns = prep_chart_data(df, 4)
+
+        self.assertEqual(index_name, "index")
+        self.assertEqual(value_columns, ["a", "4"])
+        expected = df.reset_index()
+        expected.columns = ["index", "a", "4"]
+        pd.testing.assert_frame_equal(data, expected)
+
+    def test_prep_chart_data_downsampled(self):
+        """Test that long series keep their first, last, min and max rows."""
+        values = np.zeros(1000)
+        values[123] = 10
+        values[456] = -10
+        values[789] = np.nan
+        df = pd.DataFrame(
+            {"x": values}, index=pd.date_range("2021-01-01", periods=1000)
+        )
+        df.index.name = "date"
+
+        data, index_name, _ = prep_chart_data(df, 4)
+
+        self.assertEqual(index_name, "date")
+        expected = df.iloc[[0, 123, 456, 999]].reset_index()
+        pd.testing.assert_frame_equal(data, expected)
+
+    def test_prep_chart_data_downsampled_columns(self):
+        """Test that the columns share their rows, and each one keeps its
+        own min and max rows.
+        """
+        a = np.zeros(1000)
+        a[100] = 1
+        a[200] = -1
+        b = np.zeros(1000)
+        b[300] = 1
+        b[400] = -1
+        df = pd.DataFrame({"a": a, "b": b})
+
+        data, _, _ = prep_chart_data(df, 6)
+
+        self.assertEqual(list(data["index"]), [0, 100, 200, 300, 400, 999])
+        self.assertEqual(list(data["a"]), [0, 1, -1, 0, 0, 0])
+        self.assertEqual(list(data["b"]), [0, 0, 0, 1, -1, 0])
+
+    def test_prep_chart_data_bad_max_points(self):
+        """Test that max_points must be 0, or at least 4."""
+        df = pd.DataFrame({"a": range(10)})
+
+        with pytest.raises(StreamlitAPIException):
+            prep_chart_data(df, 3)
@@ -14,12 +14,15 @@
 
 """Unit test for image."""
 
+from unittest.mock import patch
+
 import pytest
 from PIL import Image, ImageDraw
 from parameterized import parameterized
 
 from streamlit.errors import StreamlitAPIException
 from tests import testutil
+from tests.testutil import patch_config_options
 import cv2
 import numpy as np
 
@@ -179,16 +182,55 @@ class ImageProtoTest(testutil.DeltaGeneratorTestCase):
             ),
         ]
     )
-    def test_marshall_images_with_auto_output_format(self, data_in, expected_format):
+    @patch("streamlit.elements.image._is_webp_supported", return_value=False)
+    def test_marshall_images_with_auto_output_format(self, data_in, expected_format, _):
         """Test streamlit.image.marshall_images.
-        with auto output_format
+        with auto output_format, when Pillow can't write WebP images.
         """
+        image.encoded_image_cache.clear()
+        self.addCleanup(image.encoded_image_cache.clear)
 
         st.image(data_in, output_format="auto")
         imglist = self.get_delta_from_queue().new_element.imgs
         self.assertEqual(len(imglist.imgs), 1)
         self.assertTrue(imglist.imgs[0].url.endswith(f".{expected_format}"))
 
+    @parameterized.expand(
+        [
+            (IMAGES["img_32_32_3_rgba"]["np"], True),
+            (IMAGES["img_64_64_rgb"]["pil"], True),
+            ((np.random.RandomState(0).rand(32, 32, 3) * 255).astype(np.uint8), False),
+        ]
+    )
+    def test_marshall_images_as_webp(self, data_in, lossless):
+        """With auto output_format, images are sent as WebP: lossless for
+        images with transparency or few colors, and lossy for others."""
+        from streamlit.media_file_manager import media_file_manager
+
+        image.encoded_image_cache.clear()
+        self.addCleanup(image.encoded_image_cache.clear)
+
+        st.image(data_in)
+        imglist = self.get_delta_from_queue().new_element.imgs
+        self.assertTrue(imglist.imgs[0].url.endswith(".webp"))
+
+        file_id = imglist.imgs[0].url.split("/")[-1].split(".")[0]
+        data = media_file_manager.get(file_id).content
+        # Lossless WebP images are stored in a "VP8L" chunk.
+        self.assertEqual(data[12:16] == b"VP8L", lossless)
+
+    @patch_config_options({"client.imageFormat": "JPEG"})
+    def test_image_format_config_option(self):
+        """client.imageFormat is the default output_format."""
+        st.image(IMAGES["img_32_32_3_rgb"]["np"])
+        imglist = self.get_delta_from_queue().new_element.imgs
+        self.assertTrue(imglist.imgs[0].url.endswith(".jpeg"))
+
+    @patch("streamlit.elements.image._is_webp_supported", return_value=False)
+    def test_webp_not_supported(self, _):
+        with self.assertRaises(StreamlitAPIException):
+            st.image(IMAGES["img_32_32_3_rgb"]["np"], output_format="WEBP")
+
     @parameterized.expand(
         [
             (
@@ -247,6 +289,55 @@ class ImageProtoTest(testutil.DeltaGeneratorTestCase):
         img = image_list_proto.imgs[0]
         self.assertTrue(img.markup.startswith(expected_prefix))
 
+    def test_marshall_image_list(self):
+        """The images of a list are encoded in parallel, and added in order."""
+        from streamlit.media_file_manager import _calculate_file_id
+
+        self.addCleanup(image.encoded_image_cache.clear)
+        images = [
+            IMAGES["img_32_32_3_rgb"]["np"],
+            IMAGES["img_32_32_3_rgba"]["pil"],
+            "https://streamlit.io/test.png",
+            IMAGES["img_64_64_rgb"]["np"],
+        ]
+        st.image(images, output_format="PNG")
+
+        imglist = self.get_delta_from_queue().new_element.imgs
+        self.assertEqual(len(imglist.imgs), 4)
+        self.assertEqual(imglist.imgs[2].url, "https://streamlit.io/test.png")
+        for img, data_in in zip(imglist.imgs, images):
+            if isinstance(data_in, Image.Image):
+                data = image._PIL_to_bytes(data_in, format="PNG")
+            elif isinstance(data_in, np.ndarray):
+                data = image._np_array_to_bytes(data_in, output_format="PNG")
+            else:
+                continue
+            self.assertIn(_calculate_file_id(data, "image/png"), img.url)
+
+    def test_encoded_image_cache(self):
+        """Images with the same pixels and options are only encoded once."""
+        self.addCleanup(image.encoded_image_cache.clear)
+        image.encoded_image_cache.clear()
+
+        data_in = IMAGES["img_32_32_3_rgb"]["np"]
+        with patch(
+            "streamlit.elements.image._np_array_to_bytes",
+            wraps=image._np_array_to_bytes,
+        ) as np_array_to_bytes:
+            st.image(data_in)
+            url = self.get_delta_from_queue().new_element.imgs.imgs[0].url
+
+            st.image(data_in.copy())
+            self.assertEqual(
+                url, self.get_delta_from_queue().new_element.imgs.imgs[0].url
+            )
+            np_array_to_bytes.assert_called_once()
+
+            # Other pixels and options are encoded again.
+            st.image(data_in, width=16)
+            st.image(255 - data_in)
+            self.assertEqual(np_array_to_bytes.call_count, 3)
+
     def test_BytesIO_to_bytes(self):
         """Test streamlit.image.BytesIO_to_bytes."""
         pass
@@ -15,6 +15,7 @@
 """Unit tests for legacy_data_frame."""
 
 from unittest.mock import patch
+import datetime
 import json
 import unittest
 
@@ -73,16 +74,31 @@ class DataFrameProtoTest(unittest.TestCase):
         pass
 
     def test_get_css_styles(self):
-        """Test streamlit.data_frame._get_css_styles.
-
-        Need to test the following:
-        * cell_selector_regex isnt found
-        * cell_style['props'] isn't a list
-        * cell_style['props'] does not equal 2
-        * style has name and value
-        * style does not have name and value
-        """
-        pass
+        """Test streamlit.data_frame._get_css_styles."""
+        df = pd.DataFrame([[1, 2], [2, 1]])
+        styler = df.style.applymap(lambda x: "color: red" if x == 1 else "")
+        styler._compute()
+        translated_style = styler._translate(False, False)
+
+        css_styles = data_frame._get_css_styles(translated_style)
+
+        red = [data_frame.CSSStyle("color", "red")]
+        self.assertEqual(css_styles[(0, 0)], red)
+        self.assertEqual(css_styles[(1, 1)], red)
+        self.assertNotIn((0, 1), css_styles)
+        # Cells with the same styles share a list of declarations.
+        self.assertIs(css_styles[(0, 0)], css_styles[(1, 1)])
+
+    def test_get_css_styles_bad_selector(self):
+        """Test that _get_css_styles raises on unknown cell selectors."""
+        translated_style = {
+            "cellstyle": [
+                {"props": [("color", "red")], "selectors": ["row0_col0", "foo"]}
+            ]
+        }
+        with self.assertRaises(RuntimeError) as e:
+            data_frame._get_css_styles(translated_style)
+        self.assertEqual(str(e.exception), 'Failed to parse cellstyle selector "foo"')
 
     def test_get_custom_display_values(self):
         """Test streamlit.data_frame._get_custom_display_values.
@@ -262,6 +278,37 @@ class DataFrameProtoTest(unittest.TestCase):
         with pytest.raises(NotImplementedError, match="^Dtype <U6 not understood.$"):
             data_frame._marshall_any_array(str_data, str_proto)
 
+    def test_marshall_any_array_matches_elementwise_conversion(self):
+        """The whole-array conversions give the same values as converting
+        one element at a time."""
+        float_data = np.array([1.5, np.nan, -np.inf, 1e300], dtype=np.float32)
+        float_proto = AnyArray()
+        data_frame._marshall_any_array(float_data, float_proto)
+        np.testing.assert_array_equal(float_proto.doubles.data, float_data)
+
+        obj_data = np.array([1, 1.5, None, b"bytes", "str", pd.NA], dtype=object)
+        obj_proto = AnyArray()
+        data_frame._marshall_any_array(obj_data, obj_proto)
+        self.assertEqual(obj_proto.strings.data, list(map(str, obj_data)))
+
+        dt_data = pd.DatetimeIndex(
+            [
+                "2020-01-01",
+                "2020-01-01 00:00:01.5",
+                "2020-07-01 12:00:00.000001999",
+                "1960-03-04 01:02:03.4567891",
+                None,
+            ]
+        )
+        for tz in [None, "America/New_York", "Asia/Kolkata"]:
+            tz_data = dt_data if tz is None else dt_data.tz_localize(tz)
+            dt_proto = AnyArray()
+            data_frame._marshall_any_array(tz_data, dt_proto)
+            self.assertEqual(
+                dt_proto.datetimes.data,
+                list(tz_data.map(datetime.datetime.isoformat)),
+            )
+
     def test_add_rows(self):
         """Test streamlit.data_frame._add_rows."""
         # Generic Data
@@ -51,6 +51,30 @@ class StMapTest(testutil.DeltaGeneratorTestCase):
         self.assertEqual(c.get("initialViewState").get("pitch"), 0)
         self.assertEqual(c.get("layers")[0].get("@@type"), "ScatterplotLayer")
 
+    def test_binary_positions(self):
+        """Test that the points' positions are sent as binary data."""
+        df = pd.DataFrame({"longitude": [10.5, 20.25, 30], "latitude": [1, 2, 3]})
+        st.map(df)
+
+        c = self.get_delta_from_queue().new_element.deck_gl_json_chart
+        layer = json.loads(c.json)["layers"][0]
+        self.assertNotIn("data", layer)
+        self.assertNotIn("getPosition", layer)
+
+        self.assertEqual(len(c.binary_data), 1)
+        binary_data = c.binary_data[0]
+        self.assertEqual(binary_data.layer_id, layer["id"])
+        self.assertEqual(binary_data.length, 3)
+        self.assertEqual(len(binary_data.attributes), 1)
+
+        positions = binary_data.attributes[0]
+        self.assertEqual(positions.accessor, "getPosition")
+        self.assertEqual(positions.size, 2)
+        self.assertEqual(
+            np.frombuffer(positions.float64_values, dtype="<f8").tolist(),
+            [10.5, 1, 20.25, 2, 30, 3],
+        )
+
     def test_default_map_copy(self):
         """Test that _DEFAULT_MAP is not modified as other work occurs."""
         self.assertEqual(_DEFAULT_MAP["initialViewState"]["latitude"], 0)
@@ -107,6 +107,9 @@ class MetricsTest(unittest.TestCase):
             client = streamlit.metrics.Client.get_current()
             client._metrics = {}
 
+            # The constructor creates one MockMetric per built-in metric.
+            num_builtin_metrics = len(client._raw_metrics)
+
             # yapf: disable
             client._raw_metrics = [
                 ('Counter', 'unittest_counter', 'Unittest counter', []),
@@ -125,8 +128,7 @@ class MetricsTest(unittest.TestCase):
             client.get("unittest_gauge").set(42)
             client.get("unittest_gauge").dec()
 
-            calls = [
-                call(),  # Constructor
+            calls = [call()] * num_builtin_metrics + [
                 call(),  # unittest_counter
                 call(),  # unittest_counter_labels
                 call(),  # unittest_gauge
@@ -0,0 +1,114 @@
+# Copyright 2018-2021 Streamlit Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for st.plotly_chart()."""
+
+import base64
+import json
+from unittest.mock import patch
+
+import numpy as np
+
+from streamlit import caching
+from streamlit import type_util
+from tests import testutil
+import streamlit as st
+
+
+def _decode(typed_array):
+    """Decode a typed array dict of a Plotly spec into a numpy array."""
+    values = np.frombuffer(
+        base64.b64decode(typed_array["bdata"]), dtype="<" + typed_array["dtype"]
+    )
+    if "shape" in typed_array:
+        values = values.reshape([int(n) for n in typed_array["shape"].split(",")])
+    return values
+
+
+class PlotlyChartTest(testutil.DeltaGeneratorTestCase):
+    """Test ability to marshall plotly_chart protos."""
+
+    def test_typed_arrays(self):
+        """Numeric numpy arrays are sent as base64-encoded typed arrays."""
+        import plotly.graph_objs as go
+
+        x = np.arange(5)
+        y = np.array([1.5, np.nan, 3.0, 4.0, 5.0])
+        z = np.arange(6, dtype=np.float32).reshape(2, 3)
+        fig = go.Figure(go.Scatter(x=x, y=y, text=["a", "b", "c", "d", "e"]))
+        fig.add_heatmap(z=z)
+        st.plotly_chart(fig)
+
+        spec = json.loads(
+            self.get_delta_from_queue().new_element.plotly_chart.figure.spec
+        )
+        scatter, heatmap = spec["data"]
+
+        self.assertEqual(scatter["x"]["dtype"], "i4")
+        np.testing.assert_array_equal(_decode(scatter["x"]), x)
+        self.assertEqual(scatter["y"]["dtype"], "f8")
+        np.testing.assert_array_equal(_decode(scatter["y"]), y)
+        self.assertEqual(scatter["text"], ["a", "b", "c", "d", "e"])
+        self.assertEqual(heatmap["z"]["dtype"], "f4")
+        self.assertEqual(heatmap["z"]["shape"], "2, 3")
+        np.testing.assert_array_equal(_decode(heatmap["z"]), z)
+
+    def test_large_integers(self):
+        """64-bit integers that don't fit in 32 bits are sent as floats."""
+        import plotly.graph_objs as go
+
+        x = np.array([0, 2 ** 40])
+        st.plotly_chart(go.Figure(go.Scatter(x=x, y=[1, 2])))
+
+        spec = json.loads(
+            self.get_delta_from_queue().new_element.plotly_chart.figure.spec
+        )
+        self.assertEqual(spec["data"][0]["x"]["dtype"], "f8")
+        np.testing.assert_array_equal(_decode(spec["data"][0]["x"]), x)
+
+    def test_nan_in_lists(self):
+        """NaNs outside of typed arrays are sent as null."""
+        st.plotly_chart({"data": [{"type": "scatter", "y": [1, float("nan")]}]})
+
+        spec = json.loads(
+            self.get_delta_from_queue().new_element.plotly_chart.figure.spec
+        )
+        self.assertEqual(spec["data"][0]["y"], [1, None])
+
+    def test_cached_figure(self):
+        """The specs of figures returned by st.cache are reused."""
+        import plotly.graph_objs as go
+
+        self.addCleanup(caching.clear_cache)
+        self.addCleanup(type_util.arrow_bytes_cache.clear)
+
+        @st.cache
+        def get_figure():
+            return go.Figure(go.Scatter(x=np.arange(5), y=np.arange(5)))
+
+        st.plotly_chart(get_figure())
+        spec = self.get_delta_from_queue().new_element.plotly_chart.figure.spec
+
+        with patch(
+            "streamlit.elements.plotly_chart._figure_to_json", return_value="{}"
+        ) as figure_to_json:
+            st.plotly_chart(get_figure())
+            self.assertEqual(
+                spec, self.get_delta_from_queue().new_element.plotly_chart.figure.spec
+            )
+            figure_to_json.assert_not_called()
+
+            # Figures that don't come from st.cache are serialized again.
+            st.plotly_chart(go.Figure(get_figure()))
+            figure_to_json.assert_called_once()
@@ -18,11 +18,14 @@ import copy
 import unittest
 from typing import Tuple
 
+import pandas as pd
+
 from streamlit import RootContainer
 from streamlit.cursor import make_delta_path
 from streamlit.report_queue import ReportQueue
 from streamlit.elements import legacy_data_frame
 from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.type_util import bytes_to_data_frame, data_frame_to_bytes
 
 # For the messages below, we don't really care about their contents so much as
 # their general type.
@@ -52,6 +55,16 @@ legacy_data_frame.marshall_data_frame(
 ADD_ROWS_MSG.metadata.delta_path[:] = make_delta_path(RootContainer.MAIN, (), 0)
 
 
+def _create_arrow_add_rows_msg(df, name=None, index=1) -> ForwardMsg:
+    msg = ForwardMsg()
+    msg.delta.arrow_add_rows.data.data = data_frame_to_bytes(df)
+    if name is not None:
+        msg.delta.arrow_add_rows.name = name
+        msg.delta.arrow_add_rows.has_name = True
+    msg.metadata.delta_path[:] = make_delta_path(RootContainer.MAIN, (), index)
+    return msg
+
+
 class ReportQueueTest(unittest.TestCase):
     def test_simple_enqueue(self):
         rq = ReportQueue()
@@ -252,3 +265,138 @@ class ReportQueueTest(unittest.TestCase):
 
         assert_deltas(RootContainer.MAIN, (), 1)
         assert_deltas(RootContainer.SIDEBAR, (0, 0, 1), 3)
+
+    def test_arrow_add_rows(self):
+        """Consecutive arrow_add_rows for the same element are sent as a
+        single Arrow stream."""
+        rq = ReportQueue()
+        rq.enqueue(TEXT_DELTA_MSG1)
+
+        for i in range(3):
+            df = pd.DataFrame({"col1": [i, i + 10]})
+            rq.enqueue(_create_arrow_add_rows_msg(df))
+
+        queue = rq.flush()
+        self.assertEqual(2, len(queue))
+
+        df = bytes_to_data_frame(queue[1].delta.arrow_add_rows.data.data)
+        self.assertEqual([0, 10, 1, 11, 2, 12], df["col1"].tolist())
+        # The RangeIndex covers all of the rows.
+        self.assertEqual(list(range(6)), df.index.tolist())
+
+    def test_arrow_add_rows_max_rows(self):
+        """Merged arrow_add_rows keep only the last max_rows rows."""
+        rq = ReportQueue()
+        rq.enqueue(TEXT_DELTA_MSG1)
+
+        for i in range(3):
+            msg = _create_arrow_add_rows_msg(pd.DataFrame({"col1": [i, i + 10]}))
+            msg.delta.arrow_add_rows.max_rows = 3
+            rq.enqueue(msg)
+
+        queue = rq.flush()
+        self.assertEqual(2, len(queue))
+        self.assertEqual(3, queue[1].delta.arrow_add_rows.max_rows)
+
+        df = bytes_to_data_frame(queue[1].delta.arrow_add_rows.data.data)
+        self.assertEqual([11, 2, 12], df["col1"].tolist())
+        self.assertEqual([3, 4, 5], df.index.tolist())
+
+    def test_arrow_add_rows_not_merged(self):
+        """arrow_add_rows with different datasets or columns aren't merged."""
+        rq = ReportQueue()
+        rq.enqueue(TEXT_DELTA_MSG1)
+
+        df = pd.DataFrame({"col1": [0, 1]})
+        rq.enqueue(_create_arrow_add_rows_msg(df, name="foo"))
+        rq.enqueue(_create_arrow_add_rows_msg(df, name="bar"))
+        rq.enqueue(_create_arrow_add_rows_msg(pd.DataFrame({"col2": ["a"]}), "bar"))
+        rq.enqueue(_create_arrow_add_rows_msg(df, name="foo", index=2))
+
+        queue = rq.flush()
+        self.assertEqual(5, len(queue))
+        self.assertEqual(
+            ["foo", "bar", "bar", "foo"],
+            [msg.delta.arrow_add_rows.name for msg in queue[1:]],
+        )
+
+    def test_add_rows_max_rows(self):
+        """add_rows with max_rows drops the oldest rows of the element."""
+        rq = ReportQueue()
+
+        df_msg = copy.deepcopy(DF_DELTA_MSG)
+        df_msg.metadata.delta_path[:] = make_delta_path(RootContainer.MAIN, (), 0)
+        rq.enqueue(df_msg)
+
+        add_rows_msg = copy.deepcopy(ADD_ROWS_MSG)
+        add_rows_msg.metadata.delta_path[:] = make_delta_path(RootContainer.MAIN, (), 0)
+        add_rows_msg.delta.add_rows.max_rows = 4
+        rq.enqueue(add_rows_msg)
+
+        queue = rq.flush()
+        df = queue[0].delta.new_element.data_frame
+        self.assertEqual([2, 3, 4, 5], df.data.cols[0].int64s.data)
+        self.assertEqual([12, 13, 14, 15], df.data.cols[1].int64s.data)
+        self.assertEqual(2, df.index.range_index.start)
+        self.assertEqual(6, df.index.range_index.stop)
+
+        # add_rows composed into another add_rows keep max_rows, so that the
+        # frontend drops its own oldest rows too.
+        rq.enqueue(add_rows_msg)
+        rq.enqueue(add_rows_msg)
+        queue = rq.flush()
+        rows = queue[0].delta.add_rows
+        self.assertEqual(4, rows.max_rows)
+        self.assertEqual([5, 3, 4, 5], rows.data.data.cols[0].int64s.data)
+
+    def test_add_rows_does_not_mutate_enqueued_msgs(self):
+        """add_rows is composed into the queue's own copy of the element,
+        even when it's composed in place."""
+        rq1 = ReportQueue()
+        rq2 = ReportQueue()
+
+        df_msg = copy.deepcopy(DF_DELTA_MSG)
+        df_msg.metadata.delta_path[:] = make_delta_path(RootContainer.MAIN, (), 0)
+        rq1.enqueue(df_msg)
+        rq2.enqueue(df_msg)
+
+        add_rows_msg = copy.deepcopy(ADD_ROWS_MSG)
+        add_rows_msg.metadata.delta_path[:] = make_delta_path(RootContainer.MAIN, (), 0)
+        for i in range(2):
+            rq1.enqueue(add_rows_msg)
+        rq2.enqueue(add_rows_msg)
+        clone = rq1.clone()
+        rq1.enqueue(add_rows_msg)
+
+        def col0(queue):
+            return queue[0].delta.new_element.data_frame.data.cols[0].int64s.data
+
+        self.assertEqual(
+            [0, 1, 2], df_msg.delta.new_element.data_frame.data.cols[0].int64s.data
+        )
+        self.assertEqual(
+            [3, 4, 5], add_rows_msg.delta.add_rows.data.data.cols[0].int64s.data
+        )
+        self.assertEqual([0, 1, 2, 3, 4, 5], col0(rq2.flush()))
+        self.assertEqual([0, 1, 2, 3, 4, 5, 3, 4, 5], col0(clone.flush()))
+        self.assertEqual([0, 1, 2, 3, 4, 5, 3, 4, 5, 3, 4, 5], col0(rq1.flush()))
+
+    def test_data_sets(self):
+        """DataSets are sent once, ahead of the deltas that refer to them."""
+        rq = ReportQueue()
+        rq.enqueue(TEXT_DELTA_MSG1)
+
+        data_set_msgs = []
+        for data_set_id in ["a", "a", "b"]:
+            msg = ForwardMsg()
+            msg.data_set.id = data_set_id
+            rq.enqueue(msg)
+            data_set_msgs.append(msg)
+        rq.enqueue(TEXT_DELTA_MSG2)
+
+        queue = rq.flush()
+        self.assertEqual(3, len(queue))
+        self.assertIs(data_set_msgs[0], queue[0])
+        self.assertIs(data_set_msgs[2], queue[1])
+        self.assertEqual("text2", queue[2].delta.new_element.text.body)
+        self.assertTrue(rq.is_empty())
@@ -0,0 +1,101 @@
+# Copyright 2018-2021 Streamlit Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""ScriptCache unit tests."""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from streamlit import magic
+from streamlit.script_cache import ScriptCache
+from tests.testutil import patch_config_options
+
+
+class ScriptCacheTest(unittest.TestCase):
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self._script_path = os.path.join(self._dir.name, "script.py")
+        self._write_script("a = 1\na\n")
+        self._cache = ScriptCache()
+
+    def tearDown(self):
+        self._dir.cleanup()
+
+    def _write_script(self, body):
+        with open(self._script_path, "w") as f:
+            f.write(body)
+
+    def test_reuses_bytecode(self):
+        """Unchanged scripts are only parsed and compiled once."""
+        with patch("streamlit.script_cache.magic.add_magic") as add_magic:
+            add_magic.side_effect = lambda body, path: body
+            code1 = self._cache.get_bytecode(self._script_path)
+            code2 = self._cache.get_bytecode(self._script_path)
+
+        self.assertIs(code1, code2)
+        self.assertEqual(1, add_magic.call_count)
+
+    def test_recompiles_changed_source(self):
+        """A change to the script's source invalidates its entry."""
+        code1 = self._cache.get_bytecode(self._script_path)
+        self._write_script("b = 2\n")
+        code2 = self._cache.get_bytecode(self._script_path)
+
+        self.assertIsNot(code1, code2)
+        self.assertIn("b", code2.co_names)
+
+    def test_keyed_on_magic_enabled(self):
+        """Toggling runner.magicEnabled results in a separate entry."""
+        with patch_config_options({"runner.magicEnabled": True}):
+            magic_code = self._cache.get_bytecode(self._script_path)
+        with patch_config_options({"runner.magicEnabled": False}):
+            plain_code = self._cache.get_bytecode(self._script_path)
+
+        self.assertIsNot(magic_code, plain_code)
+        self.assertIn("streamlit", magic_code.co_names)
+        self.assertNotIn("streamlit", plain_code.co_names)
+        # Both entries are kept.
+        with patch_config_options({"runner.magicEnabled": True}):
+            self.assertIs(magic_code, self._cache.get_bytecode(self._script_path))
+        with patch_config_options({"runner.magicEnabled": False}):
+            self.assertIs(plain_code, self._cache.get_bytecode(self._script_path))
+
+    def test_compile_errors_are_not_cached(self):
+        """Compile errors are raised, and nothing is cached."""
+        self._write_script("def broken(:\n")
+        with patch(
+            "streamlit.script_cache.magic.add_magic", wraps=magic.add_magic
+        ) as add_magic:
+            for _ in range(2):
+                with self.assertRaises(SyntaxError):
+                    self._cache.get_bytecode(self._script_path)
+
+        # The script is parsed again, rather than served from the cache.
+        self.assertEqual(2, add_magic.call_count)
+
+    def test_invalidate(self):
+        """invalidate() drops all entries for a path."""
+        code = self._cache.get_bytecode(self._script_path)
+        self.assertIs(code, self._cache.get_bytecode(self._script_path))
+
+        self._cache.invalidate(self._script_path)
+        self.assertIsNot(code, self._cache.get_bytecode(self._script_path))
+
+    def test_clear(self):
+        """clear() drops all entries."""
+        code = self._cache.get_bytecode(self._script_path)
+        self._cache.clear()
+        self.assertIsNot(code, self._cache.get_bytecode(self._script_path))
@@ -0,0 +1,136 @@
+# Copyright 2018-2021 Streamlit Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""ProcessScriptRunner and ScriptProcessPool tests."""
+
+import os
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from streamlit import script_process_pool
+from streamlit.proto.ClientState_pb2 import ClientState
+from streamlit.report import Report
+from streamlit.script_process_pool import ProcessScriptRunner, ScriptProcessPool
+from streamlit.script_request_queue import RerunData, ScriptRequest
+from streamlit.script_request_queue import ScriptRequestQueue
+from streamlit.script_runner import ScriptRunnerEvent
+from streamlit.state.session_state import SessionState
+
+TIMEOUT = 30
+
+
+def _script_path(name):
+    return os.path.join(os.path.dirname(__file__), "scriptrunner", "test_data", name)
+
+
+class TestProcessScriptRunner(ProcessScriptRunner):
+    """ProcessScriptRunner that records its events and ForwardMsgs."""
+
+    def __init__(self, session_id, script_name):
+        self.request_queue = ScriptRequestQueue()
+        self.forward_msgs = []
+        self.events = []
+        self._shutdown = threading.Event()
+
+        super(TestProcessScriptRunner, self).__init__(
+            session_id=session_id,
+            report=Report(_script_path(script_name), "test command line"),
+            enqueue_forward_msg=self.forward_msgs.append,
+            client_state=ClientState(),
+            request_queue=self.request_queue,
+            session_state=SessionState(),
+        )
+
+        def record_event(event, **kwargs):
+            self.events.append(event)
+            if event == ScriptRunnerEvent.SHUTDOWN:
+                self._shutdown.set()
+
+        self.on_event.connect(record_event, weak=False)
+
+    def enqueue_rerun(self):
+        self.request_queue.enqueue(ScriptRequest.RERUN, RerunData())
+
+    def enqueue_stop(self):
+        self.request_queue.enqueue(ScriptRequest.STOP)
+
+    def wait_for_shutdown(self):
+        return self._shutdown.wait(TIMEOUT)
+
+    def text_deltas(self):
+        return [
+            msg.delta.new_element.text.body
+            for msg in self.forward_msgs
+            if msg.WhichOneof("type") == "delta"
+            and msg.delta.new_element.WhichOneof("type") == "text"
+        ]
+
+
+class ProcessScriptRunnerTest(unittest.TestCase):
+    def _create_pool(self, script_name):
+        # Workers run the script of the Report the pool was created with.
+        report = Report(_script_path(script_name), "test command line")
+        self.pool = ScriptProcessPool(report, max_processes=1)
+        self.addCleanup(self.pool.shutdown)
+
+        patcher = patch.object(script_process_pool, "_pool", self.pool)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_runs_script_in_worker(self):
+        """The script runs in the worker, and its output is forwarded."""
+        self._create_pool("runtime_error.py")
+        runner = TestProcessScriptRunner("session1", "runtime_error.py")
+        runner.enqueue_rerun()
+        runner.start()
+
+        self.assertTrue(runner.wait_for_shutdown())
+        self.assertEqual(
+            [
+                ScriptRunnerEvent.SCRIPT_STARTED,
+                ScriptRunnerEvent.SCRIPT_STOPPED_WITH_SUCCESS,
+                ScriptRunnerEvent.SHUTDOWN,
+            ],
+            runner.events,
+        )
+        self.assertEqual(["first"], runner.text_deltas())
+
+    def test_stop_script(self):
+        """A STOP request interrupts a script running in the worker."""
+        self._create_pool("infinite_loop.py")
+        runner = TestProcessScriptRunner("session1", "infinite_loop.py")
+        runner.enqueue_rerun()
+        runner.start()
+
+        deadline = time.time() + TIMEOUT
+        while len(runner.text_deltas()) == 0 and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertIn("loop_forever", runner.text_deltas())
+
+        runner.enqueue_stop()
+        self.assertTrue(runner.wait_for_shutdown())
+        self.assertEqual(ScriptRunnerEvent.SHUTDOWN, runner.events[-1])
+
+    def test_sessions_share_worker(self):
+        """Sessions are pinned to a worker, up to max_processes workers."""
+        self._create_pool("good_script.py")
+        worker1 = self.pool.get_worker("session1")
+        worker2 = self.pool.get_worker("session2")
+        self.assertIs(worker1, worker2)
+        self.assertEqual(2, worker1.num_sessions)
+
+        self.pool.release_session("session1")
+        self.assertEqual(1, worker1.num_sessions)
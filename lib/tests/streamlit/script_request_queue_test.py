@@ -148,3 +148,66 @@ class ScriptRequestQueueTest(unittest.TestCase):
 
         # We should have no more events
         self.assertEqual((None, None), queue.dequeue(), "Expected empty event queue")
+
+    def test_debounce_rerun(self):
+        """Test that RERUN requests that arrive during the debounce window
+        are merged into the pending rerun."""
+        queue = ScriptRequestQueue()
+
+        def int_states(value):
+            states = WidgetStates()
+            _create_widget("int", states).int_value = value
+            return states
+
+        queue.enqueue(ScriptRequest.RERUN, RerunData(widget_states=int_states(1)))
+        _, data = queue.dequeue()
+
+        def enqueue_reruns():
+            for i in range(2, 6):
+                time.sleep(0.02)
+                queue.enqueue(
+                    ScriptRequest.RERUN, RerunData(widget_states=int_states(i))
+                )
+
+        thread = Thread(target=enqueue_reruns, name="test_debounce_rerun")
+        thread.start()
+
+        start = time.monotonic()
+        data = queue.debounce_rerun(data, 0.1)
+        elapsed = time.monotonic() - start
+        thread.join()
+
+        # We waited for the last request, plus the debounce window.
+        self.assertGreaterEqual(elapsed, 0.15)
+        self.assertEqual(5, data.widget_states.widgets[0].int_value)
+        self.assertEqual((None, None), queue.dequeue(), "Expected empty event queue")
+
+    def test_debounce_rerun_no_window(self):
+        """Test that debounce_rerun returns immediately without a window."""
+        queue = ScriptRequestQueue()
+        queue.enqueue(ScriptRequest.RERUN, RerunData())
+        data = RerunData(query_string="foo")
+
+        self.assertIs(data, queue.debounce_rerun(data, 0))
+        self.assertEqual(ScriptRequest.RERUN, queue.dequeue()[0])
+
+    def test_debounce_rerun_interrupted_by_shutdown(self):
+        """Test that a SHUTDOWN request ends the debounce window early."""
+        queue = ScriptRequestQueue()
+        data = RerunData()
+
+        def enqueue_shutdown():
+            time.sleep(0.05)
+            queue.enqueue(ScriptRequest.SHUTDOWN)
+
+        thread = Thread(target=enqueue_shutdown, name="test_debounce_shutdown")
+        thread.start()
+
+        start = time.monotonic()
+        queue.enqueue(ScriptRequest.RERUN, RerunData())
+        queue.dequeue()
+        queue.debounce_rerun(data, 10)
+        thread.join()
+
+        self.assertLess(time.monotonic() - start, 5)
+        self.assertEqual(ScriptRequest.SHUTDOWN, queue.dequeue()[0])
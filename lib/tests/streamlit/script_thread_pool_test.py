@@ -0,0 +1,117 @@
+# Copyright 2018-2021 Streamlit Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""ScriptThreadPool unit tests."""
+
+import threading
+import unittest
+from unittest.mock import MagicMock
+
+from streamlit.report_thread import get_report_ctx
+from streamlit.script_thread_pool import ScriptJob, ScriptThreadPool
+
+TIMEOUT = 5
+
+
+def _make_ctx():
+    return MagicMock(name="ReportContext")
+
+
+class ScriptThreadPoolTest(unittest.TestCase):
+    def test_runs_job_with_report_ctx(self):
+        """Jobs run with their ReportContext attached to the thread."""
+        pool = ScriptThreadPool()
+        ctx = _make_ctx()
+        seen = []
+
+        job = ScriptJob(ctx, lambda: seen.append(get_report_ctx()))
+        pool.submit(job)
+
+        self.assertTrue(job.join(TIMEOUT))
+        self.assertTrue(job.is_done)
+        self.assertEqual([ctx], seen)
+        self.assertIsNot(threading.current_thread(), job.thread)
+
+        # The context is detached from the pool thread once the job is done.
+        self.assertFalse(hasattr(job.thread, "streamlit_report_ctx"))
+
+    def test_reuses_threads(self):
+        """Sequential jobs reuse the same thread."""
+        pool = ScriptThreadPool()
+
+        job1 = ScriptJob(_make_ctx(), lambda: None)
+        pool.submit(job1)
+        self.assertTrue(job1.join(TIMEOUT))
+
+        job2 = ScriptJob(_make_ctx(), lambda: None)
+        pool.submit(job2)
+        self.assertTrue(job2.join(TIMEOUT))
+
+        self.assertIs(job1.thread, job2.thread)
+        self.assertEqual(1, pool.num_threads)
+
+    def test_max_threads(self):
+        """Jobs beyond max_threads are queued and run in FIFO order."""
+        pool = ScriptThreadPool(max_threads=1)
+        release = threading.Event()
+        order = []
+
+        def blocking_job():
+            release.wait(TIMEOUT)
+            order.append("blocking")
+
+        job1 = ScriptJob(_make_ctx(), blocking_job)
+        job2 = ScriptJob(_make_ctx(), lambda: order.append("second"))
+        job3 = ScriptJob(_make_ctx(), lambda: order.append("third"))
+        pool.submit(job1)
+        pool.submit(job2)
+        pool.submit(job3)
+
+        self.assertFalse(job2.join(0.1))
+        self.assertEqual(1, pool.num_threads)
+
+        release.set()
+        self.assertTrue(job3.join(TIMEOUT))
+        self.assertEqual(["blocking", "second", "third"], order)
+        self.assertEqual(0, pool.num_pending_jobs)
+
+    def test_grows_when_busy(self):
+        """With no limit, a busy pool starts a new thread for a new job."""
+        pool = ScriptThreadPool()
+        release = threading.Event()
+
+        job1 = ScriptJob(_make_ctx(), lambda: release.wait(TIMEOUT))
+        job2 = ScriptJob(_make_ctx(), lambda: None)
+        pool.submit(job1)
+        pool.submit(job2)
+
+        self.assertTrue(job2.join(TIMEOUT))
+        release.set()
+        self.assertTrue(job1.join(TIMEOUT))
+        self.assertEqual(2, pool.num_threads)
+
+    def test_exceptions_do_not_kill_threads(self):
+        """An exception in a job is logged, and the thread is reused."""
+        pool = ScriptThreadPool(max_threads=1)
+
+        def raise_error():
+            raise RuntimeError("boom")
+
+        job1 = ScriptJob(_make_ctx(), raise_error)
+        job2 = ScriptJob(_make_ctx(), lambda: None)
+        pool.submit(job1)
+        pool.submit(job2)
+
+        self.assertTrue(job2.join(TIMEOUT))
+        self.assertIs(job1.thread, job2.thread)
@@ -16,6 +16,7 @@
 
 import os
 import sys
+import threading
 import time
 from typing import List
 from unittest.mock import patch
@@ -25,6 +26,7 @@ from tornado.testing import AsyncTestCase
 
 from streamlit import caching
 from streamlit.error_util import _GENERIC_UNCAUGHT_EXCEPTION_TEXT
+from streamlit.fragment import FragmentStorage
 from streamlit.proto.Alert_pb2 import Alert
 from streamlit.proto.ClientState_pb2 import ClientState
 from streamlit.proto.Delta_pb2 import Delta
@@ -70,6 +72,33 @@ class ScriptRunnerTest(AsyncTestCase):
         self._assert_events(scriptrunner, [ScriptRunnerEvent.SHUTDOWN])
         self._assert_text_deltas(scriptrunner, [])
 
+    def test_is_in_script_thread_after_shutdown(self):
+        """A finished ScriptRunner doesn't claim its pool thread, which may
+        be running another session's job."""
+        from streamlit.script_thread_pool import ScriptJob, get_script_thread_pool
+
+        scriptrunner = TestScriptRunner("good_script.py")
+        scriptrunner.start()
+        scriptrunner.join()
+
+        results = []
+        job = ScriptJob(
+            scriptrunner._script_job.ctx,
+            lambda: results.append(
+                (
+                    scriptrunner._script_job.thread is threading.current_thread(),
+                    scriptrunner._is_in_script_thread(),
+                )
+            ),
+        )
+        get_script_thread_pool().submit(job)
+        job.join()
+
+        # Idle pool threads are reused, so the job may or may not run on the
+        # old thread, but the runner never claims it.
+        self.assertEqual(1, len(results))
+        self.assertFalse(results[0][1])
+
     @parameterized.expand(
         [
             ("good_script.py", text_utf),
@@ -329,6 +358,60 @@ class ScriptRunnerTest(AsyncTestCase):
         )
         self._assert_text_deltas(scriptrunner, ["loop_forever"])
 
+    @parameterized.expand(
+        [
+            (ScriptRequest.STOP, [ScriptRunnerEvent.SCRIPT_STOPPED_WITH_SUCCESS]),
+            (
+                ScriptRequest.RERUN,
+                [
+                    ScriptRunnerEvent.SCRIPT_STOPPED_WITH_SUCCESS,
+                    ScriptRunnerEvent.SCRIPT_STARTED,
+                    ScriptRunnerEvent.SCRIPT_STOPPED_WITH_SUCCESS,
+                ],
+            ),
+        ]
+    )
+    def test_interrupt_pure_python_loop(self, request, events):
+        """Tests that request_interrupt stops a script that never calls
+        Streamlit, without a tracer."""
+        scriptrunner = TestScriptRunner("pure_python_loop.py")
+        scriptrunner.enqueue_rerun()
+        scriptrunner.start()
+        require_text_deltas(scriptrunner, ["looping"])
+
+        scriptrunner.script_request_queue.enqueue(request, RerunData())
+        scriptrunner.request_interrupt()
+
+        if request == ScriptRequest.RERUN:
+            require_text_deltas(scriptrunner, ["looping"])
+            scriptrunner.enqueue_stop()
+            scriptrunner.request_interrupt()
+
+        self.assertTrue(scriptrunner.join(timeout=5))
+        self._assert_no_exceptions(scriptrunner)
+        self._assert_events(
+            scriptrunner,
+            [ScriptRunnerEvent.SCRIPT_STARTED] + events + [ScriptRunnerEvent.SHUTDOWN],
+        )
+
+    @testutil.patch_config_options({"runner.asyncInterrupt": False})
+    def test_interrupt_disabled(self):
+        """Tests that request_interrupt does nothing when disabled."""
+        scriptrunner = TestScriptRunner("pure_python_loop.py")
+        scriptrunner.enqueue_rerun()
+        scriptrunner.start()
+        require_text_deltas(scriptrunner, ["looping"])
+
+        scriptrunner.enqueue_stop()
+        scriptrunner.request_interrupt()
+        self.assertFalse(scriptrunner.join(timeout=0.5))
+        self.assertEqual([ScriptRunnerEvent.SCRIPT_STARTED], scriptrunner.events)
+
+        # Stop the script for real, so the thread doesn't spin forever.
+        with testutil.patch_config_options({"runner.asyncInterrupt": True}):
+            scriptrunner.request_interrupt()
+        self.assertTrue(scriptrunner.join(timeout=5))
+
     def test_widgets(self):
         """Tests that widget values behave as expected."""
         scriptrunner = TestScriptRunner("widgets_script.py")
@@ -416,6 +499,78 @@ class ScriptRunnerTest(AsyncTestCase):
         # culled it. Ensure widget cache no longer holds our widget ID.
         self.assertIsNone(scriptrunner._session_state.get(widget_id, None))
 
+    def _run_fragment_script(self, session_state, fragment_storage, states=None):
+        scriptrunner = TestScriptRunner(
+            "fragment_script.py",
+            session_state=session_state,
+            fragment_storage=fragment_storage,
+        )
+        scriptrunner.enqueue_rerun(widget_states=states)
+        scriptrunner.start()
+        scriptrunner.join()
+        self._assert_no_exceptions(scriptrunner)
+        return scriptrunner
+
+    def _fragment_widget_states(self, scriptrunner, fragment, leaky, outside):
+        states = WidgetStates()
+        for label, value in [
+            ("fragment checkbox", fragment),
+            ("leaky checkbox", leaky),
+            ("outside checkbox", outside),
+        ]:
+            widget_id = scriptrunner.get_widget_id("checkbox", label)
+            _create_widget(widget_id, states).bool_value = value
+        return states
+
+    def test_rerun_fragment(self):
+        """Tests that a widget change in a fragment reruns only the fragment."""
+        session_state = SessionState()
+        fragment_storage = FragmentStorage()
+
+        scriptrunner = self._run_fragment_script(session_state, fragment_storage)
+        self._assert_text_deltas(
+            scriptrunner, ["before", "fragment False", "leaky False", "after"]
+        )
+        self.assertEqual(1, session_state["full_runs"])
+
+        # Only the fragment reruns. The rest of the last run is resent
+        # first, as it was.
+        states = self._fragment_widget_states(scriptrunner, True, False, False)
+        scriptrunner = self._run_fragment_script(
+            session_state, fragment_storage, states
+        )
+        self._assert_text_deltas(
+            scriptrunner, ["before", "leaky False", "after", "fragment True"]
+        )
+        self.assertEqual(1, session_state["full_runs"])
+        self.assertIs(False, session_state["outside"])
+
+        # A change outside of the fragment reruns the whole script.
+        states = self._fragment_widget_states(scriptrunner, True, False, True)
+        scriptrunner = self._run_fragment_script(
+            session_state, fragment_storage, states
+        )
+        self._assert_text_deltas(
+            scriptrunner, ["before", "fragment True", "leaky False", "after"]
+        )
+        self.assertEqual(2, session_state["full_runs"])
+
+    def test_rerun_fragment_that_writes_outside(self):
+        """Tests that a fragment that writes outside its container reruns the
+        whole script."""
+        session_state = SessionState()
+        fragment_storage = FragmentStorage()
+
+        scriptrunner = self._run_fragment_script(session_state, fragment_storage)
+        states = self._fragment_widget_states(scriptrunner, False, True, False)
+        scriptrunner = self._run_fragment_script(
+            session_state, fragment_storage, states
+        )
+        self._assert_text_deltas(
+            scriptrunner, ["before", "fragment False", "leaky True", "after"]
+        )
+        self.assertEqual(2, session_state["full_runs"])
+
     # TODO re-enable after flakyness is fixed
     def off_test_multiple_scriptrunners(self):
         """Tests that multiple scriptrunners can run simultaneously."""
@@ -596,7 +751,7 @@ class ScriptRunnerTest(AsyncTestCase):
 class TestScriptRunner(ScriptRunner):
     """Subclasses ScriptRunner to provide some testing features."""
 
-    def __init__(self, script_name):
+    def __init__(self, script_name, session_state=None, fragment_storage=None):
         """Initializes the ScriptRunner for the given script_name"""
         # DeltaGenerator deltas will be enqueued into self.report_queue.
         self.report_queue = ReportQueue()
@@ -605,6 +760,9 @@ class TestScriptRunner(ScriptRunner):
             self.report_queue.enqueue(msg)
             self.maybe_handle_execution_control_request()
 
+        if session_state is None:
+            session_state = SessionState()
+
         self.script_request_queue = ScriptRequestQueue()
         script_path = os.path.join(os.path.dirname(__file__), "test_data", script_name)
 
@@ -613,8 +771,9 @@ class TestScriptRunner(ScriptRunner):
             report=Report(script_path, "test command line"),
             enqueue_forward_msg=enqueue_fn,
             client_state=ClientState(),
-            session_state=SessionState(),
+            session_state=session_state,
             request_queue=self.script_request_queue,
+            fragment_storage=fragment_storage,
         )
 
         # Accumulates uncaught exceptions thrown by our run thread.
@@ -649,10 +808,14 @@ class TestScriptRunner(ScriptRunner):
         self.report_queue.clear()
         super(TestScriptRunner, self)._run_script(rerun_data)
 
-    def join(self):
-        """Joins the run thread, if it was started"""
-        if self._script_thread is not None:
-            self._script_thread.join()
+    def join(self, timeout=None):
+        """Waits for the script job to finish, if it was started.
+
+        Returns False if the timeout elapsed first.
+        """
+        if self._script_job is not None:
+            return self._script_job.join(timeout)
+        return True
 
     def clear_deltas(self):
         """Clear all delta messages from our ReportQueue"""
@@ -685,6 +848,22 @@ class TestScriptRunner(ScriptRunner):
         return None
 
 
+def require_text_deltas(
+    runner: TestScriptRunner, text_deltas: List[str], timeout: float = 5
+) -> None:
+    """Wait for the given ScriptRunner to produce the given text deltas."""
+    t0 = time.time()
+    while time.time() - t0 < timeout:
+        if runner.text_deltas() == text_deltas:
+            return
+        time.sleep(0.01)
+    raise RuntimeError(
+        "require_text_deltas() timed out after {}s: {}".format(
+            timeout, runner.text_deltas()
+        )
+    )
+
+
 def require_widgets_deltas(
     runners: List[TestScriptRunner], timeout: float = 15
 ) -> None:
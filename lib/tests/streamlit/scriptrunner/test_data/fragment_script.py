@@ -0,0 +1,41 @@
+# Copyright 2018-2021 Streamlit Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A script for ScriptRunnerTest that uses fragments"""
+
+import streamlit as st
+
+if "full_runs" not in st.session_state:
+    st.session_state.full_runs = 0
+st.session_state.full_runs += 1
+
+st.text("before")
+
+
+@st.experimental_fragment
+def fragment():
+    value = st.checkbox("fragment checkbox")
+    st.text("fragment %s" % value)
+
+
+@st.experimental_fragment
+def leaky_fragment():
+    value = st.checkbox("leaky checkbox")
+    st.sidebar.text("leaky %s" % value)
+
+
+fragment()
+leaky_fragment()
+st.checkbox("outside checkbox", key="outside")
+st.text("after")
@@ -18,6 +18,8 @@ from unittest import mock
 from unittest.mock import MagicMock, patch
 import unittest
 
+import pandas as pd
+import pyarrow as pa
 import pytest
 import tornado.testing
 import tornado.web
@@ -27,6 +29,7 @@ from tornado import gen
 
 import streamlit.server.server
 from streamlit import config, RootContainer
+from streamlit.arrow_table_manager import arrow_table_manager
 from streamlit.cursor import make_delta_path
 from streamlit.report_session import ReportSession
 from streamlit.uploaded_file_manager import UploadedFileRec
@@ -38,6 +41,7 @@ from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
 from streamlit.server.server import State
 from streamlit.server.server import start_listening
 from streamlit.server.server import RetriesExceeded
+from streamlit.server.routes import ArrowTableHandler
 from streamlit.server.routes import DebugHandler
 from streamlit.server.routes import HealthHandler
 from streamlit.server.routes import MessageCacheHandler
@@ -45,6 +49,8 @@ from streamlit.server.routes import MetricsHandler
 from streamlit.server.server_util import is_cacheable_msg
 from streamlit.server.server_util import is_url_from_allowed_origins
 from streamlit.server.server_util import serialize_forward_msg
+from streamlit.type_util import bytes_to_data_frame
+from tests import testutil
 from tests.server_test_case import ServerTestCase
 
 from streamlit.logger import get_logger
@@ -271,6 +277,54 @@ class ServerTest(ServerTestCase):
             # And the same *metadata* as msg2:
             self.assertEqual(msg2.metadata, cached.metadata)
 
+    @tornado.testing.gen_test
+    def test_unchanged_element_caching(self):
+        """Test that small elements are sent as references once they've
+        been sent unchanged in two consecutive runs."""
+        with self._patch_report_session():
+            yield self.start_server_loop()
+            ws_client = yield self.ws_connect()
+
+            session_info = list(self.server._session_info_by_id.values())[0]
+
+            def new_report_msg():
+                msg = ForwardMsg()
+                msg.new_report.report_id = "report_id"
+                return msg
+
+            @gen.coroutine
+            def send_run(df):
+                self.server._send_message(session_info, new_report_msg())
+                yield self.read_forward_msg(ws_client)
+                msg = _create_dataframe_msg(df)
+                self.server._send_message(session_info, msg)
+                received = yield self.read_forward_msg(ws_client)
+                return msg, received
+
+            # These messages are smaller than global.minCachedMessageSize.
+            df = list(range(10))
+
+            # The first time an element is sent, it's not cacheable.
+            msg, received = yield send_run(df)
+            self.assertFalse(msg.metadata.cacheable)
+            self.assertEqual("delta", received.WhichOneof("type"))
+
+            # If it's unchanged on the next run, the client caches it.
+            msg, received = yield send_run(df)
+            self.assertTrue(msg.metadata.cacheable)
+            self.assertEqual("delta", received.WhichOneof("type"))
+            self.assertTrue(received.metadata.cacheable)
+
+            # And from then on, we just send a reference.
+            msg, received = yield send_run(df)
+            self.assertEqual("ref_hash", received.WhichOneof("type"))
+            self.assertEqual(msg.hash, received.ref_hash)
+
+            # A changed element is sent in full, and isn't cacheable.
+            msg, received = yield send_run(list(range(1, 11)))
+            self.assertFalse(msg.metadata.cacheable)
+            self.assertEqual("delta", received.WhichOneof("type"))
+
     @tornado.testing.gen_test
     def test_cache_clearing(self):
         """Test that report_run_count is incremented when a report
@@ -352,6 +406,51 @@ class ServerTest(ServerTestCase):
                 [],
             )
 
+    @tornado.testing.gen_test
+    def test_preheated_session_pool(self):
+        """New browsers are handed finished preheated sessions, which are
+        replaced in the background."""
+        with self._patch_report_session(), testutil.patch_config_options(
+            {"server.preheatedSessions": 2}
+        ), patch.object(streamlit.server.server, "_PREHEAT_INTERVAL_SECS", 0):
+            yield self.start_server_loop()
+            self.server.add_preheated_report_session()
+
+            def preheated_sessions():
+                return [
+                    self.server._session_info_by_id[session_id].session
+                    for session_id in self.server._preheated_session_ids
+                ]
+
+            # The pool isn't refilled while a preheated run is in progress.
+            session1 = preheated_sessions()[0]
+            session1.handle_rerun_script_request.assert_called_once_with(
+                is_preheat=True
+            )
+            session1.is_script_running = True
+            yield gen.sleep(0.05)
+            self.assertEqual([session1], preheated_sessions())
+
+            session1.is_script_running = False
+            yield gen.sleep(0.05)
+            self.assertEqual(2, len(preheated_sessions()))
+            session2 = preheated_sessions()[1]
+            session2.is_script_running = True
+
+            # The finished session is handed out first, even though it's
+            # not the oldest one.
+            self.server._preheated_session_ids.reverse()
+            ws_client = yield self.ws_connect()
+            self.assertTrue(self.server.browser_is_connected)
+            self.assertEqual([session2], preheated_sessions())
+            self.assertIsNotNone(self.server._session_info_by_id[session1.id].ws)
+
+            # Preheated sessions don't count as connected browsers.
+            ws_client.close()
+            yield gen.sleep(0.1)
+            self.assertFalse(self.server.browser_is_connected)
+            session1.shutdown.assert_called_once()
+
 
 class ServerUtilsTest(unittest.TestCase):
     def test_is_url_from_allowed_origins_allowed_domains(self):
@@ -572,6 +671,24 @@ class DebugHandlerTest(tornado.testing.AsyncHTTPTestCase):
         pass
 
 
+class ArrowTableHandlerTest(tornado.testing.AsyncHTTPTestCase):
+    def get_app(self):
+        return tornado.web.Application([(r"/dataframe/(.*)", ArrowTableHandler)])
+
+    def test_arrow_table(self):
+        df = pd.DataFrame({"col1": range(10)})
+        table_id = arrow_table_manager.add(pa.Table.from_pandas(df), "1.(2).3")
+        self.addCleanup(arrow_table_manager.clear_session_tables)
+
+        response = self.fetch("/dataframe/%s?start=2&end=4" % table_id)
+        self.assertEqual(200, response.code)
+        self.assertEqual([2, 3], bytes_to_data_frame(response.body)["col1"].tolist())
+
+        self.assertEqual(400, self.fetch("/dataframe/%s" % table_id).code)
+        self.assertEqual(400, self.fetch("/dataframe/%s?start=a&end=4" % table_id).code)
+        self.assertEqual(404, self.fetch("/dataframe/non_existent?start=0&end=1").code)
+
+
 class MessageCacheHandlerTest(tornado.testing.AsyncHTTPTestCase):
     def get_app(self):
         self._cache = ForwardMsgCache()
@@ -43,6 +43,7 @@ from streamlit.media_file_manager import _calculate_file_id
 from streamlit.media_file_manager import STATIC_MEDIA_ENDPOINT
 
 from tests import testutil
+from tests.testutil import patch_config_options
 
 
 def get_version():
@@ -144,12 +145,12 @@ class StreamlitAPITest(testutil.DeltaGeneratorTestCase):
         self.assertEqual(chart_spec["height"], 480)
         self.assertEqual(
             el.datasets[0].data.columns.plain_index.data.strings.data,
-            ["index", "variable", "value"],
+            ["index", "a", "b", "c"],
         )
 
         data = json.loads(json_format.MessageToJson(el.datasets[0].data.data))
         result = [x["int64s"]["data"] for x in data["cols"] if "int64s" in x]
-        self.assertEqual(result[1], ["10", "20", "30"])
+        self.assertEqual(result[1:], [["10"], ["20"], ["30"]])
 
     def test_st_audio(self):
         """Test st.audio."""
@@ -244,13 +245,13 @@ class StreamlitAPITest(testutil.DeltaGeneratorTestCase):
         self.assertEqual(chart_spec["height"], 480)
         self.assertEqual(
             el.datasets[0].data.columns.plain_index.data.strings.data,
-            ["index", "variable", "value"],
+            ["index", "a", "b", "c"],
         )
 
         data = json.loads(json_format.MessageToJson(el.datasets[0].data.data))
         result = [x["int64s"]["data"] for x in data["cols"] if "int64s" in x]
 
-        self.assertEqual(result[1], ["10", "20", "30"])
+        self.assertEqual(result[1:], [["10"], ["20"], ["30"]])
 
     def test_st_code(self):
         """Test st.code."""
@@ -465,13 +466,13 @@ class StreamlitAPITest(testutil.DeltaGeneratorTestCase):
 
         self.assertEqual(
             el.datasets[0].data.columns.plain_index.data.strings.data,
-            ["index", "variable", "value"],
+            ["index", "a", "b", "c"],
         )
 
         data = json.loads(json_format.MessageToJson(el.datasets[0].data.data))
         result = [x["int64s"]["data"] for x in data["cols"] if "int64s" in x]
 
-        self.assertEqual(result[1], ["10", "20", "30"])
+        self.assertEqual(result[1:], [["10"], ["20"], ["30"]])
 
     def test_st_markdown(self):
         """Test st.markdown."""
@@ -522,6 +523,13 @@ class StreamlitAPITest(testutil.DeltaGeneratorTestCase):
         self.assertEqual(el.imgs.width, -2)
         self.assertEqual(el.imgs.imgs[0].caption, "")
         self.assertTrue(el.imgs.imgs[0].url.startswith(STATIC_MEDIA_ENDPOINT))
+        self.assertTrue(el.imgs.imgs[0].url.endswith(".webp"))
+
+        with patch_config_options({"client.imageFormat": "PNG"}):
+            st.pyplot(fig)
+
+        el = self.get_delta_from_queue().new_element
+        self.assertTrue(el.imgs.imgs[0].url.endswith(".png"))
 
     def test_st_pyplot_clear_figure(self):
         """st.pyplot should clear the passed-in figure."""
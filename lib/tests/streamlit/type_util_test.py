@@ -16,10 +16,14 @@ import unittest
 from collections import namedtuple
 from unittest.mock import patch
 
+import pandas as pd
 import plotly.graph_objs as go
 
+import streamlit as st
+from streamlit import caching
 from streamlit import type_util
 from streamlit.type_util import is_bytes_like, to_bytes
+from tests.testutil import patch_config_options
 
 
 class TypeUtilTest(unittest.TestCase):
@@ -88,3 +92,100 @@ class TypeUtilTest(unittest.TestCase):
         self.assertFalse(is_bytes_like(string_obj))
         with self.assertRaises(RuntimeError):
             to_bytes(string_obj)
+
+    def test_data_frame_to_bytes_cached(self):
+        """The bytes of dataframes returned by st.cache are reused."""
+        self.addCleanup(caching.clear_cache)
+        self.addCleanup(type_util.arrow_bytes_cache.clear)
+
+        @st.cache
+        def get_df():
+            return pd.DataFrame({"a": [1, 2, 3]})
+
+        df = get_df()
+        data = type_util.data_frame_to_bytes(df)
+        with patch(
+            "streamlit.type_util.pyarrow_table_to_bytes", return_value=b""
+        ) as table_to_bytes:
+            self.assertIs(data, type_util.data_frame_to_bytes(get_df()))
+            table_to_bytes.assert_not_called()
+
+            # Dataframes that don't come from st.cache are serialized again.
+            type_util.data_frame_to_bytes(df.copy())
+            table_to_bytes.assert_called_once()
+
+    @patch_config_options({"global.maxArrowCacheSize": 0})
+    def test_data_frame_to_bytes_cache_disabled(self):
+        self.addCleanup(caching.clear_cache)
+        self.addCleanup(type_util.arrow_bytes_cache.clear)
+        type_util.arrow_bytes_cache.clear()
+
+        @st.cache
+        def get_df():
+            return pd.DataFrame({"a": [1, 2, 3]})
+
+        data = type_util.data_frame_to_bytes(get_df())
+        self.assertIsNot(data, type_util.data_frame_to_bytes(get_df()))
+
+    def test_dictionary_encode_strings(self):
+        """Low-cardinality string columns are dictionary-encoded, and read
+        back as strings."""
+        import pyarrow as pa
+
+        df = pd.DataFrame(
+            {
+                "low": ["a", "b"] * 1000,
+                "high": [str(i) for i in range(2000)],
+                "category": pd.Categorical(["c", "d"] * 1000),
+                "number": range(2000),
+            }
+        )
+        table = type_util.dictionary_encode_strings(pa.Table.from_pandas(df))
+        self.assertTrue(pa.types.is_dictionary(table.schema.field("low").type))
+        self.assertTrue(pa.types.is_string(table.schema.field("high").type))
+
+        data = type_util.data_frame_to_bytes(df)
+        pd.testing.assert_frame_equal(type_util.bytes_to_data_frame(data), df)
+
+    def test_dictionary_encode_strings_small_table(self):
+        """Tables with few rows aren't dictionary-encoded."""
+        import pyarrow as pa
+
+        table = pa.Table.from_pandas(pd.DataFrame({"low": ["a", "b"] * 10}))
+        self.assertIs(table, type_util.dictionary_encode_strings(table))
+
+    def test_convert_arrow_compatible_to_table(self):
+        """Arrow data gets pandas metadata, so that it's read like a
+        DataFrame with a RangeIndex."""
+        import pyarrow as pa
+
+        table = pa.table({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+        expected = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+        self.assertTrue(type_util.is_arrow_compatible(table))
+
+        converted = type_util.convert_arrow_compatible_to_table(table)
+        self.assertIsNotNone(converted.schema.pandas_metadata)
+        pd.testing.assert_frame_equal(converted.to_pandas(), expected)
+
+        batch = table.to_batches()[0]
+        self.assertTrue(type_util.is_arrow_compatible(batch))
+        pd.testing.assert_frame_equal(type_util.convert_anything_to_df(batch), expected)
+
+    def test_convert_arrow_compatible_to_table_from_pandas(self):
+        """The pandas metadata of tables created from DataFrames is kept, and
+        their RangeIndex is updated if they were sliced."""
+        import pyarrow as pa
+
+        df = pd.DataFrame({"a": [1, 2, 3]}, index=["x", "y", "z"])
+        converted = type_util.convert_arrow_compatible_to_table(
+            pa.Table.from_pandas(df)
+        )
+        pd.testing.assert_frame_equal(converted.to_pandas(), df)
+
+        table = pa.Table.from_pandas(pd.DataFrame({"a": [1, 2, 3]})).slice(1)
+        converted = type_util.convert_arrow_compatible_to_table(table)
+        self.assertEqual(2, len(converted.to_pandas().index))
+
+    def test_pandas_is_not_arrow_compatible(self):
+        self.assertFalse(type_util.is_arrow_compatible(pd.DataFrame()))
+        self.assertFalse(type_util.is_arrow_compatible([1, 2, 3]))
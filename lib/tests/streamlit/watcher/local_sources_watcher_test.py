@@ -281,6 +281,14 @@ class LocalSourcesWatcherTest(unittest.TestCase):
 
         del sys.modules["tests.streamlit.watcher.test_data.namespace_package"]
 
+    @patch("streamlit.watcher.local_sources_watcher.script_cache")
+    @patch("streamlit.watcher.local_sources_watcher.FileWatcher")
+    def test_script_change_invalidates_script_cache(self, fob, script_cache, _):
+        lsw = local_sources_watcher.LocalSourcesWatcher(REPORT, NOOP_CALLBACK)
+        lsw.on_file_changed(REPORT_PATH)
+
+        script_cache.invalidate.assert_called_once_with(REPORT_PATH)
+
 
 def sort_args_list(args_list):
     return sorted(args_list, key=lambda args: args[0])
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+# Copyright 2018-2021 Streamlit Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Times the legacy DataFrame serialization (global.dataFrameSerialization =
+'legacy') of single-column DataFrames, for each column dtype and a range of
+row counts.
+
+Usage: python scripts/benchmark_legacy_data_frame.py [--rows 1000,1000000]
+"""
+
+import timeit
+
+import click
+import numpy as np
+import pandas as pd
+
+from streamlit.elements import legacy_data_frame
+from streamlit.proto.DataFrame_pb2 import DataFrame as DataFrameProto
+
+
+def _make_column(dtype, num_rows):
+    rng = np.random.default_rng(0)
+    if dtype == "float64":
+        return rng.standard_normal(num_rows)
+    if dtype == "int64":
+        return rng.integers(0, 1_000_000, num_rows)
+    if dtype == "bool":
+        return rng.integers(0, 2, num_rows).astype(bool)
+    if dtype == "object":
+        return rng.integers(0, 1000, num_rows).astype(str).astype(object)
+    if dtype == "timedelta64":
+        return pd.to_timedelta(rng.integers(0, 10 ** 9, num_rows))
+    if dtype == "datetime64":
+        return pd.date_range("2021-01-01", periods=num_rows, freq="s")
+    if dtype == "datetime64 tz":
+        return pd.date_range("2021-01-01", periods=num_rows, freq="s", tz="UTC")
+    raise ValueError(dtype)
+
+
+DTYPES = [
+    "float64",
+    "int64",
+    "bool",
+    "object",
+    "timedelta64",
+    "datetime64",
+    "datetime64 tz",
+]
+
+
+@click.command()
+@click.option(
+    "--rows",
+    default="1000,100000,1000000",
+    help="Comma-separated row counts to time.",
+)
+@click.option("--repeat", default=3, help="Number of timings to take the best of.")
+def main(rows, repeat):
+    row_counts = [int(r) for r in rows.split(",")]
+    click.echo("%-15s" % "dtype" + "".join("%12s" % r for r in row_counts))
+
+    for dtype in DTYPES:
+        timings = []
+        for num_rows in row_counts:
+            df = pd.DataFrame({"col": _make_column(dtype, num_rows)})
+            seconds = min(
+                timeit.repeat(
+                    lambda: legacy_data_frame.marshall_data_frame(df, DataFrameProto()),
+                    number=1,
+                    repeat=repeat,
+                )
+            )
+            timings.append(seconds)
+        click.echo("%-15s" % dtype + "".join("%11.4fs" % t for t in timings))
+
+
+if __name__ == "__main__":
+    main()